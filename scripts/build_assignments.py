@@ -53,6 +53,17 @@ def _validate_overlaps(df: pd.DataFrame) -> None:
             prev_end = end
 
 
+def load_schedule(schedule_path: Path) -> pd.DataFrame:
+    """Read the succession schedule, check its columns, and attach ``wave_id``."""
+    df_schedule = pd.read_csv(schedule_path, comment="#")
+    validate_required_columns(
+        df_schedule,
+        ["crop", "variety", "plant_date", "succession_days", "row_feet", "water"],
+        "succession schedule",
+    )
+    return apply_wave_id(df_schedule)
+
+
 def build_assignments(
     assignments_path: Path,
     schedule_path: Path,
@@ -60,11 +71,24 @@ def build_assignments(
     schema_version: int,
 ) -> pd.DataFrame:
     config = _load_config(config_path, schema_version)
+    df_assignments = pd.read_csv(assignments_path, comment="#")
+    return validate_assignments(df_assignments, load_schedule(schedule_path), config)
+
+
+def validate_assignments(
+    df_assignments: pd.DataFrame,
+    df_schedule: pd.DataFrame,
+    config: dict,
+) -> pd.DataFrame:
+    """Validate a raw assignments frame against a loaded schedule and geometry.
+
+    ``df_schedule`` comes from ``load_schedule``, so callers checking many
+    plans against one schedule read and wave-id it only once.
+    """
     bed_count = int(config["bed_count"])
     bed_length_ft = int(config["bed_length_ft"])
     block_size_ft = int(config["block_size_ft"])
 
-    df_assignments = pd.read_csv(assignments_path, comment="#")
     if df_assignments.empty:
         raise ValueError("bed assignments is empty")
 
@@ -83,7 +107,6 @@ def build_assignments(
         if invalid_bed_id.any():
             raise ValueError("bed assignments has non-numeric bed_id values")
     df_assignments["bed_id"] = bed_id_num
-    df_schedule = pd.read_csv(schedule_path, comment="#")
 
     if "status" not in df_assignments.columns:
         df_assignments["status"] = "CROP"
@@ -112,12 +135,6 @@ def build_assignments(
         ["crop", "variety", "wave_id", "plant_date"],
         "bed assignments (crop rows)",
     )
-    validate_required_columns(
-        df_schedule,
-        ["crop", "variety", "plant_date", "succession_days", "row_feet", "water"],
-        "succession schedule",
-    )
-    df_schedule = apply_wave_id(df_schedule)
     valid_waves = set(df_schedule["wave_id"].tolist())
 
     _validate_bounds(df_assignments, bed_count, bed_length_ft)
@@ -0,0 +1,410 @@
+#!/usr/bin/env -S uv run python
+"""Discover supplier product pages and diff them against the plant CSVs.
+
+Each supplier's sitemaps and category listing pages are crawled through the
+shared rate-limited async client, following sitemap indexes, subcategories,
+and pagination. Product links are canonicalized and deduplicated into a
+candidate catalog. Each candidate is marked ``new`` (not yet in any plant
+CSV), ``known``, or ``vanished`` (in a plant CSV but no longer listed).
+
+Performance notes:
+- A fixed pool of workers drains one crawl queue, so thousands of listing
+  pages run with bounded concurrency and per-host politeness
+- Listing pages go through the persistent HTTP cache as small link
+  fragments. A second run serves fresh pages from disk and revalidates stale
+  ones with conditional GETs, so unchanged listings cost a 304
+- The previous catalog is read back so ``first_seen`` survives across runs
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from urllib.parse import urljoin
+
+import pandas as pd
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scripts.io.http_cache import DAY_SECONDS, DEFAULT_CACHE_PATH, HttpCache, fetch_cached
+from scripts.io.http_client import AsyncFetcher, politeness_rate
+from scripts.io.urls import canonical_url, is_http_url, product_url
+from scripts.suppliers import SUPPLIERS
+from scripts.suppliers.base import HTML_PARSER
+
+DEFAULT_PLANTS = [
+    Path("data/plants/vegetable-data.csv"),
+    Path("data/plants/herb-data.csv"),
+    Path("data/plants/flower-data.csv"),
+]
+DEFAULT_OUTPUT = Path("data/plants/catalog-candidates.csv")
+
+# Bump when link extraction changes so cached listing fragments are refetched.
+DISCOVER_VERSION = 1
+
+CATALOG_COLUMNS = ["supplier", "url", "status", "first_seen", "last_seen", "source"]
+
+
+@dataclass(frozen=True)
+class SupplierSite:
+    """Where a supplier's crawl starts and how its URLs are told apart.
+
+    ``product`` and ``listing`` are matched against URL paths (with query);
+    links matching neither are ignored, as are links to other hosts.
+    """
+
+    supplier: str
+    seeds: tuple[str, ...]
+    product: re.Pattern[str]
+    listing: re.Pattern[str]
+
+
+SITES: dict[str, SupplierSite] = {
+    code: SupplierSite(code, supplier.seeds, supplier.product, supplier.listing)
+    for code, supplier in SUPPLIERS.items()
+    if supplier.seeds
+}
+
+
+def _path(url: str) -> str:
+    _, _, rest = url.partition("://")
+    _, slash, path = rest.partition("/")
+    return slash + path
+
+
+def _host(url: str) -> str:
+    return url.split("://", 1)[-1].split("/", 1)[0]
+
+
+def extract_links(text: str, base_url: str, site: SupplierSite) -> str:
+    """JSON ``{"products": [...], "follow": [...]}`` from a sitemap or listing page.
+
+    Sitemap indexes yield sitemaps to follow; ``<urlset>`` entries and HTML
+    anchors are sorted into product pages and same-host listing pages.
+    """
+    products: dict[str, None] = {}
+    follow: dict[str, None] = {}
+    host = _host(canonical_url(base_url))
+
+    def add(href: str, from_sitemap_index: bool = False) -> None:
+        url = canonical_url(urljoin(base_url, href.strip()))
+        if not is_http_url(url) or _host(url) != host:
+            return
+        path = _path(url)
+        if from_sitemap_index or url.endswith(".xml"):
+            follow[url] = None
+        elif site.product.match(path):
+            products[product_url(url)] = None
+        elif site.listing.match(path):
+            follow[url] = None
+
+    stripped = text.lstrip()
+    if stripped.startswith("<?xml") or stripped.startswith(("<urlset", "<sitemapindex")):
+        root = ET.fromstring(stripped.encode("utf-8"))
+        is_index = root.tag.endswith("sitemapindex")
+        for element in root.iter():
+            if element.tag.endswith("loc") and element.text:
+                add(element.text.strip(), from_sitemap_index=is_index)
+    else:
+        soup = BeautifulSoup(text, HTML_PARSER, parse_only=SoupStrainer(["a", "link"]))
+        for tag in soup.find_all(["a", "link"], href=True):
+            if tag.name == "link" and "next" not in (tag.get("rel") or []):
+                continue
+            add(tag["href"])
+
+    return json.dumps({"products": list(products), "follow": list(follow)})
+
+
+@dataclass
+class CrawlResult:
+    """Product URL -> (supplier, listing it was first seen on), plus crawl stats.
+
+    ``truncated`` holds suppliers with links left unvisited by ``max_pages``.
+    """
+
+    products: dict[str, tuple[str, str]] = field(default_factory=dict)
+    pages: int = 0
+    failures: dict[str, tuple[str, str]] = field(default_factory=dict)
+    truncated: set[str] = field(default_factory=set)
+
+    def failed_suppliers(self) -> set[str]:
+        return {supplier for supplier, _ in self.failures.values()}
+
+    def incomplete_suppliers(self) -> set[str]:
+        """Suppliers whose crawl may have missed products (failed or truncated)."""
+        return self.failed_suppliers() | self.truncated
+
+
+async def crawl(
+    sites: list[SupplierSite],
+    cache: HttpCache | None = None,
+    max_in_flight: int = 10,
+    rate: float = 5.0,
+    max_pages: int = 5000,
+) -> CrawlResult:
+    """Crawl every site from its seeds, following sitemaps and listing pages.
+
+    ``max_in_flight`` workers share one queue, and at most ``max_pages``
+    pages are visited in total. A page that fails after retries is recorded
+    in ``failures`` and the crawl carries on.
+    """
+    queue: asyncio.Queue[tuple[SupplierSite, str]] = asyncio.Queue()
+    seen: set[str] = set()
+    result = CrawlResult()
+
+    def enqueue(site: SupplierSite, url: str) -> None:
+        if url in seen:
+            return
+        if len(seen) >= max_pages:
+            result.truncated.add(site.supplier)
+            return
+        seen.add(url)
+        queue.put_nowait((site, url))
+
+    for site in sites:
+        for seed in site.seeds:
+            enqueue(site, canonical_url(seed))
+
+    async with AsyncFetcher(rate=rate, burst=max_in_flight, max_connections=max_in_flight) as fetcher:
+
+        async def worker() -> None:
+            while True:
+                site, url = await queue.get()
+                try:
+                    fragment = json.loads(
+                        await fetch_cached(
+                            fetcher,
+                            cache,
+                            url,
+                            ttl_key=site.supplier,
+                            transform=partial(extract_links, base_url=url, site=site),
+                            key=f"{url}#discover-v{DISCOVER_VERSION}",
+                        )
+                    )
+                    for product in fragment["products"]:
+                        result.products.setdefault(product, (site.supplier, url))
+                    for link in fragment["follow"]:
+                        enqueue(site, link)
+                except Exception as exc:
+                    result.failures[url] = (site.supplier, str(exc))
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_in_flight)]
+        await queue.join()
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    result.pages = len(seen)
+    return result
+
+
+def known_urls(plant_paths: list[Path]) -> dict[str, tuple[str, str]]:
+    """Canonical product URL -> (supplier, plant CSV) for every row with a URL."""
+    known: dict[str, tuple[str, str]] = {}
+    for path in plant_paths:
+        df = pd.read_csv(path)
+        if "url" not in df.columns:
+            continue
+        for _, row in df.iterrows():
+            if is_http_url(row["url"]):
+                supplier = str(row.get("supplier", "")).strip().upper()
+                known.setdefault(product_url(row["url"]), (supplier, str(path)))
+    return known
+
+
+def build_catalog(
+    result: CrawlResult,
+    known: dict[str, tuple[str, str]],
+    crawled: list[str],
+    previous: pd.DataFrame | None = None,
+    today: str | None = None,
+) -> pd.DataFrame:
+    """Diff discovered products against ``known`` plant URLs.
+
+    Known URLs of a crawled supplier that were not discovered are marked
+    ``vanished``, unless some of that supplier's pages failed or the crawl
+    stopped at ``max_pages`` before visiting them all, in which case the
+    missing products may only be unreached. ``first_seen`` and
+    ``last_seen`` carry over from the ``previous`` catalog.
+    """
+    today = today or pd.Timestamp.now().date().isoformat()
+    history: dict[str, tuple[str, str]] = {}
+    if previous is not None:
+        previous = previous.fillna("")
+        history = {
+            url: (str(first), str(last))
+            for url, first, last in zip(previous["url"], previous["first_seen"], previous["last_seen"])
+        }
+    incomplete = result.incomplete_suppliers()
+
+    rows = []
+    for url, (supplier, source) in sorted(result.products.items()):
+        first_seen = history.get(url, ("", ""))[0] or today
+        status = "known" if url in known else "new"
+        rows.append([supplier, url, status, first_seen, today, source])
+    for url, (supplier, source) in sorted(known.items()):
+        if url in result.products or supplier not in crawled or supplier in incomplete:
+            continue
+        first_seen, last_seen = history.get(url, ("", ""))
+        rows.append([supplier, url, "vanished", first_seen, last_seen, source])
+    return pd.DataFrame(rows, columns=CATALOG_COLUMNS)
+
+
+def discover_catalog(
+    plant_paths: list[Path],
+    output_path: Path,
+    sites: list[SupplierSite],
+    cache: HttpCache | None = None,
+    batch_size: int = 10,
+    batch_delay: float = 2.0,
+    max_pages: int = 5000,
+) -> pd.DataFrame:
+    """Crawl ``sites``, diff against ``plant_paths``, and write the catalog."""
+    rate = politeness_rate(batch_size, batch_delay)
+    print(f"Crawling {', '.join(site.supplier for site in sites)} ({batch_size} in flight, {rate:g} requests/s per host)...")
+    result = asyncio.run(crawl(sites, cache, batch_size, rate, max_pages))
+    print(f"Visited {result.pages} pages, found {len(result.products)} products")
+    for supplier in sorted(result.truncated):
+        print(f"⚠️  Stopped at --max-pages {max_pages}; skipping vanished check for {supplier}")
+    for url, (supplier, error) in sorted(result.failures.items()):
+        print(f"⚠️  {supplier} page failed, skipping vanished check for {supplier}: {url} ({error})")
+    if cache is not None:
+        print(
+            f"Cache: {cache.hits} fresh, {cache.revalidated} revalidated (304), "
+            f"{cache.misses} downloaded"
+        )
+
+    previous = pd.read_csv(output_path, dtype=str) if output_path.exists() else None
+    catalog = build_catalog(
+        result,
+        known_urls(plant_paths),
+        [site.supplier for site in sites],
+        previous,
+    )
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    catalog.to_csv(output_path, index=False)
+
+    counts = catalog["status"].value_counts()
+    print(
+        f"{counts.get('new', 0)} new, {counts.get('known', 0)} known, "
+        f"{counts.get('vanished', 0)} vanished"
+    )
+    print(f"Saved catalog to {output_path}")
+    return catalog
+
+
+def parse_seeds(values: list[str]) -> dict[str, list[str]]:
+    """``["SDSC=https://..."]`` -> supplier -> seed URLs."""
+    seeds: dict[str, list[str]] = {}
+    for value in values:
+        supplier, sep, url = value.partition("=")
+        if not sep or not is_http_url(url):
+            raise ValueError(f"Expected SUPPLIER=URL, got {value!r}")
+        seeds.setdefault(supplier.strip().upper(), []).append(url.strip())
+    return seeds
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "--plants",
+        type=Path,
+        action="append",
+        default=None,
+        help="Plant CSV whose url column is diffed against (repeatable; default: vegetable, herb, flower)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=DEFAULT_OUTPUT,
+        help=f"Candidate catalog CSV, also read back for first_seen (default: {DEFAULT_OUTPUT})",
+    )
+    parser.add_argument(
+        "--supplier",
+        action="append",
+        default=None,
+        choices=sorted(SITES),
+        help="Only crawl this supplier (repeatable; default: all)",
+    )
+    parser.add_argument(
+        "--seed",
+        action="append",
+        default=[],
+        metavar="SUPPLIER=URL",
+        help="Start the supplier's crawl here instead of its default seeds (repeatable)",
+    )
+    parser.add_argument(
+        "--max-pages",
+        type=int,
+        default=5000,
+        help="Stop following links after this many pages (default: 5000)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=10,
+        help="Max pages in flight, and the per-host request burst (default: 10)",
+    )
+    parser.add_argument(
+        "--batch-delay",
+        type=float,
+        default=2.0,
+        help="Seconds for a host to earn back a full burst; 0 disables rate limiting (default: 2.0)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Fetch every page instead of reusing and revalidating cached listings",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"SQLite cache file shared with the scraper (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=1.0,
+        help="Days a cached listing is used without revalidating (default: 1)",
+    )
+    args = parser.parse_args()
+
+    try:
+        seeds = parse_seeds(args.seed)
+        unknown = sorted(set(seeds) - set(SITES))
+        if unknown:
+            raise ValueError(f"Unknown supplier for --seed: {', '.join(unknown)}")
+        suppliers = args.supplier or sorted(SITES)
+        sites = [
+            replace(SITES[supplier], seeds=tuple(seeds[supplier])) if supplier in seeds else SITES[supplier]
+            for supplier in suppliers
+        ]
+        cache = None if args.no_cache else HttpCache(args.cache_path, default_ttl=args.cache_ttl_days * DAY_SECONDS)
+        try:
+            discover_catalog(
+                args.plants or DEFAULT_PLANTS,
+                args.output,
+                sites,
+                cache=cache,
+                batch_size=args.batch_size,
+                batch_delay=args.batch_delay,
+                max_pages=args.max_pages,
+            )
+        finally:
+            if cache is not None:
+                cache.close()
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
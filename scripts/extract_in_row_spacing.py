@@ -1,80 +1,66 @@
 #!/usr/bin/env -S uv run python
 """Extract in-row spacing from web_final_spacing using tnh-gen.
 
-This script processes the vegetable data CSV and uses an LLM to extract
-numeric in-row spacing values from the variable text in web_final_spacing.
+This script processes the vegetable data CSV and extracts numeric in-row
+spacing values from the variable text in web_final_spacing. Common forms are
+read by rules (see ``scripts.io.spacing_rules``); only the rest go to the LLM.
 """
 from __future__ import annotations
 
 import argparse
-import json
-import subprocess
-import tempfile
 from pathlib import Path
 
 import pandas as pd
 
+from scripts.io.ai_memo import DEFAULT_MEMO_PATH, AiMemo
+from scripts.io.spacing_rules import CONFIDENCE_LEVELS, MEDIUM, meets, parse_in_row_spacing
+from scripts.io.tnh_gen import PROMPTS_DIR, chunk_items, run_batch
 
-def extract_spacing_with_ai(spacing_text: str, prompts_dir: Path) -> float | None:
-    """Extract in-row spacing in inches using tnh-gen.
 
-    Args:
-        spacing_text: The web_final_spacing text to parse
-        prompts_dir: Path to prompts directory
+PROMPT_KEY = "extract_in_row_spacing"
 
-    Returns:
-        Spacing in inches, or None if extraction failed
-    """
-    if not spacing_text or pd.isna(spacing_text) or spacing_text == "N/A":
-        return None
-
-    # Write spacing text to temp file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp:
-        tmp.write(spacing_text)
-        tmp_path = tmp.name
-
-    try:
-        env = {"TNH_PROMPT_DIR": str(prompts_dir)}
-        result = subprocess.run(
-            [
-                "tnh-gen", "--api", "run",
-                "--prompt", "extract_in_row_spacing",
-                "--input-file", tmp_path
-            ],
-            env={**subprocess.os.environ, **env},
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            print(f"tnh-gen failed for '{spacing_text}': {result.stderr}")
-            return None
-
-        # Parse response envelope
-        response = json.loads(result.stdout.strip())
-        if response.get("status") != "succeeded":
-            print(f"Extraction failed for '{spacing_text}': {response}")
-            return None
-
-        extracted_text = response.get("result", {}).get("text", "").strip()
 
-        # Remove markdown code fences if present
-        if extracted_text.startswith("```"):
-            extracted_text = extracted_text.split("```")[1]
-            if extracted_text.startswith("json"):
-                extracted_text = extracted_text[4:]
-            extracted_text = extracted_text.strip()
+def extract_spacings_with_ai(
+    spacing_texts: list[str],
+    batch_size: int = 25,
+    memo: AiMemo | None = None,
+) -> dict[str, float | None]:
+    """Spacing text -> inches, sending ``batch_size`` texts per tnh-gen call.
 
-        data = json.loads(extracted_text)
-        return data.get("in_row_spacing_inches")
-
-    except Exception as exc:
-        print(f"Error extracting spacing from '{spacing_text}': {exc}")
-        return None
-
-    finally:
-        Path(tmp_path).unlink(missing_ok=True)
+    Texts already in ``memo`` skip the model. Results are matched back to
+    texts by id; texts a batch misses are retried one at a time, and any that
+    still fail map to None.
+    """
+    lookup: dict[str, float | None] = {}
+    items = {str(i): text for i, text in enumerate(spacing_texts)}
+    for chunk in chunk_items(items, max(batch_size, 1), max_chars=20_000):
+        for item_id, result in run_batch(PROMPT_KEY, chunk, timeout=30, memo=memo).items():
+            text = items[item_id]
+            if isinstance(result, Exception):
+                print(f"Error extracting spacing from '{text}': {result}")
+                lookup[text] = None
+            else:
+                lookup[text] = result.get("in_row_spacing_inches")
+    return lookup
+
+
+def extract_spacings_with_rules(
+    spacing_texts: list[str],
+    min_confidence: str = MEDIUM,
+) -> tuple[dict[str, float | None], list[str]]:
+    """Spacing text -> inches for texts the rules read at ``min_confidence``.
+
+    Returns the lookup and the remaining texts, which need the model.
+    """
+    lookup: dict[str, float | None] = {}
+    residual: list[str] = []
+    for text in spacing_texts:
+        match = parse_in_row_spacing(text)
+        if meets(match, min_confidence):
+            lookup[text] = match.inches
+        else:
+            residual.append(text)
+    return lookup, residual
 
 
 def main() -> int:
@@ -91,6 +77,34 @@ def main() -> int:
         default=None,
         help="Output CSV path (defaults to overwriting input)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=25,
+        help="Spacing texts per tnh-gen call; 1 runs one call per text (default: 25)",
+    )
+    parser.add_argument(
+        "--ai-memo-path",
+        type=Path,
+        default=DEFAULT_MEMO_PATH,
+        help=f"SQLite memo of tnh-gen results by input, prompt, and model (default: {DEFAULT_MEMO_PATH})",
+    )
+    parser.add_argument(
+        "--no-ai-memo",
+        action="store_true",
+        help="Send every spacing text to tnh-gen, even if it was extracted before",
+    )
+    parser.add_argument(
+        "--min-confidence",
+        choices=CONFIDENCE_LEVELS,
+        default=MEDIUM,
+        help="Lowest rule confidence to accept without tnh-gen; 'high' also sends 'A x B' forms (default: medium)",
+    )
+    parser.add_argument(
+        "--no-rules",
+        action="store_true",
+        help="Send every spacing text to tnh-gen, skipping the rule-based fast path",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -101,13 +115,8 @@ def main() -> int:
     if args.output is None:
         args.output = args.input
 
-    # Find prompts directory
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
-    prompts_dir = project_root / "prompts"
-
-    if not prompts_dir.exists():
-        print(f"Error: Prompts directory not found: {prompts_dir}")
+    if not PROMPTS_DIR.exists():
+        print(f"Error: Prompts directory not found: {PROMPTS_DIR}")
         return 1
 
     df = pd.read_csv(args.input)
@@ -122,11 +131,24 @@ def main() -> int:
 
     print(f"Extracting spacing from {len(unique_spacings)} unique values...")
 
-    # Build lookup of spacing text -> inches
-    spacing_lookup: dict[str, float | None] = {}
-    for spacing_text in unique_spacings:
-        inches = extract_spacing_with_ai(str(spacing_text), prompts_dir)
-        spacing_lookup[spacing_text] = inches
+    # Build lookup of spacing text -> inches, by rule where possible
+    texts = [str(s) for s in unique_spacings]
+    if args.no_rules:
+        spacing_lookup, residual = {}, texts
+    else:
+        spacing_lookup, residual = extract_spacings_with_rules(texts, args.min_confidence)
+    print(f"Rules: {len(spacing_lookup)} read directly, {len(residual)} left for tnh-gen")
+
+    memo = None if args.no_ai_memo or not residual else AiMemo(args.ai_memo_path)
+    try:
+        if residual:
+            spacing_lookup.update(extract_spacings_with_ai(residual, args.batch_size, memo))
+    finally:
+        if memo is not None:
+            memo.close()
+    if memo is not None:
+        print(f"AI memo: {memo.hits} reused, {memo.misses} sent to tnh-gen")
+    for spacing_text, inches in spacing_lookup.items():
         feet = round(inches / 12, 3) if inches else None
         print(f"  '{spacing_text}' -> {inches} inches ({feet} ft)")
 
@@ -0,0 +1,131 @@
+"""Content-addressed memo of AI extraction results, kept in SQLite.
+
+A result is keyed by the SHA-256 of the model id, the prompt files, and the
+input text, so editing a prompt or switching models misses the memo while
+unchanged pages and spacing strings are answered from disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from scripts.io.tnh_gen import BATCH_SUFFIX, PROMPTS_DIR
+
+DEFAULT_MEMO_PATH = Path(".cache/ai-memo.sqlite")
+DEFAULT_MAX_ENTRIES = 50_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    prompt_key TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed_at);
+"""
+
+
+def model_id() -> str:
+    """Model tnh-gen is configured with, from ``TNH_GEN_MODEL`` (default ``"default"``)."""
+    return os.environ.get("TNH_GEN_MODEL", "default")
+
+
+def prompt_digest(prompt_key: str, prompts_dir: Path = PROMPTS_DIR) -> str:
+    """SHA-256 over the prompt file and its batch variant, when present."""
+    digest = hashlib.sha256()
+    for name in (prompt_key, prompt_key + BATCH_SUFFIX):
+        path = prompts_dir / f"{name}.md"
+        if path.exists():
+            digest.update(name.encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class AiMemo:
+    """Input text -> parsed JSON result, per prompt and model.
+
+    Safe to share between the threads that run tnh-gen calls. Least recently
+    used entries beyond ``max_entries`` are evicted on close.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_MEMO_PATH,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        model: str | None = None,
+        prompts_dir: Path = PROMPTS_DIR,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.max_entries = max_entries
+        self.model = model if model is not None else model_id()
+        self.prompts_dir = prompts_dir
+        self._clock = clock
+        self._digests: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> AiMemo:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def key(self, prompt_key: str, text: str) -> str:
+        if prompt_key not in self._digests:
+            self._digests[prompt_key] = prompt_digest(prompt_key, self.prompts_dir)
+        payload = json.dumps([self.model, self._digests[prompt_key], text], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, prompt_key: str, text: str) -> Any | None:
+        """Memoized result, or None (counted as a miss)."""
+        key = self.key(prompt_key, text)
+        with self._lock:
+            row = self._db.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._db.execute("UPDATE results SET accessed_at = ? WHERE key = ?", (self._clock(), key))
+            self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, prompt_key: str, text: str, result: Any) -> None:
+        now = self._clock()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, prompt_key, result, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.key(prompt_key, text), prompt_key, json.dumps(result, ensure_ascii=False), now, now),
+            )
+            self._db.commit()
+
+    def evict(self) -> int:
+        """Drop least recently used entries beyond ``max_entries``."""
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM results WHERE key IN ("
+                "  SELECT key FROM results ORDER BY accessed_at DESC, key LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_entries,),
+            )
+            self._db.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self.evict()
+        with self._lock:
+            self._db.commit()
+            self._db.close()
@@ -0,0 +1,216 @@
+"""Persistent HTTP response cache in SQLite with conditional revalidation."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+import httpx
+
+from scripts.io.http_client import AsyncFetcher
+from scripts.io.parse_pool import ParsePool
+
+DEFAULT_CACHE_PATH = Path(".cache/scrape/http-cache.sqlite")
+DEFAULT_TTL_DAYS = 7.0
+DEFAULT_MAX_MB = 200.0
+
+DAY_SECONDS = 86400.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+
+class HttpCache:
+    """URL -> compressed body plus validators, kept in one SQLite file.
+
+    Entries younger than their TTL are served without a request; older ones
+    are revalidated with ``If-None-Match``/``If-Modified-Since`` so unchanged
+    pages cost a 304. TTLs are set per key (the supplier code), falling back
+    to ``default_ttl``. Least recently used entries are evicted on close once
+    the stored bodies exceed ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        path: Path = DEFAULT_CACHE_PATH,
+        default_ttl: float = DEFAULT_TTL_DAYS * DAY_SECONDS,
+        ttls: dict[str, float] | None = None,
+        max_bytes: int = int(DEFAULT_MAX_MB * 1024 * 1024),
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.default_ttl = default_ttl
+        self.ttls = {key.upper(): ttl for key, ttl in (ttls or {}).items()}
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(_SCHEMA)
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def __enter__(self) -> HttpCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def ttl(self, key: str = "") -> float:
+        return self.ttls.get(key.upper(), self.default_ttl)
+
+    def get(self, url: str) -> CachedResponse | None:
+        row = self._db.execute(
+            "SELECT etag, last_modified, fetched_at, body FROM responses WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        etag, last_modified, fetched_at, body = row
+        return CachedResponse(url, zlib.decompress(body).decode("utf-8"), etag, last_modified, fetched_at)
+
+    def is_fresh(self, entry: CachedResponse, key: str = "") -> bool:
+        return self._clock() - entry.fetched_at < self.ttl(key)
+
+    def store(self, url: str, body: str, etag: str | None, last_modified: str | None) -> None:
+        blob = zlib.compress(body.encode("utf-8"), 6)
+        now = self._clock()
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(url, etag, last_modified, fetched_at, accessed_at, size, body) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, now, now, len(blob), blob),
+        )
+        self._db.commit()
+
+    def mark_fresh(self, url: str) -> None:
+        """Restart the TTL after a 304 confirmed the cached body."""
+        now = self._clock()
+        self._db.execute(
+            "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+            (now, now, url),
+        )
+        self._db.commit()
+
+    def touch(self, url: str) -> None:
+        self._db.execute(
+            "UPDATE responses SET accessed_at = ? WHERE url = ?",
+            (self._clock(), url),
+        )
+
+    def total_bytes(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def evict(self) -> int:
+        """Drop least recently used entries until the cache fits ``max_bytes``."""
+        cursor = self._db.execute(
+            "DELETE FROM responses WHERE url IN ("
+            "  SELECT url FROM ("
+            "    SELECT url, SUM(size) OVER (ORDER BY accessed_at DESC, url) AS kept"
+            "    FROM responses"
+            "  ) WHERE kept > ?"
+            ")",
+            (self.max_bytes,),
+        )
+        self._db.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        self.evict()
+        self._db.close()
+
+
+def conditional_headers(entry: CachedResponse | None) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if entry is not None and entry.etag:
+        headers["If-None-Match"] = entry.etag
+    if entry is not None and entry.last_modified:
+        headers["If-Modified-Since"] = entry.last_modified
+    return headers
+
+
+async def fetch_cached(
+    fetcher: AsyncFetcher,
+    cache: HttpCache | None,
+    url: str,
+    ttl_key: str = "",
+    transform: Callable[[str], str] = lambda text: text,
+    key: str | None = None,
+    parse_pool: ParsePool | None = None,
+) -> str:
+    """Body of ``url``, transformed, from the cache or the network.
+
+    Fresh entries are returned as-is. Stale ones are revalidated with a
+    conditional GET, and a 304 keeps the cached body. A 200 is passed through
+    ``transform`` and stored with its validators under ``key`` (default: the
+    URL), so different transforms of one page can coexist. ``transform`` runs
+    in ``parse_pool`` when given (it must then be picklable), else in a
+    worker thread; with metrics, its time is recorded as ``parse``.
+    """
+    key = key or url
+    metrics = fetcher.metrics if cache is not None else None
+    entry = cache.get(key) if cache is not None else None
+    if entry is not None and cache.is_fresh(entry, ttl_key):
+        cache.touch(key)
+        cache.hits += 1
+        if metrics is not None:
+            metrics.record_cache(ttl_key, "fresh")
+        return entry.body
+
+    response = await fetcher.get(url, headers=conditional_headers(entry))
+    if response.status_code == httpx.codes.NOT_MODIFIED and entry is not None:
+        cache.mark_fresh(key)
+        cache.revalidated += 1
+        if metrics is not None:
+            metrics.record_cache(ttl_key, "revalidated")
+        return entry.body
+
+    started = time.perf_counter()
+    if parse_pool is not None:
+        body = await parse_pool.run(transform, response.text)
+    else:
+        body = await asyncio.to_thread(transform, response.text)
+    if fetcher.metrics is not None:
+        fetcher.metrics.record_time(ttl_key, "parse", time.perf_counter() - started)
+    if cache is not None:
+        cache.store(key, body, response.headers.get("etag"), response.headers.get("last-modified"))
+        cache.misses += 1
+        if metrics is not None:
+            metrics.record_cache(ttl_key, "miss")
+    return body
+
+
+def parse_ttls(values: list[str]) -> dict[str, float]:
+    """``["SDSC=14", "JS=3"]`` -> supplier -> TTL in seconds (values in days)."""
+    ttls = {}
+    for value in values:
+        key, sep, days = value.partition("=")
+        if not sep or not key.strip():
+            raise ValueError(f"Expected SUPPLIER=DAYS, got {value!r}")
+        ttls[key.strip().upper()] = float(days) * DAY_SECONDS
+    return ttls
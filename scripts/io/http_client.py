@@ -0,0 +1,202 @@
+"""Shared async HTTP client with per-host token-bucket rate limiting."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable
+
+import httpx
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential
+
+from scripts.io.scrape_metrics import RequestTrace, ScrapeMetrics
+
+USER_AGENT = "HappyFarmBot/1.0 (educational research)"
+
+# Longest pause between retries, whether backing off or honouring Retry-After.
+RETRY_WAIT_MAX = 10.0
+
+
+class TokenBucket:
+    """Allow ``rate`` acquisitions per second on average, bursting to ``capacity``.
+
+    Waiters queue on a FIFO lock, so a busy host is served in request order
+    and never faster than its budget.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("Token bucket needs rate > 0 and capacity >= 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return seconds waited."""
+        async with self._lock:
+            self._refill()
+            waited = 0.0
+            if self._tokens < 1:
+                waited = (1 - self._tokens) / self.rate
+                await asyncio.sleep(waited)
+                self._refill()
+            self._tokens -= 1
+            return waited
+
+
+class HostRateLimiter:
+    """One token bucket per host, created on first use."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def bucket(self, url: str) -> TokenBucket | None:
+        if math.isinf(self.rate):
+            return None
+        host = httpx.URL(url).host
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.burst)
+        return self._buckets[host]
+
+    async def acquire(self, url: str) -> float:
+        bucket = self.bucket(url)
+        return await bucket.acquire() if bucket is not None else 0.0
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Seconds requested by a ``Retry-After`` header (delay or HTTP date), if any."""
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+_backoff = wait_exponential(min=1, max=RETRY_WAIT_MAX)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Honour a 429's ``Retry-After`` (capped), else back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == httpx.codes.TOO_MANY_REQUESTS:
+        delay = retry_after_seconds(exc.response)
+        if delay is not None:
+            return min(delay, RETRY_WAIT_MAX)
+    return _backoff(retry_state)
+
+
+def _record_retry(retry_state: RetryCallState) -> None:
+    fetcher, url = retry_state.args[:2]
+    if fetcher.metrics is not None:
+        fetcher.metrics.record_retry(httpx.URL(url).host)
+
+
+class AsyncFetcher:
+    """A pooled ``httpx.AsyncClient`` whose requests pass a per-host rate limit.
+
+    Connections are kept alive and reused across every request in a run. Use
+    as an async context manager so the pool is closed when the run ends.
+    With ``metrics``, every attempt records its phase timings, status, size,
+    and rate-limit wait, and every retry is counted per host.
+    """
+
+    def __init__(
+        self,
+        rate: float = math.inf,
+        burst: int = 1,
+        max_connections: int = 20,
+        timeout: float = 10.0,
+        transport: httpx.AsyncBaseTransport | None = None,
+        metrics: ScrapeMetrics | None = None,
+    ) -> None:
+        self.limiter = HostRateLimiter(rate, burst)
+        self.metrics = metrics
+        self.client = httpx.AsyncClient(
+            headers={"User-Agent": USER_AGENT},
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            follow_redirects=True,
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> AsyncFetcher:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.client.aclose()
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=_retry_wait,
+        before_sleep=_record_retry,
+    )
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> httpx.Response:
+        """GET ``url`` once its host has budget; retried with exponential backoff.
+
+        A 429 with ``Retry-After`` waits as long as the server asks, up to
+        ``RETRY_WAIT_MAX``. A 304 Not Modified is returned rather than raised,
+        for conditional GETs.
+        """
+        waited = await self.limiter.acquire(url)
+        if self.metrics is None:
+            response = await self.client.get(url, headers=headers)
+        else:
+            response = await self._traced_get(url, headers, waited)
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
+    async def _traced_get(
+        self,
+        url: str,
+        headers: dict[str, str] | None,
+        waited: float,
+    ) -> httpx.Response:
+        trace = RequestTrace()
+        started = time.perf_counter()
+        host = httpx.URL(url).host
+        try:
+            response = await self.client.get(url, headers=headers, extensions={"trace": trace})
+        except httpx.HTTPError as exc:
+            self.metrics.record_request(
+                host, type(exc).__name__, time.perf_counter() - started, trace.phases, 0, waited
+            )
+            raise
+        self.metrics.record_request(
+            host, response.status_code, time.perf_counter() - started, trace.phases, len(response.content), waited
+        )
+        return response
+
+
+def politeness_rate(batch_size: int, batch_delay: float) -> float:
+    """Per-host requests per second matching ``batch_size`` every ``batch_delay`` s."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    return batch_size / batch_delay if batch_delay > 0 else math.inf
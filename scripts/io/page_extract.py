@@ -0,0 +1,27 @@
+"""Single-pass extraction of the product-page fragments the scraper reads.
+
+Each supplier page is parsed once by its plugin's extractor (see
+``scripts.suppliers``), keeping only the elements that supplier's parser
+needs. The result is a small JSON fragment, which is what the HTTP cache
+stores in place of the page body.
+"""
+
+from __future__ import annotations
+
+import json
+
+from scripts.suppliers import get_supplier
+
+# Bump when an extractor's output changes so cached fragments are refetched.
+EXTRACT_VERSION = 2
+
+
+def extract_fragment(html: str, supplier: str) -> str:
+    """JSON fragment for ``supplier``'s page; ``"{}"`` for unknown suppliers."""
+    plugin = get_supplier(supplier)
+    return json.dumps(plugin.extract(html) if plugin else {}, ensure_ascii=False)
+
+
+def fragment_cache_key(url: str, supplier: str) -> str:
+    """Cache key for a page's fragment, versioned by supplier extractor."""
+    return f"{url}#{supplier.lower()}-v{EXTRACT_VERSION}"
@@ -0,0 +1,60 @@
+"""Process pool for the CPU-bound parse stage of a scrape.
+
+Fetching is I/O and stays on the event loop; turning a page into its fragment
+is BeautifulSoup work that holds the GIL, so threads cannot run it in
+parallel. ``ParsePool`` runs it in worker processes instead, and caps how
+many bodies may wait for a worker: a fetch that finishes while the pool is
+full holds its body until a slot frees, which stalls the fetch stage rather
+than letting downloaded pages pile up in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+class ParsePool:
+    """Run picklable parse functions in ``workers`` processes, ``max_pending`` at a time.
+
+    With one worker (or fewer) parsing runs in a thread of this process, as
+    there is nothing to gain from a second interpreter. Worker processes are
+    spawned on first use, so runs served from a warm cache never start them.
+    """
+
+    def __init__(self, workers: int | None = None, max_pending: int | None = None) -> None:
+        self.workers = default_workers() if workers is None else workers
+        self.max_pending = max_pending or 2 * max(self.workers, 1)
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    def __enter__(self) -> ParsePool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """``fn(*args)`` in a worker, waiting first for a free slot."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        async with self._slots:
+            if self.workers <= 1:
+                return await asyncio.to_thread(fn, *args)
+            if self._executor is None:
+                # spawn: the event loop process already runs threads, which fork would copy mid-state.
+                self._executor = ProcessPoolExecutor(self.workers, mp_context=multiprocessing.get_context("spawn"))
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._slots = None
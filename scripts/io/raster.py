@@ -0,0 +1,232 @@
+"""Native raster painter for grid layouts (no SVG parse or cairo needed)."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from scripts.io.svg import BORDER_DASHARRAYS, line_baselines
+from scripts.io.text_layout import load_font
+
+if TYPE_CHECKING:
+    from scripts.render_grid import GridLayout, LayoutLabel, LayoutRect
+
+# Layout coordinates are SVG/CSS pixels, defined at 96 per inch.
+CSS_DPI = 96.0
+
+
+def hex_to_rgb(color: str) -> tuple[int, int, int]:
+    value = color.lstrip("#")
+    if len(value) == 3:
+        value = "".join(ch * 2 for ch in value)
+    return int(value[0:2], 16), int(value[2:4], 16), int(value[4:6], 16)
+
+
+def _dash_mask(distance: np.ndarray, dasharray: str | None, scale: float) -> np.ndarray:
+    if not dasharray:
+        return np.ones(distance.shape, dtype=bool)
+    on, off = (float(part) * scale for part in dasharray.split(","))
+    return (distance % (on + off)) < on
+
+
+def _stroke_rect(
+    buf: np.ndarray,
+    x0: int,
+    y0: int,
+    x1: int,
+    y1: int,
+    width: int,
+    color: np.ndarray,
+    dasharray: str | None,
+    scale: float,
+    origin: tuple[int, int] = (0, 0),
+    canvas: tuple[int, int] | None = None,
+) -> None:
+    """Stroke a rectangle outline centered on its edges, dashing along the path.
+
+    Coordinates are canvas pixels; ``buf`` is the window of the canvas whose
+    top-left corner is ``origin``, and ``canvas`` is the full (width, height).
+    Edges are clamped inside the full canvas, never the window, so adjacent
+    tiles stitch without seams.
+
+    Dash distance follows the SVG path order: top (left to right), right (top
+    to bottom), bottom (right to left), left (bottom to top).
+    """
+    left, top = origin
+    height_px, width_px = buf.shape[:2]
+    canvas_w, canvas_h = canvas if canvas is not None else (width_px, height_px)
+    lo = width // 2
+    w = x1 - x0
+    h = y1 - y0
+
+    xs = np.arange(x0, x1)
+    ys = np.arange(y0, y1)
+    edges = (
+        ("h", y0, xs, xs - x0),
+        ("v", x1, ys, w + (ys - y0)),
+        ("h", y1, xs, w + h + (x1 - xs)),
+        ("v", x0, ys, 2 * w + h + (y1 - ys)),
+    )
+    for orient, fixed, span, distance in edges:
+        span = span[_dash_mask(distance, dasharray, scale)]
+        if span.size == 0:
+            continue
+        limit, offset, local_limit = (
+            (canvas_h, top, height_px) if orient == "h" else (canvas_w, left, width_px)
+        )
+        start = min(max(fixed - lo, 0), max(limit - width, 0)) - offset
+        band = slice(max(start, 0), max(min(start + width, local_limit), 0))
+        if band.start >= band.stop:
+            continue
+        if orient == "h":
+            span = span - left
+            span = span[(span >= 0) & (span < width_px)]
+            buf[band, span, :3] = color
+        else:
+            span = span - top
+            span = span[(span >= 0) & (span < height_px)]
+            buf[span, band, :3] = color
+
+
+def canvas_size(layout: GridLayout, scale: float) -> tuple[int, int]:
+    """Pixel (width, height) of ``layout`` painted at ``scale``."""
+    return max(1, round(layout.width * scale)), max(1, round(layout.height * scale))
+
+
+def rasterize(layout: GridLayout, dpi: float = CSS_DPI) -> np.ndarray:
+    """Paint ``layout`` into an opaque RGBA buffer at ``dpi``.
+
+    Fills are alpha-blended over a white background; strokes and text are
+    drawn on top, matching the SVG paint order.
+    """
+    scale = dpi / CSS_DPI
+    width_px, height_px = canvas_size(layout, scale)
+    return paint_region(layout, scale, (0, 0, width_px, height_px))
+
+
+def paint_region(
+    layout: GridLayout,
+    scale: float,
+    window: tuple[int, int, int, int],
+    rects: Iterable[LayoutRect] | None = None,
+    labels: Iterable[LayoutLabel] | None = None,
+    min_font_px: int = 0,
+    strokes: bool = True,
+) -> np.ndarray:
+    """Paint the ``(left, top, width, height)`` pixel window of ``layout``.
+
+    Only a window-sized buffer is allocated. ``rects``/``labels`` default to
+    the whole layout; callers painting many windows pass pre-filtered subsets
+    (in layout order). Labels smaller than ``min_font_px`` are skipped, and
+    ``strokes=False`` leaves cell outlines off for zoomed-out overviews.
+    """
+    left, top, width_px, height_px = window
+    canvas = canvas_size(layout, scale)
+    buf = np.full((height_px, width_px, 4), 255, dtype=np.uint8)
+
+    fills = {}
+    for key, style in layout.styles.items():
+        fills[key] = (np.array(hex_to_rgb(style.fill), dtype=np.float32), float(style.alpha))
+
+    bounds = []
+    for rect in layout.rects if rects is None else rects:
+        x0 = round(rect.x * scale)
+        y0 = round(rect.y * scale)
+        x1 = round((rect.x + rect.width) * scale)
+        y1 = round((rect.y + rect.height) * scale)
+        rgb, alpha = fills[rect.style]
+        region = buf[
+            max(y0 - top, 0) : max(y1 - top, 0),
+            max(x0 - left, 0) : max(x1 - left, 0),
+            :3,
+        ]
+        if alpha >= 1.0:
+            region[...] = rgb
+        else:
+            region[...] = (region * (1.0 - alpha) + rgb * alpha).round()
+        bounds.append((x0, y0, x1, y1, rect.style))
+
+    stroke_rgb = np.array(hex_to_rgb(layout.stroke), dtype=np.uint8)
+    stroke_width = max(1, round(scale))
+    for x0, y0, x1, y1, style_key in bounds if strokes else ():
+        dasharray = BORDER_DASHARRAYS.get(layout.styles[style_key].border)
+        _stroke_rect(
+            buf,
+            x0,
+            y0,
+            x1,
+            y1,
+            stroke_width,
+            stroke_rgb,
+            dasharray,
+            scale,
+            (left, top),
+            canvas,
+        )
+
+    text_fill = np.array(hex_to_rgb(layout.text_fill), dtype=np.float32)
+    for label in layout.labels if labels is None else labels:
+        font_size = layout.fonts[label.font]
+        size_px = max(1, round(font_size * scale))
+        if size_px < min_font_px:
+            continue
+        x = round(label.x * scale)
+        for line, baseline in zip(label.lines, line_baselines(label.y, len(label.lines), font_size)):
+            mask, dx, dy = glyph_mask(line, layout.font_family, size_px)
+            _blend_mask(buf, mask, x + dx - left, round(baseline * scale) + dy - top, text_fill)
+    return buf
+
+
+@lru_cache(maxsize=4096)
+def glyph_mask(text: str, family: str, size_px: int) -> tuple[np.ndarray, int, int]:
+    """Coverage mask for one line of text, anchored at its middle baseline.
+
+    Returns ``(mask, left, top)`` where the offsets place the mask relative to
+    the anchor point. Labels repeat heavily across runs, so each distinct line
+    is rendered by FreeType only once per process.
+    """
+    font = load_font(family, size_px)
+    if isinstance(font, ImageFont.FreeTypeFont):
+        left, top, right, bottom = font.getbbox(text, anchor="ms")
+    else:
+        left, top, right, bottom = font.getbbox(text)
+        width, height = right - left, bottom - top
+        left, top, right, bottom = -width // 2, -height, width - width // 2, 0
+    width, height = max(1, right - left), max(1, bottom - top)
+    image = Image.new("L", (width, height), 0)
+    draw = ImageDraw.Draw(image)
+    if isinstance(font, ImageFont.FreeTypeFont):
+        draw.text((-left, -top), text, font=font, fill=255, anchor="ms")
+    else:
+        draw.text((0, 0), text, font=font, fill=255)
+    return np.asarray(image, dtype=np.float32) / 255.0, left, top
+
+
+def _blend_mask(buf: np.ndarray, mask: np.ndarray, x: int, y: int, color: np.ndarray) -> None:
+    height_px, width_px = buf.shape[:2]
+    x0, y0 = max(x, 0), max(y, 0)
+    x1 = min(x + mask.shape[1], width_px)
+    y1 = min(y + mask.shape[0], height_px)
+    if x0 >= x1 or y0 >= y1:
+        return
+    coverage = mask[y0 - y : y1 - y, x0 - x : x1 - x, None]
+    region = buf[y0:y1, x0:x1, :3]
+    region[...] = (region * (1.0 - coverage) + color * coverage).round()
+
+
+def save_png(buf: np.ndarray, output_path: Path, dpi: float = CSS_DPI) -> None:
+    """Write a rasterized buffer as PNG.
+
+    Grid images are large flat-color areas, so fast zlib settings cost little
+    in size and most of the encode time.
+    """
+    Image.fromarray(buf).save(output_path, dpi=(dpi, dpi), compress_level=1)
+
+
+def paint_png(layout: GridLayout, output_path: Path, dpi: float = CSS_DPI) -> None:
+    """Rasterize ``layout`` straight to a PNG file."""
+    save_png(rasterize(layout, dpi), output_path, dpi)
@@ -0,0 +1,109 @@
+"""Content-hash cache for rendered artifacts and their intermediates."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+# Bump when the on-disk cache layout changes.
+CACHE_FORMAT = 1
+
+MANIFEST_NAME = "manifest.json"
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    with path.open("rb") as handle:
+        return hashlib.file_digest(handle, "sha256").hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_fingerprint(*paths: Path) -> str:
+    """Digest of renderer source files, so code changes invalidate the cache."""
+    digest = hashlib.sha256(str(CACHE_FORMAT).encode())
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def cache_key(*parts: object) -> str:
+    """Combine digests and parameters into one stable key."""
+    payload = json.dumps([str(part) for part in parts])
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class RenderCache:
+    """Skip unchanged outputs and reuse pickled intermediates across runs.
+
+    The manifest maps each output path to the key it was last written with,
+    plus its size and mtime so a deleted or hand-edited output is rebuilt.
+    Intermediates are pickled per ``(name, key)``; only the newest
+    ``max_entries`` per name are kept.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 8) -> None:
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.skipped: list[Path] = []
+        self.written: list[Path] = []
+        self._manifest_path = cache_dir / MANIFEST_NAME
+        try:
+            self._manifest = json.loads(self._manifest_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._manifest = {}
+
+    @staticmethod
+    def _stat(path: Path) -> list[int]:
+        stat = path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def is_fresh(self, output: Path, key: str) -> bool:
+        entry = self._manifest.get(str(output.resolve()))
+        if entry is None or entry.get("key") != key or not output.exists():
+            return False
+        return entry.get("stat") == self._stat(output)
+
+    def record(self, output: Path, key: str) -> None:
+        self._manifest[str(output.resolve())] = {"key": key, "stat": self._stat(output)}
+
+    def memo(self, name: str, key: str, build: Callable[[], T]) -> T:
+        """Return the cached intermediate ``name`` for ``key``, building it on a miss."""
+        path = self.cache_dir / "intermediates" / f"{name}-{key[:32]}.pkl"
+        try:
+            with path.open("rb") as handle:
+                value = pickle.load(handle)
+            os.utime(path)
+            return value
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            pass
+        value = build()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as handle:
+            pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        self._evict(name)
+        return value
+
+    def _evict(self, name: str) -> None:
+        entries = sorted(
+            (self.cache_dir / "intermediates").glob(f"{name}-*.pkl"),
+            key=lambda entry: entry.stat().st_mtime_ns,
+            reverse=True,
+        )
+        for stale in entries[self.max_entries :]:
+            stale.unlink(missing_ok=True)
+
+    def save(self) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._manifest_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._manifest, indent=2, sort_keys=True), encoding="utf-8")
+        tmp_path.replace(self._manifest_path)
@@ -0,0 +1,126 @@
+"""Fingerprints of scraped records and field-level change logs for refreshes."""
+
+from __future__ import annotations
+
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+NOT_APPLICABLE = "N/A"
+
+CHANGE_LOG_COLUMNS = ["changed_at", "file", "row", "variety", "url", "field", "old", "new"]
+
+
+def change_log_path_for(output_path: Path) -> Path:
+    """Default change log next to the output, e.g. ``enriched.csv.changes.csv``."""
+    return output_path.with_name(output_path.name + ".changes.csv")
+
+
+def fingerprint(scraped: dict[str, Any], columns: list[str]) -> str:
+    """Short SHA-256 of the supplier ``columns`` a page yielded (missing ones as null)."""
+    record = {col: scraped.get(col) for col in columns}
+    payload = json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def _text(value: Any) -> str:
+    return "" if value is None or (not isinstance(value, str) and pd.isna(value)) else str(value)
+
+
+def _same(old: Any, new: Any) -> bool:
+    old_text, new_text = _text(old), _text(new)
+    if old_text == new_text:
+        return True
+    # CSV round trips turn "65" into 65 or 65.0
+    try:
+        return float(old_text) == float(new_text)
+    except ValueError:
+        return False
+
+
+def field_changes(row: pd.Series, values: dict[str, Any], columns: list[str]) -> list[tuple[str, str, str]]:
+    """``(field, old, new)`` for each of ``columns`` whose new value differs.
+
+    ``N/A`` only marks another supplier's fields (and reads back from CSV as
+    empty), so it is never reported as a change.
+    """
+    return [
+        (col, _text(row.get(col)), _text(values[col]))
+        for col in columns
+        if col in values and values[col] != NOT_APPLICABLE and not _same(row.get(col), values[col])
+    ]
+
+
+def refresh_records(
+    tables: dict[str, pd.DataFrame],
+    records: list[dict[str, Any]],
+    columns: list[str],
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], dict[str, int]]:
+    """Keep only records whose page changed; return (records, changes, counts).
+
+    A record whose fingerprint matches the row's stored one is dropped, so
+    the row keeps its values and ``scrape_date``. A row without a stored
+    fingerprint whose values already match only gains the fingerprint. Rows
+    never scraped successfully are written without logging. A failed fetch
+    of a previously successful row is dropped rather than overwriting good
+    data.
+    """
+    kept: list[dict[str, Any]] = []
+    changes: list[dict[str, Any]] = []
+    counts = {"changed": 0, "unchanged": 0, "fingerprinted": 0, "new": 0, "failed": 0}
+    now = pd.Timestamp.now().isoformat()
+    for record in records:
+        row = tables[record["file"]].loc[record["row"]]
+        values = record["values"]
+        if values["scrape_status"] != "success":
+            counts["failed"] += 1
+            if row.get("scrape_status") != "success":
+                kept.append(record)
+            continue
+        if row.get("scrape_status") != "success":
+            counts["new"] += 1
+            kept.append(record)
+            continue
+        if row.get("scrape_fingerprint") == values["scrape_fingerprint"]:
+            counts["unchanged"] += 1
+            continue
+
+        diffs = field_changes(row, values, columns)
+        if not diffs:
+            counts["fingerprinted"] += 1
+            kept.append({**record, "values": {"scrape_fingerprint": values["scrape_fingerprint"]}})
+            continue
+
+        counts["changed"] += 1
+        kept.append(record)
+        for field, old, new in diffs:
+            changes.append(
+                {
+                    "changed_at": now,
+                    "file": record["file"],
+                    "row": record["row"],
+                    "variety": _text(row.get("variety")),
+                    "url": record["url"],
+                    "field": field,
+                    "old": old,
+                    "new": new,
+                }
+            )
+    return kept, changes, counts
+
+
+def append_change_log(path: Path, changes: list[dict[str, Any]]) -> None:
+    """Append ``changes`` to the CSV at ``path``, writing a header if it is new."""
+    if not changes:
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    is_new = not path.exists() or path.stat().st_size == 0
+    with path.open("a", newline="", encoding="utf-8") as handle:
+        writer = csv.DictWriter(handle, fieldnames=CHANGE_LOG_COLUMNS)
+        if is_new:
+            writer.writeheader()
+        writer.writerows(changes)
@@ -0,0 +1,71 @@
+"""Append-only JSONL journal of finished scrape rows, for crash-safe resume."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+
+def journal_path_for(output_path: Path) -> Path:
+    """Default journal next to the output, e.g. ``enriched.csv.journal.jsonl``."""
+    return output_path.with_name(output_path.name + ".journal.jsonl")
+
+
+def load_journal(path: Path) -> list[dict[str, Any]]:
+    """Records in ``path``, skipping a final line cut short by a crash."""
+    if not path.exists():
+        return []
+    records = []
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+    return records
+
+
+class ScrapeJournal:
+    """One ``{"row", "url", "values"}`` line per finished row, fsynced on write.
+
+    Opened in append mode when resuming, else truncated, so a journal only
+    ever describes the run that is about to finish.
+    """
+
+    def __init__(self, path: Path, resume: bool = False) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._handle = path.open("a" if resume else "w", encoding="utf-8")
+
+    def __enter__(self) -> ScrapeJournal:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def append(self, record: dict[str, Any]) -> None:
+        self._handle.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+def merge_records(df: pd.DataFrame, records: list[dict[str, Any]]) -> None:
+    """Write every record's values into ``df`` at its row in one update."""
+    if not records:
+        return
+    updates = pd.DataFrame.from_records(
+        [record["values"] for record in records],
+        index=[record["row"] for record in records],
+    )
+    updates = updates[~updates.index.duplicated(keep="last")]
+    updates = updates[[col for col in updates.columns if col in df.columns]]
+    # Scraped text lands in columns pandas may have read as numeric.
+    df[updates.columns] = df[updates.columns].astype(object)
+    df.update(updates)
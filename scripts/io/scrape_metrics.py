@@ -0,0 +1,144 @@
+"""Per-request and per-row timings for scrape runs, aggregated into a JSON report.
+
+Request phases come from httpcore's ``trace`` extension: ``connect`` covers
+DNS resolution, TCP connect, and TLS (httpcore resolves names inside its TCP
+connect and does not report them separately); ``ttfb`` runs from sending the
+request to the response headers; ``download`` is reading the body.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is open.
+BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "connect",
+    "send_request_headers": "ttfb",
+    "send_request_body": "ttfb",
+    "receive_response_headers": "ttfb",
+    "receive_response_body": "download",
+}
+
+
+def histogram(seconds: list[float]) -> dict[str, Any]:
+    """Count, mean, p50/p95/max, and bucket counts of ``seconds``, in ms."""
+    if not seconds:
+        return {"count": 0}
+    ms = np.asarray(seconds) * 1000
+    counts = np.bincount(np.searchsorted(BUCKETS_MS, ms, side="left"), minlength=len(BUCKETS_MS) + 1)
+    return {
+        "count": int(ms.size),
+        "mean_ms": round(float(ms.mean()), 2),
+        "p50_ms": round(float(np.percentile(ms, 50)), 2),
+        "p95_ms": round(float(np.percentile(ms, 95)), 2),
+        "max_ms": round(float(ms.max()), 2),
+        "buckets_ms": [*BUCKETS_MS, None],
+        "counts": counts.tolist(),
+    }
+
+
+class RequestTrace:
+    """httpcore ``trace`` callback that sums phase durations for one GET."""
+
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = defaultdict(float)
+        self._started: dict[str, float] = {}
+
+    async def __call__(self, event: str, info: dict) -> None:
+        _, _, rest = event.partition(".")
+        step, _, state = rest.rpartition(".")
+        phase = _PHASES.get(step)
+        if phase is None:
+            return
+        if state == "started":
+            self._started[step] = time.perf_counter()
+        elif step in self._started:
+            self.phases[phase] += time.perf_counter() - self._started.pop(step)
+
+
+@dataclass
+class _Group:
+    timings: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    counts: Counter = field(default_factory=Counter)
+
+
+class ScrapeMetrics:
+    """Collects request, cache, retry, parse, and LLM timings during a scrape."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.hosts: dict[str, _Group] = defaultdict(_Group)
+        self.suppliers: dict[str, _Group] = defaultdict(_Group)
+
+    def record_request(
+        self,
+        host: str,
+        status: int | str,
+        seconds: float,
+        phases: dict[str, float],
+        size: int,
+        limiter_wait: float,
+    ) -> None:
+        group = self.hosts[host]
+        group.counts["requests"] += 1
+        group.counts[f"status_{status}"] += 1
+        group.counts["bytes"] += size
+        group.timings["total"].append(seconds)
+        group.timings["rate_limit_wait"].append(limiter_wait)
+        for phase, value in phases.items():
+            group.timings[phase].append(value)
+
+    def record_retry(self, host: str) -> None:
+        self.hosts[host].counts["retries"] += 1
+
+    def record_cache(self, supplier: str, outcome: str) -> None:
+        self.suppliers[supplier or "unknown"].counts[f"cache_{outcome}"] += 1
+
+    def record_time(self, supplier: str, stage: str, seconds: float) -> None:
+        self.suppliers[supplier or "unknown"].timings[stage].append(seconds)
+
+    def record_row(self, supplier: str, status: str) -> None:
+        group = self.suppliers[supplier or "unknown"]
+        group.counts["rows"] += 1
+        group.counts[f"rows_{status}"] += 1
+
+    def report(self, settings: dict[str, Any] | None = None) -> dict[str, Any]:
+        """Machine-readable summary: run totals plus per-host and per-supplier detail."""
+        wall = time.perf_counter() - self.started
+        rows = sum(group.counts["rows"] for group in self.suppliers.values())
+        return {
+            "settings": settings or {},
+            "wall_seconds": round(wall, 3),
+            "rows": rows,
+            "rows_per_second": round(rows / wall, 3) if wall > 0 else None,
+            "requests": sum(group.counts["requests"] for group in self.hosts.values()),
+            "hosts": {
+                host: {**group.counts, **{name: histogram(values) for name, values in group.timings.items()}}
+                for host, group in sorted(self.hosts.items())
+            },
+            "suppliers": {
+                supplier: {**group.counts, **{name: histogram(values) for name, values in group.timings.items()}}
+                for supplier, group in sorted(self.suppliers.items())
+            },
+        }
+
+    def write_report(self, path: Path, settings: dict[str, Any] | None = None) -> dict[str, Any]:
+        report = self.report(settings)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        return report
+
+
+def report_path_for(output_path: Path) -> Path:
+    """Default report next to the output, e.g. ``enriched.csv.report.json``."""
+    return output_path.with_name(output_path.name + ".report.json")
@@ -0,0 +1,90 @@
+"""Rule-based in-row spacing from supplier spacing text, with a confidence level.
+
+Most ``web_final_spacing`` strings follow a handful of shapes: ``≥24" apart``,
+``12-18"``, ``10–18" apart (rows 18–36" apart)``, ``18" x 24–36"``. Those are
+read here with compiled patterns, following the same rules as the
+``extract_in_row_spacing`` prompt: the lower end of a range, the smaller side
+of an ``A x B`` pair, row-to-row spacing ignored. Anything else returns None
+and is left for the model.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+
+HIGH = "high"
+MEDIUM = "medium"
+CONFIDENCE_LEVELS = (HIGH, MEDIUM)
+
+_NORMALIZE = str.maketrans({"–": "-", "—": "-", "″": '"', "”": '"', "“": '"', "′": "'", "’": "'", "\\": None})
+
+
+def _measure(name: str) -> str:
+    """A distance or range with a unit, e.g. ``≥12"`` or ``5-6'``, as named groups."""
+    return (
+        rf"≥?\s*(?P<{name}_lo>\d+(?:\.\d+)?)(?:\s*-\s*(?P<{name}_hi>\d+(?:\.\d+)?))?"
+        rf"\s*(?P<{name}_unit>\"|'|in\b|inches\b|ft\b|feet\b)"
+    )
+
+
+_IN = _measure("in")
+_ROW = _measure("row")
+_APART = r"(?:\s+apart)?(?:\s*in-row|\s+between\s+plants)?"
+_ROWS = rf"rows?\s+(?:are\s+)?{_ROW}(?:\s+apart)?"
+
+# (rule name, confidence, anchored pattern); the first match wins.
+RULES: list[tuple[str, str, re.Pattern[str]]] = [
+    ("single", HIGH, re.compile(rf"^(?:transplant\s+)?{_IN}{_APART}$", re.IGNORECASE)),
+    (
+        "with-rows",
+        HIGH,
+        re.compile(
+            rf"^(?:transplant\s+)?{_IN}{_APART}\s*(?:[,;(]\s*|\s+in\s+|\s+and\s+)(?:in\s+)?{_ROWS}\)?$",
+            re.IGNORECASE,
+        ),
+    ),
+    (
+        "between",
+        HIGH,
+        re.compile(rf"^{_IN}\s+between\s+plants\s*(?:[,;]|\s+and)\s*{_ROW}\s+between\s+rows$", re.IGNORECASE),
+    ),
+    ("by", MEDIUM, re.compile(rf"^{_IN}\s*x\s*{_ROW}$", re.IGNORECASE)),
+]
+
+
+@dataclass(frozen=True)
+class SpacingMatch:
+    """In-row spacing in inches."""
+
+    inches: float
+    confidence: str
+    rule: str
+
+
+def _inches(match: re.Match[str], name: str) -> float:
+    unit = match.group(f"{name}_unit").lower()
+    value = float(match.group(f"{name}_lo"))
+    return value * 12 if unit in ("'", "ft", "feet") else value
+
+
+def parse_in_row_spacing(text: str) -> SpacingMatch | None:
+    """Spacing read by the first matching rule, or None for the model to handle."""
+    normalized = " ".join(str(text).translate(_NORMALIZE).split())
+    for rule, confidence, pattern in RULES:
+        match = pattern.match(normalized)
+        if match is None:
+            continue
+        inches = _inches(match, "in")
+        if rule == "by":
+            # In-row is the smaller side of "A x B".
+            inches = min(inches, _inches(match, "row"))
+        return SpacingMatch(int(inches) if inches.is_integer() else inches, confidence, rule)
+    return None
+
+
+def meets(match: SpacingMatch | None, min_confidence: str) -> bool:
+    """True when ``match`` is at least as confident as ``min_confidence``."""
+    if match is None:
+        return False
+    return CONFIDENCE_LEVELS.index(match.confidence) <= CONFIDENCE_LEVELS.index(min_confidence)
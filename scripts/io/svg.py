@@ -0,0 +1,141 @@
+"""Streaming SVG writer with shared CSS classes and reusable symbols."""
+
+from __future__ import annotations
+
+import html
+from typing import TextIO
+
+XLINK_NS = "http://www.w3.org/1999/xlink"
+SVG_NS = "http://www.w3.org/2000/svg"
+
+LINE_HEIGHT_RATIO = 1.2
+
+# Stroke dash patterns for water border styles ("solid" has none).
+BORDER_DASHARRAYS = {
+    "dashed": "4,2",
+    "dotted": "1,2",
+}
+
+
+def line_baselines(y: float, count: int, font_size: float) -> list[float]:
+    """Baselines for ``count`` lines vertically centered on ``y``."""
+    line_height = font_size * LINE_HEIGHT_RATIO
+    start_y = y - line_height * count / 2 + font_size
+    return [start_y + idx * line_height for idx in range(count)]
+
+
+def fmt_num(value: float) -> str:
+    """Format a coordinate compactly: integers without a trailing '.0'."""
+    number = float(value)
+    if number.is_integer():
+        return str(int(number))
+    return f"{number:.2f}".rstrip("0").rstrip(".")
+
+
+def css_rule(selector: str, props: dict[str, object]) -> str:
+    body = ";".join(f"{key}:{value}" for key, value in props.items())
+    return f"{selector}{{{body}}}"
+
+
+class SvgWriter:
+    """Write an SVG document element by element to an open text handle.
+
+    Repeated presentation attributes live in a single ``<style>`` block, and
+    fixed-size rectangles and repeated labels are declared once in ``<defs>``
+    and placed with ``<use>``, so each element only carries its position.
+    """
+
+    def __init__(self, handle: TextIO, width: float, height: float) -> None:
+        self._handle = handle
+        self._closed = False
+        handle.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+        handle.write(
+            f'<svg xmlns="{SVG_NS}" xmlns:xlink="{XLINK_NS}" '
+            f'width="{fmt_num(width)}" height="{fmt_num(height)}" '
+            f'viewBox="0 0 {fmt_num(width)} {fmt_num(height)}">\n'
+        )
+
+    def __enter__(self) -> SvgWriter:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def style(self, rules: list[str]) -> None:
+        self._handle.write("<style>")
+        self._handle.write("".join(rules))
+        self._handle.write("</style>\n")
+
+    def start_defs(self) -> None:
+        self._handle.write("<defs>\n")
+
+    def end_defs(self) -> None:
+        self._handle.write("</defs>\n")
+
+    def symbol_rect(self, symbol_id: str, width: float, height: float, css_class: str) -> None:
+        """Declare a reusable rectangle anchored at its top-left corner."""
+        self._handle.write(
+            f'<rect id="{symbol_id}" class="{css_class}" '
+            f'width="{fmt_num(width)}" height="{fmt_num(height)}"/>\n'
+        )
+
+    def symbol_text(
+        self,
+        symbol_id: str,
+        lines: list[str],
+        font_size: float,
+        css_class: str,
+    ) -> None:
+        """Declare a reusable text block centered on the origin."""
+        self._handle.write(_text_markup(0, 0, lines, font_size, css_class, symbol_id))
+
+    def rect(self, x: float, y: float, width: float, height: float, css_class: str) -> None:
+        self._handle.write(
+            f'<rect class="{css_class}" x="{fmt_num(x)}" y="{fmt_num(y)}" '
+            f'width="{fmt_num(width)}" height="{fmt_num(height)}"/>\n'
+        )
+
+    def use(self, symbol_id: str, x: float, y: float) -> None:
+        self._handle.write(
+            f'<use xlink:href="#{symbol_id}" x="{fmt_num(x)}" y="{fmt_num(y)}"/>\n'
+        )
+
+    def text(
+        self,
+        x: float,
+        y: float,
+        lines: list[str],
+        font_size: float,
+        css_class: str,
+    ) -> None:
+        """Write lines centered on (x, y); font styling comes from ``css_class``."""
+        if lines:
+            self._handle.write(_text_markup(x, y, lines, font_size, css_class))
+
+    def close(self) -> None:
+        if not self._closed:
+            self._handle.write("</svg>\n")
+            self._closed = True
+
+
+def _text_markup(
+    x: float,
+    y: float,
+    lines: list[str],
+    font_size: float,
+    css_class: str,
+    element_id: str | None = None,
+) -> str:
+    line_height = font_size * LINE_HEIGHT_RATIO
+    start_y = line_baselines(y, len(lines), font_size)[0]
+    x_attr = fmt_num(x)
+    id_attr = f' id="{element_id}"' if element_id else ""
+    head = f'<text{id_attr} class="{css_class}" x="{x_attr}" y="{fmt_num(start_y)}">'
+    if len(lines) == 1:
+        return f"{head}{html.escape(lines[0])}</text>\n"
+    parts = [head]
+    for idx, line in enumerate(lines):
+        dy = 0 if idx == 0 else line_height
+        parts.append(f'<tspan x="{x_attr}" dy="{fmt_num(dy)}">{html.escape(line)}</tspan>')
+    parts.append("</text>\n")
+    return "".join(parts)
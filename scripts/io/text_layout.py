@@ -0,0 +1,218 @@
+"""Label fitting with real glyph advance widths and memoized layouts."""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from pathlib import Path
+from typing import Callable
+
+from PIL import ImageFont
+
+FONT_METRICS_PATH = Path(__file__).with_name("font_metrics.json")
+FALLBACK_FAMILY = "Helvetica"
+ELLIPSIS = "..."
+
+# Pillow only opens fonts by file name, so metric-compatible aliases map to
+# the files their packages install.
+ALIAS_FONT_FILES = {
+    "liberation sans": ("LiberationSans-Regular.ttf",),
+    "nimbus sans": ("NimbusSans-Regular.otf", "NimbusSans-Regular.ttf"),
+    "courier new": ("cour.ttf",),
+    "liberation mono": ("LiberationMono-Regular.ttf",),
+}
+# Last font file tried; its metrics are not in the table.
+FALLBACK_FONT_FILE = "DejaVuSans.ttf"
+# Size at which fonts outside the table are measured, then scaled linearly.
+MEASURE_FONT_PX = 100
+
+
+@dataclass(frozen=True)
+class FontMetrics:
+    """Advance widths for one font family, in font units."""
+
+    widths: dict[str, int]
+    default_width: int
+    units_per_em: int = 1000
+    names: tuple[str, ...] = ()
+
+    def text_width(self, text: str, font_size: float) -> float:
+        units = sum(self.widths.get(ch, self.default_width) for ch in text)
+        return units * font_size / self.units_per_em
+
+
+@lru_cache(maxsize=None)
+def load_font_metrics(path: Path = FONT_METRICS_PATH) -> dict[str, FontMetrics]:
+    """Load the bundled metrics table, indexed by family name and every alias."""
+    table = json.loads(path.read_text(encoding="utf-8"))
+    metrics: dict[str, FontMetrics] = {}
+    for family, entry in table.items():
+        names = (family, *entry.get("aliases", []))
+        font = FontMetrics(
+            widths=entry["widths"],
+            default_width=int(entry["default_width"]),
+            units_per_em=int(entry.get("units_per_em", 1000)),
+            names=names,
+        )
+        for name in names:
+            metrics[name.lower()] = font
+    return metrics
+
+
+@lru_cache(maxsize=64)
+def font_metrics(font_family: str) -> FontMetrics:
+    """Metrics for the first known family in a CSS font-family list."""
+    metrics = load_font_metrics()
+    for name in font_family.split(","):
+        font = metrics.get(name.strip().strip("'\"").lower())
+        if font is not None:
+            return font
+    return metrics[FALLBACK_FAMILY.lower()]
+
+
+def _font_files(name: str) -> tuple[str, ...]:
+    return (name, f"{name}.ttf", *ALIAS_FONT_FILES.get(name.lower(), ()))
+
+
+@lru_cache(maxsize=64)
+def font_face(font_family: str) -> tuple[str | None, bool]:
+    """Font file Pillow draws ``font_family`` with, and whether the table fits it.
+
+    Tries each family in the CSS list, then the metric-compatible aliases the
+    metrics table lists for it, then DejaVu Sans. The flag is False when the
+    face that loaded is not one the metrics describe; the file is None when
+    only Pillow's built-in font is left.
+    """
+    metrics = font_metrics(font_family)
+    table = load_font_metrics()
+    requested = [name.strip().strip("'\"") for name in font_family.split(",")]
+    candidates = [
+        (file, table.get(name.lower()) is metrics)
+        for name in [*requested, *metrics.names]
+        for file in _font_files(name)
+    ]
+    candidates.append((FALLBACK_FONT_FILE, False))
+    for file, compatible in candidates:
+        try:
+            ImageFont.truetype(file, MEASURE_FONT_PX)
+        except OSError:
+            continue
+        return file, compatible
+    return None, False
+
+
+@lru_cache(maxsize=32)
+def load_font(font_family: str, size_px: int) -> ImageFont.ImageFont | ImageFont.FreeTypeFont:
+    """The font :func:`font_face` picked for ``font_family``, at ``size_px``."""
+    file, _ = font_face(font_family)
+    if file is None:
+        return ImageFont.load_default(size=size_px)
+    return ImageFont.truetype(file, size_px)
+
+
+@lru_cache(maxsize=16384)
+def text_width(text: str, font_family: str, font_size: float) -> float:
+    """Width of ``text`` as drawn: from the metrics table when it fits the face, else measured."""
+    _, compatible = font_face(font_family)
+    if compatible:
+        return font_metrics(font_family).text_width(text, font_size)
+    return load_font(font_family, MEASURE_FONT_PX).getlength(text) * font_size / MEASURE_FONT_PX
+
+
+def fit_text(text: str, limit: float, measure: Callable[[str], float] = len) -> str:
+    """Truncate ``text`` with an ellipsis so ``measure(text) <= limit``.
+
+    ``measure`` defaults to character count; pass a width function to fit
+    pixels. When not even the ellipsis fits, the text is hard-cut instead.
+    """
+    if limit <= 0:
+        return ""
+    if measure(text) <= limit:
+        return text
+    suffix = ELLIPSIS if measure(ELLIPSIS) < limit else ""
+    for end in range(len(text) - 1, -1, -1):
+        candidate = text[:end] + suffix
+        if measure(candidate) <= limit:
+            return candidate
+    return ""
+
+
+def wrap_text(
+    text: str,
+    limit: float,
+    max_lines: int,
+    measure: Callable[[str], float] = len,
+) -> list[str]:
+    """Greedy word wrap into at most ``max_lines`` lines no wider than ``limit``.
+
+    Words too long for a line are truncated; if words remain after the last
+    line, that line is fitted so the cut is visible.
+    """
+    if limit <= 0 or max_lines <= 0:
+        return []
+    words = text.split()
+    if not words:
+        return [fit_text(text, limit, measure)]
+
+    lines: list[str] = []
+    current = ""
+    for word in words:
+        candidate = word if not current else f"{current} {word}"
+        if measure(candidate) <= limit:
+            current = candidate
+        else:
+            if current:
+                lines.append(current)
+            current = word
+        if len(lines) >= max_lines:
+            break
+
+    if len(lines) < max_lines and current:
+        lines.append(current)
+    lines = [fit_text(line, limit, measure) for line in lines[:max_lines]]
+
+    if len(lines) == max_lines and " ".join(words) != " ".join(lines):
+        last = lines[-1]
+        if not last.endswith(ELLIPSIS):
+            lines[-1] = fit_text(last + ELLIPSIS, limit, measure)
+    return lines
+
+
+@lru_cache(maxsize=16384)
+def fit_label(text: str, font_family: str, font_size: float, width: float) -> str:
+    """Width-fitted single line, cached by text, font, size, and box width."""
+    return fit_text(text, width, partial(text_width, font_family=font_family, font_size=font_size))
+
+
+@lru_cache(maxsize=16384)
+def wrap_label(
+    text: str,
+    font_family: str,
+    font_size: float,
+    width: float,
+    max_lines: int,
+) -> tuple[str, ...]:
+    """Width-wrapped lines, cached by text, font, size, box width, and line cap."""
+    measure = partial(text_width, font_family=font_family, font_size=font_size)
+    return tuple(wrap_text(text, width, max_lines, measure))
+
+
+def auto_crop_code(crop: str) -> str:
+    """Fallback crop code: 4 letters of one word, or 3 + 2 letters of two words."""
+    words = re.findall(r"[A-Za-z0-9]+", crop)
+    if not words:
+        return crop.upper()
+    if len(words) == 1:
+        return words[0][:4].upper()
+    return (words[0][:3] + words[1][:2]).upper()
+
+
+def compact_label(crop: str, variety: str, crop_codes: dict[str, str]) -> str:
+    """Short ``CODE.-VAR.`` label, e.g. "CARR.-BOL." for Carrots / Bolero."""
+    code = crop_codes.get(crop) or auto_crop_code(crop)
+    variety_words = re.findall(r"[A-Za-z0-9]+", variety)
+    if not variety_words:
+        return f"{code}."
+    return f"{code}.-{variety_words[0][:3].upper()}."
@@ -0,0 +1,229 @@
+"""Run prompts through the tnh-gen CLI, one input at a time or many per call.
+
+tnh-gen is installed via pipx and answers with a response envelope:
+``{"status": "succeeded", "result": {"text": "..."}}``. Prompts are resolved
+from this repo's ``prompts/`` directory via ``TNH_PROMPT_DIR``. Set
+``TNH_GEN`` to run a different executable.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from scripts.io.ai_memo import AiMemo
+
+PROMPTS_DIR = Path(__file__).resolve().parents[2] / "prompts"
+
+# Batched prompts are named after their single-input prompt with this suffix.
+BATCH_SUFFIX = "_batch"
+
+
+def strip_code_fences(text: str) -> str:
+    """Drop a surrounding markdown code fence (optionally tagged ``json``)."""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.split("```")[1]
+        if text.startswith("json"):
+            text = text[4:]
+        text = text.strip()
+    return text
+
+
+def run_prompt(prompt_key: str, input_text: str, timeout: float = 60) -> Any:
+    """Run ``prompt_key`` on ``input_text`` and return the model's parsed JSON."""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as tmp:
+        tmp.write(input_text)
+        tmp_path = tmp.name
+
+    try:
+        result = subprocess.run(
+            [
+                os.environ.get("TNH_GEN", "tnh-gen"), "--api", "run",
+                "--prompt", prompt_key,
+                "--input-file", tmp_path,
+            ],
+            env={**os.environ, "TNH_PROMPT_DIR": str(PROMPTS_DIR)},
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(
+                f"tnh-gen failed with exit code {result.returncode}.\n"
+                f"stdout: {result.stdout}\n"
+                f"stderr: {result.stderr}"
+            )
+
+        response = json.loads(result.stdout.strip())
+        if response.get("status") != "succeeded":
+            raise RuntimeError(f"tnh-gen extraction failed: {response}")
+        return json.loads(strip_code_fences(response.get("result", {}).get("text", "")))
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def chunk_items(
+    items: dict[str, str],
+    batch_size: int,
+    max_chars: int,
+) -> list[dict[str, str]]:
+    """Split ``id -> text`` into batches of at most ``batch_size`` items and ~``max_chars``."""
+    chunks: list[dict[str, str]] = []
+    current: dict[str, str] = {}
+    size = 0
+    for item_id, text in items.items():
+        if current and (len(current) >= batch_size or size + len(text) > max_chars):
+            chunks.append(current)
+            current, size = {}, 0
+        current[item_id] = text
+        size += len(text)
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def run_batch(
+    prompt_key: str,
+    items: dict[str, str],
+    timeout: float = 60,
+    memo: AiMemo | None = None,
+) -> dict[str, Any | Exception]:
+    """Results for ``id -> text`` from one batched call, falling back per item.
+
+    Items already in ``memo`` are answered from it. The rest go to the
+    ``<prompt_key>_batch`` prompt as ``[{"id": ..., "text": ...}]``, which
+    answers with an object keyed by id. Ids the model dropped, and every item
+    of a batch that failed outright, are retried one at a time with
+    ``prompt_key``. Items that still fail map to their exception; the others
+    are added to ``memo``.
+    """
+    results: dict[str, Any | Exception] = {}
+    if memo is not None:
+        for item_id, text in items.items():
+            hit = memo.get(prompt_key, text)
+            if hit is not None:
+                results[item_id] = hit
+    todo = {item_id: text for item_id, text in items.items() if item_id not in results}
+
+    if len(todo) > 1:
+        payload = json.dumps([{"id": item_id, "text": text} for item_id, text in todo.items()], ensure_ascii=False)
+        try:
+            answered = run_prompt(prompt_key + BATCH_SUFFIX, payload, timeout * len(todo))
+        except Exception as exc:
+            print(f"Batch of {len(todo)} failed, retrying one at a time: {exc}")
+            answered = {}
+        if isinstance(answered, dict):
+            results.update((item_id, answered[item_id]) for item_id in todo if isinstance(answered.get(item_id), dict))
+
+    for item_id, text in todo.items():
+        if item_id not in results:
+            try:
+                results[item_id] = run_prompt(prompt_key, text, timeout)
+            except Exception as exc:
+                results[item_id] = exc
+    if memo is not None:
+        remember(memo, prompt_key, todo, results)
+    return results
+
+
+def remember(
+    memo: AiMemo,
+    prompt_key: str,
+    items: dict[str, str],
+    results: dict[str, Any | Exception],
+) -> None:
+    """Add the successful ``results`` for ``items`` to ``memo``."""
+    for item_id, text in items.items():
+        result = results.get(item_id)
+        if result is not None and not isinstance(result, Exception):
+            memo.put(prompt_key, text, result)
+
+
+class PromptBatcher:
+    """Collect prompt inputs from many coroutines and run them in batches.
+
+    ``submit`` waits for its own result. A batch is sent once ``batch_size``
+    items are queued, or ``linger`` seconds after the first one arrived, and
+    runs in a worker thread so fetches keep going meanwhile. Inputs found in
+    ``memo`` are answered at once without joining a batch.
+    """
+
+    def __init__(
+        self,
+        prompt_key: str,
+        batch_size: int = 20,
+        max_chars: int = 60_000,
+        linger: float = 0.5,
+        timeout: float = 60,
+        memo: AiMemo | None = None,
+    ) -> None:
+        self.prompt_key = prompt_key
+        self.batch_size = batch_size
+        self.max_chars = max_chars
+        self.linger = linger
+        self.timeout = timeout
+        self.memo = memo
+        self.batches = 0
+        self._pending: dict[str, tuple[str, asyncio.Future]] = {}
+        self._size = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task] = set()
+
+    async def submit(self, item_id: str, text: str) -> Any:
+        if self.memo is not None:
+            hit = self.memo.get(self.prompt_key, text)
+            if hit is not None:
+                return hit
+        loop = asyncio.get_running_loop()
+        if item_id in self._pending:
+            raise ValueError(f"Duplicate batch item id {item_id!r}")
+        if self._pending and self._size + len(text) > self.max_chars:
+            self._flush()
+        future = loop.create_future()
+        self._pending[item_id] = (text, future)
+        self._size += len(text)
+        if len(self._pending) >= self.batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.linger, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending, self._size = self._pending, {}, 0
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    def _extract(self, items: dict[str, str]) -> dict[str, Any | Exception]:
+        # submit() already looked these up, so only record the new answers.
+        results = run_batch(self.prompt_key, items, self.timeout)
+        if self.memo is not None:
+            remember(self.memo, self.prompt_key, items, results)
+        return results
+
+    async def _run(self, pending: dict[str, tuple[str, asyncio.Future]]) -> None:
+        self.batches += 1
+        items = {item_id: text for item_id, (text, _) in pending.items()}
+        try:
+            results = await asyncio.to_thread(self._extract, items)
+        except Exception as exc:
+            results = {item_id: exc for item_id in items}
+        for item_id, (_, future) in pending.items():
+            if future.done():
+                continue
+            result = results[item_id]
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
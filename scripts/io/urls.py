@@ -0,0 +1,46 @@
+"""Canonical forms of supplier URLs, for deduplicating rows and crawled links."""
+
+from __future__ import annotations
+
+import re
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Query keys added by campaigns and analytics; never part of a page's identity.
+TRACKING_PARAMS = ("utm_", "gclid", "fbclid", "msclkid", "mc_cid", "mc_eid", "_ga", "srsltid")
+
+
+def _is_tracking(key: str) -> bool:
+    return key.lower().startswith(TRACKING_PARAMS)
+
+
+def canonical_url(url: str, keep_query: bool = True) -> str:
+    """Lowercase scheme and host, no default port, fragment, or tracking params.
+
+    Duplicate slashes in the path are collapsed and the remaining query
+    parameters are sorted. With ``keep_query=False`` the query is dropped
+    entirely, which is what product pages need: their ``?`` parameters pick
+    a packet size or variant of the same page.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    netloc = host if port is None or DEFAULT_PORTS.get(scheme) == port else f"{host}:{port}"
+    path = re.sub(r"/{2,}", "/", parts.path) or "/"
+    query = ""
+    if keep_query:
+        pairs = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True) if not _is_tracking(key)]
+        query = urlencode(sorted(pairs))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def product_url(url: str) -> str:
+    """Canonical product page URL: ``canonical_url`` without any query."""
+    return canonical_url(url, keep_query=False)
+
+
+def is_http_url(value: object) -> bool:
+    """True for absolute http(s) URL strings, e.g. not a CSV description row."""
+    return isinstance(value, str) and urlsplit(value.strip()).scheme in DEFAULT_PORTS
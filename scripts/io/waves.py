@@ -1,9 +1,12 @@
-"""Wave identifier helpers."""
+"""Wave identifier and occupancy window helpers."""
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
+from scripts.io.schema import validate_required_columns
+
 
 def build_wave_id(
     crop: str,
@@ -34,3 +37,52 @@ def apply_wave_id(df: pd.DataFrame) -> pd.DataFrame:
             axis=1,
         )
     return df
+
+
+def harvest_durations(df_schedule: pd.DataFrame) -> pd.Series:
+    """Harvest window per schedule row as a timedelta.
+
+    ``harvest_weeks_per_planting`` weeks, falling back to ``succession_days``
+    and then to one week.
+    """
+    if "harvest_weeks_per_planting" in df_schedule.columns:
+        harvest_weeks = pd.to_numeric(df_schedule["harvest_weeks_per_planting"], errors="coerce")
+    else:
+        harvest_weeks = pd.Series(np.nan, index=df_schedule.index)
+    if "succession_days" in df_schedule.columns:
+        fallback = pd.to_numeric(df_schedule["succession_days"], errors="coerce") / 7
+        harvest_weeks = harvest_weeks.fillna(fallback)
+    harvest_weeks = harvest_weeks.fillna(1.0)
+    return pd.to_timedelta(harvest_weeks * 7, unit="D")
+
+
+def occupancy_windows(df_assignments: pd.DataFrame, df_schedule: pd.DataFrame) -> pd.DataFrame:
+    """Attach ``occupied_from``/``occupied_until`` dates to each assignment.
+
+    A crop occupies its blocks from its plant_date through days to maturity
+    (first_harvest_date - plant_date in the schedule) plus its harvest window of
+    ``harvest_weeks_per_planting`` weeks (falling back to ``succession_days``).
+    BENEFICIAL rows have no dates and occupy their blocks all season.
+    """
+    validate_required_columns(
+        df_schedule,
+        ["wave_id", "plant_date", "first_harvest_date"],
+        "succession schedule",
+    )
+    waves = df_schedule[["wave_id", "plant_date", "first_harvest_date"]].copy()
+    days_to_maturity = pd.to_datetime(waves["first_harvest_date"]) - pd.to_datetime(
+        waves["plant_date"]
+    )
+    waves = pd.DataFrame(
+        {
+            "wave_id": waves["wave_id"],
+            "_maturity": days_to_maturity,
+            "_harvest": harvest_durations(df_schedule),
+        }
+    )
+
+    df = df_assignments.merge(waves, on="wave_id", how="left")
+    planted = pd.to_datetime(df["plant_date"], errors="coerce")
+    df["occupied_from"] = planted
+    df["occupied_until"] = planted + df["_maturity"] + df["_harvest"]
+    return df.drop(columns=["_maturity", "_harvest"])
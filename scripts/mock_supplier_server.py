@@ -0,0 +1,226 @@
+#!/usr/bin/env -S uv run python
+"""Serve recorded supplier pages locally for offline scraper runs and benchmarks.
+
+Pages under ``<corpus>/pages`` are served by path: ``/sdsc/<slug>/`` maps to
+``pages/sdsc/<slug>.html`` and ``/js/<page>.html`` to ``pages/js/<page>.html``.
+Responses carry an ETag and Last-Modified, and conditional requests get a 304.
+Latency, server errors, and 429 throttling can be injected, and ``/__stats``
+reports what was served.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+
+DEFAULT_CORPUS = Path("tests/fixtures/suppliers")
+
+
+@dataclass(frozen=True)
+class MockBehavior:
+    """Injected faults and delays, applied per request."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    throttle_rate: float = 0.0
+    retry_after: int = 1
+    fail_first: int = 0
+    seed: int = 0
+
+
+class MockSupplierServer:
+    """Threaded HTTP server replaying a fixture corpus; use as a context manager."""
+
+    def __init__(
+        self,
+        corpus: Path = DEFAULT_CORPUS,
+        behavior: MockBehavior = MockBehavior(),
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.pages_dir = corpus / "pages"
+        if not self.pages_dir.is_dir():
+            raise ValueError(f"Corpus has no pages directory: {self.pages_dir}")
+        self.behavior = behavior
+        self.stats: Counter[str] = Counter()
+        self.path_hits: Counter[str] = Counter()
+        self._random = random.Random(behavior.seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> MockSupplierServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def page_path(self, url_path: str) -> Path | None:
+        relative = url_path.split("?", 1)[0].strip("/")
+        if not relative or ".." in relative.split("/"):
+            return None
+        path = self.pages_dir / relative
+        if path.suffix != ".html":
+            path = path.with_name(path.name + ".html")
+        return path if path.is_file() else None
+
+    def _decide(self, url_path: str) -> tuple[str, float]:
+        """``(outcome, delay_s)`` for one request: ok, throttled, or error."""
+        behavior = self.behavior
+        with self._lock:
+            self.path_hits[url_path] += 1
+            seen = self.path_hits[url_path]
+            delay = (behavior.latency_ms + self._random.uniform(0, behavior.jitter_ms)) / 1000
+            roll = self._random.random()
+        if seen <= behavior.fail_first or roll < behavior.throttle_rate:
+            return "throttled", delay
+        if roll < behavior.throttle_rate + behavior.error_rate:
+            return "error", delay
+        return "ok", delay
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self.stats[key] += 1
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+            def _send(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+                self.send_response(status)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body and self.command != "HEAD":
+                    self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                if self.path == "/__stats":
+                    with server._lock:
+                        stats = {**server.stats, "paths": dict(server.path_hits)}
+                    self._send(200, json.dumps(stats).encode(), {"Content-Type": "application/json"})
+                    return
+
+                server._count("requests")
+                page = server.page_path(self.path)
+                if page is None:
+                    server._count("not_found")
+                    self._send(404, b"Not found")
+                    return
+
+                outcome, delay = server._decide(self.path)
+                time.sleep(delay)
+                if outcome == "throttled":
+                    server._count("throttled")
+                    self._send(429, b"Too many requests", {"Retry-After": str(server.behavior.retry_after)})
+                    return
+                if outcome == "error":
+                    server._count("errors")
+                    self._send(500, b"Server error")
+                    return
+
+                body = page.read_bytes()
+                validators = {
+                    "ETag": f'"{hashlib.sha1(body).hexdigest()}"',
+                    "Last-Modified": formatdate(page.stat().st_mtime, usegmt=True),
+                }
+                if self.headers.get("If-None-Match") == validators["ETag"]:
+                    server._count("not_modified")
+                    self._send(304, headers=validators)
+                    return
+                with server._lock:
+                    server.stats["ok"] += 1
+                    server.stats["bytes"] += len(body)
+                self._send(200, body, {"Content-Type": "text/html; charset=utf-8", **validators})
+
+            do_HEAD = do_GET
+
+        return Handler
+
+
+def write_fixture_plants(corpus: Path, base_url: str, output: Path) -> pd.DataFrame:
+    """Write ``<corpus>/plants.csv`` with its page paths pointed at ``base_url``."""
+    df = pd.read_csv(corpus / "plants.csv")
+    df["url"] = base_url.rstrip("/") + df["url"]
+    output.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(output, index=False)
+    return df
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", default=str(DEFAULT_CORPUS), help="Fixture corpus directory")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Delay added to every page")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="Random extra delay, up to this much")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of pages answered with a 500")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of pages answered with a 429")
+    parser.add_argument("--retry-after", type=int, default=1, help="Retry-After seconds sent with a 429")
+    parser.add_argument("--fail-first", type=int, default=0, help="Throttle the first N requests to each page")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for latency jitter and injected faults")
+    parser.add_argument(
+        "--write-plants",
+        default=None,
+        help="Also write the corpus plant CSV with URLs pointing at this server",
+    )
+    args = parser.parse_args()
+
+    corpus = Path(args.corpus)
+    behavior = MockBehavior(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        fail_first=args.fail_first,
+        seed=args.seed,
+    )
+    try:
+        server = MockSupplierServer(corpus, behavior, args.host, args.port)
+        if args.write_plants:
+            write_fixture_plants(corpus, server.base_url, Path(args.write_plants))
+            print(f"Saved fixture plants to {args.write_plants}")
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    print(f"Serving {corpus} at {server.base_url} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print(f"Served: {dict(server.stats)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
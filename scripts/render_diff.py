@@ -0,0 +1,330 @@
+#!/usr/bin/env -S uv run python
+"""Render the cell-level differences between two bed assignment plans."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.io.render_cache import RenderCache
+from scripts.render_grid import (
+    GridLayout,
+    LayoutLabel,
+    LayoutRect,
+    RectStyle,
+    build_runs,
+    compute_run_ids,
+    grid_geometry,
+    load_crop_codes,
+    load_grid_layout,
+    load_jsonl_config,
+    warn_missing_crop_codes,
+    write_grid_png,
+    write_grid_svg,
+)
+
+COMPARE_COLUMNS = ["status", "crop", "variety", "wave_id"]
+
+CHANGE_KINDS = ["added", "removed", "changed_crop", "moved_wave", "changed_status"]
+
+DEFAULT_CHANGE_COLORS = {
+    "added": "#2A9D8F",
+    "removed": "#D62828",
+    "changed_crop": "#F4A261",
+    "moved_wave": "#457B9D",
+    "changed_status": "#8E7DBE",
+}
+
+HIGHLIGHT_ALPHA = 0.5
+
+TABLE_COLUMNS = [
+    "bed_id",
+    "start_ft",
+    "end_ft",
+    "change",
+    "base_crop",
+    "base_variety",
+    "base_wave_id",
+    "new_crop",
+    "new_variety",
+    "new_wave_id",
+]
+
+
+def classify_changes(base_grid: pd.DataFrame, new_grid: pd.DataFrame) -> pd.DataFrame:
+    """Label every cell unchanged, added, removed, changed_crop, moved_wave, or changed_status.
+
+    Both grids come from ``build_grid`` on the same geometry, so cells line
+    up row for row. A cell is ``moved_wave`` when it now holds a crop wave that
+    sat elsewhere in the base plan, or the same crop and variety on a different
+    wave (date); other crop swaps are ``changed_crop``.
+    """
+    cell_keys = ["bed_id", "block_idx"]
+    if len(base_grid) != len(new_grid) or not (
+        base_grid[cell_keys].to_numpy() == new_grid[cell_keys].to_numpy()
+    ).all():
+        raise ValueError("Plans must share the same bed geometry to be compared")
+
+    base = {col: base_grid[col].fillna("").astype(str).to_numpy() for col in COMPARE_COLUMNS}
+    new = {col: new_grid[col].fillna("").astype(str).to_numpy() for col in COMPARE_COLUMNS}
+    base_crop = base["status"] == "CROP"
+    new_crop = new["status"] == "CROP"
+    unchanged = np.logical_and.reduce([base[col] == new[col] for col in COMPARE_COLUMNS])
+    same_crop = (base["crop"] == new["crop"]) & (base["variety"] == new["variety"])
+    wave_moved_in = new_crop & (base["wave_id"] != new["wave_id"]) & np.isin(
+        new["wave_id"], np.unique(base["wave_id"][base_crop])
+    )
+
+    change = np.select(
+        [
+            unchanged,
+            wave_moved_in,
+            ~base_crop & new_crop,
+            base_crop & ~new_crop,
+            base_crop & new_crop & ~same_crop,
+            base_crop & new_crop,
+        ],
+        ["unchanged", "moved_wave", "added", "removed", "changed_crop", "moved_wave"],
+        default="changed_status",
+    )
+
+    cells = base_grid[cell_keys].copy()
+    cells["change"] = change
+    for col in COMPARE_COLUMNS:
+        cells[f"base_{col}"] = base[col]
+        cells[f"new_{col}"] = new[col]
+    return cells
+
+
+def change_runs(cells: pd.DataFrame, block_size_ft: int) -> pd.DataFrame:
+    """Merge adjacent changed cells with the same change and plans into runs."""
+    changed = cells[cells["change"] != "unchanged"].copy()
+    if changed.empty:
+        return pd.DataFrame(columns=["start_block", "end_block", *TABLE_COLUMNS])
+    key_columns = ["change", *(f"{side}_{col}" for side in ("base", "new") for col in COMPARE_COLUMNS)]
+    changed["run_id"] = compute_run_ids(changed, key_columns)
+    runs = build_runs(changed)
+    runs["start_ft"] = runs["start_block"] * block_size_ft
+    runs["end_ft"] = runs["end_block"] * block_size_ft
+    return runs
+
+
+def highlight_layout(
+    layout: GridLayout,
+    runs: pd.DataFrame,
+    visuals: dict,
+    change_colors: dict[str, str],
+) -> GridLayout:
+    """Copy of ``layout`` with changed runs tinted on top and a legend row below."""
+    cell_size = int(visuals.get("cell_size", 40))
+    row_label_width = int(visuals.get("row_label_width", cell_size))
+    legend_height = cell_size / 2
+
+    diff = replace(
+        layout,
+        height=layout.height + legend_height,
+        styles=dict(layout.styles),
+        rects=list(layout.rects),
+        labels=list(layout.labels),
+    )
+    for kind in CHANGE_KINDS:
+        diff.styles[f"diff-{kind}"] = RectStyle(change_colors[kind], HIGHLIGHT_ALPHA, "dashed")
+
+    for row in runs.to_dict("records"):
+        diff.rects.append(
+            LayoutRect(
+                row_label_width + row["start_block"] * cell_size,
+                (row["bed_id"] - 1) * cell_size,
+                (row["end_block"] - row["start_block"]) * cell_size,
+                cell_size,
+                f"diff-{row['change']}",
+            )
+        )
+
+    counts = runs.groupby("change").size() if not runs.empty else pd.Series(dtype=int)
+    slot = layout.width / len(CHANGE_KINDS)
+    swatch = legend_height * 0.6
+    for idx, kind in enumerate(CHANGE_KINDS):
+        x = idx * slot
+        y = layout.height + (legend_height - swatch) / 2
+        diff.rects.append(LayoutRect(x + 4, y, swatch, swatch, f"diff-{kind}"))
+        label = f"{kind.replace('_', ' ')} ({int(counts.get(kind, 0))})"
+        diff.labels.append(
+            LayoutLabel(x + 4 + swatch + (slot - swatch - 8) / 2, layout.height + legend_height / 2, (label,), "tr")
+        )
+    return diff
+
+
+def render_diff(
+    base_path: Path,
+    plan_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_svg: Path,
+    output_png: Path | None,
+    output_table: Path,
+    schema_version: int,
+    png_dpi: float | None = None,
+    png_backend: str = "native",
+    cache: RenderCache | None = None,
+    crop_codes_path: Path | None = None,
+) -> pd.DataFrame:
+    """Diff ``plan_path`` against ``base_path``; return the change table.
+
+    Grids come from the render cache when one is given, so a base plan that
+    was already rendered (or diffed) is not rebuilt.
+    """
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    crop_codes = load_crop_codes(crop_codes_path, schema_version)
+    grid_geometry(geometry)
+
+    base_grid, _, _ = load_grid_layout(
+        base_path,
+        schedule_path,
+        geometry_path,
+        visuals_path,
+        schema_version,
+        geometry,
+        visuals,
+        crop_codes,
+        cache,
+    )
+    new_grid, new_layout, _ = load_grid_layout(
+        plan_path,
+        schedule_path,
+        geometry_path,
+        visuals_path,
+        schema_version,
+        geometry,
+        visuals,
+        crop_codes,
+        cache,
+    )
+    warn_missing_crop_codes(new_layout.missing_codes)
+    if cache is not None:
+        cache.save()
+
+    cells = classify_changes(base_grid, new_grid)
+    runs = change_runs(cells, int(geometry["block_size_ft"]))
+    change_colors = {**DEFAULT_CHANGE_COLORS, **visuals.get("diff_colors", {})}
+    layout = highlight_layout(new_layout, runs, visuals, change_colors)
+
+    output_svg.parent.mkdir(parents=True, exist_ok=True)
+    with output_svg.open("w", encoding="utf-8") as handle:
+        write_grid_svg(handle, layout)
+    if output_png is not None:
+        output_png.parent.mkdir(parents=True, exist_ok=True)
+        dpi = png_dpi if png_dpi is not None else float(visuals.get("png_dpi", 96))
+        write_grid_png(layout, output_svg, output_png, dpi, png_backend)
+
+    table = runs[TABLE_COLUMNS]
+    output_table.parent.mkdir(parents=True, exist_ok=True)
+    table.to_csv(output_table, index=False)
+    return table
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base", required=True, help="Baseline bed assignments CSV")
+    parser.add_argument("--plan", required=True, help="Changed bed assignments CSV")
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--geometry",
+        default="data/plans/config/bed-geometry.jsonl",
+        help="Path to bed geometry JSONL",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--crop-codes",
+        default="data/plans/config/crop-codes.jsonl",
+        help="Path to crop code JSONL used by compact labels (optional)",
+    )
+    parser.add_argument(
+        "--output-svg",
+        default="exports/bed-grid-diff.svg",
+        help="Path to output diff SVG",
+    )
+    parser.add_argument(
+        "--output-png",
+        default="exports/bed-grid-diff.png",
+        help="Path to output diff PNG",
+    )
+    parser.add_argument(
+        "--output-table",
+        default="exports/bed-grid-diff.csv",
+        help="Path to output change table CSV",
+    )
+    parser.add_argument("--skip-png", action="store_true", help="Skip PNG rasterization")
+    parser.add_argument(
+        "--png-backend",
+        choices=["native", "cairo"],
+        default="native",
+        help="PNG renderer: native painter (default) or CairoSVG from the SVG",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="PNG resolution (default: png_dpi from visuals, else 96)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/render-grid",
+        help="Render cache directory shared with render_grid.py",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Rebuild both grids")
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    output_png = None if args.skip_png else Path(args.output_png)
+    try:
+        table = render_diff(
+            Path(args.base),
+            Path(args.plan),
+            Path(args.schedule),
+            Path(args.geometry),
+            Path(args.visuals),
+            Path(args.output_svg),
+            output_png,
+            Path(args.output_table),
+            args.schema_version,
+            png_dpi=args.dpi,
+            png_backend=args.png_backend,
+            cache=None if args.no_cache else RenderCache(Path(args.cache_dir)),
+            crop_codes_path=Path(args.crop_codes),
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    counts = table["change"].value_counts()
+    summary = ", ".join(f"{kind}: {counts[kind]}" for kind in CHANGE_KINDS if kind in counts)
+    print(f"{len(table)} changed runs ({summary or 'no changes'})")
+    print(f"Saved change table to {args.output_table}")
+    print(f"Saved diff SVG to {args.output_svg}")
+    if output_png is not None:
+        print(f"Saved diff PNG to {args.output_png}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,13 +6,20 @@ from __future__ import annotations
 import argparse
 import html
 import json
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TextIO
 
+import numpy as np
 import pandas as pd
 
-from scripts.build_assignments import build_assignments
+from scripts.build_assignments import load_schedule, validate_assignments
+from scripts.io.raster import paint_png
+from scripts.io.render_cache import RenderCache, cache_key, file_digest, source_fingerprint
 from scripts.io.schema import ensure_jsonl_schema
-from scripts.io.waves import apply_wave_id
+from scripts.io.svg import BORDER_DASHARRAYS, SvgWriter, css_rule, fmt_num
+from scripts.io.text_layout import auto_crop_code, compact_label, fit_label, font_face, wrap_label
 
 
 DEFAULT_STATUS_COLORS = {
@@ -23,6 +30,32 @@ DEFAULT_STATUS_COLORS = {
     "CONFLICT": "#E63946",
 }
 
+FRAME_FILL = "#FFFFFF"
+
+# Horizontal clearance between a label and its cell edges, in px.
+LABEL_PADDING = 2
+
+LABEL_MODES = ("full", "auto", "crop_code")
+
+
+# Modules whose code shapes the rendered outputs; edits invalidate the render cache.
+RENDERER_SOURCES = tuple(
+    Path(__file__).parent / name
+    for name in (
+        "render_grid.py",
+        "build_assignments.py",
+        "io/raster.py",
+        "io/schema.py",
+        "io/svg.py",
+        "io/text_layout.py",
+        "io/font_metrics.json",
+        "io/waves.py",
+    )
+)
+
+# Cells merge into one run only when all of these match (plus bed and adjacency).
+RUN_KEY_COLUMNS = ["status", "crop", "variety", "wave_id", "conflict_details"]
+
 
 def load_jsonl_config(path: Path, schema_version: int) -> dict:
     ensure_jsonl_schema(path, schema_version)
@@ -36,54 +69,17 @@ def load_jsonl_config(path: Path, schema_version: int) -> dict:
     return config
 
 
-def _reserved_label(status: str, reserved_labels: dict[str, str]) -> str:
-    return reserved_labels.get(status, status)
-
-
-def fit_text(text: str, max_chars: int) -> str:
-    if max_chars <= 0:
-        return ""
-    if len(text) <= max_chars:
-        return text
-    if max_chars <= 3:
-        return text[:max_chars]
-    return text[: max_chars - 3] + "..."
-
+def load_crop_codes(path: Path | None, schema_version: int) -> dict[str, str]:
+    """Crop name -> short code from crop-codes.jsonl; empty when the file is absent."""
+    if path is None or not path.exists():
+        return {}
+    codes = load_jsonl_config(path, schema_version)
+    codes.pop("schema_version", None)
+    return codes
 
-def _line_capacity(font_size: int, width_px: float) -> int:
-    # Rough width estimate: average character ~0.6 * font_size
-    return max(1, int(width_px / (font_size * 0.6)))
-
-
-def wrap_text(text: str, max_chars: int, max_lines: int) -> list[str]:
-    if max_chars <= 0 or max_lines <= 0:
-        return []
-    words = text.split()
-    if not words:
-        return [fit_text(text, max_chars)]
-
-    lines: list[str] = []
-    current = ""
-    for word in words:
-        candidate = word if not current else f"{current} {word}"
-        if len(candidate) <= max_chars:
-            current = candidate
-        else:
-            if current:
-                lines.append(current)
-            current = word
-        if len(lines) >= max_lines:
-            break
 
-    if len(lines) < max_lines and current:
-        lines.append(current)
-
-    if len(lines) > max_lines:
-        lines = lines[:max_lines]
-
-    if lines and len(lines) == max_lines and " ".join(words).strip() != " ".join(lines).strip():
-        lines[-1] = fit_text(lines[-1], max_chars)
-    return lines
+def _reserved_label(status: str, reserved_labels: dict[str, str]) -> str:
+    return reserved_labels.get(status, status)
 
 
 def build_crop_label_lines(
@@ -91,11 +87,31 @@ def build_crop_label_lines(
     variety: str,
     width_px: float,
     font_size: int,
+    font_family: str = "Helvetica",
+    label_mode: str = "full",
+    crop_codes: dict[str, str] | None = None,
+    missing_codes: set[str] | None = None,
 ) -> list[str]:
-    max_chars = _line_capacity(font_size, width_px)
-    crop_lines = wrap_text(crop, max_chars, 1)
-    variety_lines = wrap_text(variety, max_chars, 1)
-    return [crop_lines[0] if crop_lines else "", variety_lines[0] if variety_lines else ""]
+    """Crop and variety lines fitted to ``width_px``.
+
+    ``label_mode`` "crop_code" always uses the compact ``CODE.-VAR.`` label;
+    "auto" uses it only when the full crop or variety name would be cut.
+    Compact-labelled crops without a code are added to ``missing_codes``.
+    """
+    width = width_px - 2 * LABEL_PADDING
+    if label_mode not in LABEL_MODES:
+        raise ValueError(f"Unknown label_mode {label_mode!r}; expected one of {LABEL_MODES}")
+    if label_mode != "crop_code":
+        crop_line = wrap_label(crop, font_family, font_size, width, 1)
+        variety_line = wrap_label(variety, font_family, font_size, width, 1)
+        full = [crop_line[0] if crop_line else "", variety_line[0] if variety_line else ""]
+        if label_mode == "full" or full == [crop, variety]:
+            return full
+
+    crop_codes = crop_codes or {}
+    if crop not in crop_codes and missing_codes is not None:
+        missing_codes.add(crop)
+    return [fit_label(compact_label(crop, variety, crop_codes), font_family, font_size, width)]
 
 
 def build_conflict_label_lines(
@@ -103,78 +119,331 @@ def build_conflict_label_lines(
     width_px: float,
     font_size: int,
     max_lines: int,
+    font_family: str = "Helvetica",
 ) -> list[str]:
-    max_chars = _line_capacity(font_size, width_px)
+    width = width_px - 2 * LABEL_PADDING
     lines = ["!"]
     available = max_lines - 1
     truncated = details[:available]
     for item in truncated:
-        lines.append(fit_text(item, max_chars))
+        lines.append(fit_label(item, font_family, font_size, width))
     if len(details) > available:
         lines.append("+" + str(len(details) - available) + " more")
     return lines
 
 
-def _svg_text(
-    x: float,
-    y: float,
-    lines: list[str],
-    font_size: int,
-    font_family: str,
-    fill: str,
-) -> str:
-    if not lines:
-        return ""
-    line_height = font_size * 1.2
-    total_height = line_height * len(lines)
-    start_y = y - total_height / 2 + font_size
-    parts = [
-        f'<text x="{x}" y="{start_y}" text-anchor="middle" '
-        f'font-size="{font_size}" font-family="{html.escape(font_family)}" '
-        f'fill="{fill}">'
-    ]
-    for idx, line in enumerate(lines):
-        dy = 0 if idx == 0 else line_height
-        parts.append(
-            f'<tspan x="{x}" dy="{dy}">{html.escape(line)}</tspan>'
+def compute_run_ids(grid: pd.DataFrame, key_columns: list[str] = RUN_KEY_COLUMNS) -> pd.Series:
+    """Return a run id per cell, aligned to ``grid.index``.
+
+    Cells are sorted by bed and block once; a run starts wherever the bed, the
+    run key, or block contiguity differs from the previous cell. Run ids are the
+    cumulative count of run starts, numbered in bed/block order.
+    """
+    ordered = grid.sort_values(["bed_id", "block_idx"], kind="stable")
+    keys = ordered[key_columns].fillna("")
+    bed_ids = ordered["bed_id"]
+    block_idx = ordered["block_idx"]
+
+    starts = (
+        (keys != keys.shift()).any(axis=1)
+        | (bed_ids != bed_ids.shift())
+        | (block_idx != block_idx.shift() + 1)
+    )
+    run_ids = starts.cumsum() - 1
+    return run_ids.reindex(grid.index).rename("run_id")
+
+
+def build_runs(grid: pd.DataFrame) -> pd.DataFrame:
+    """Collapse a grid with ``run_id`` into one row per merged run.
+
+    Each run keeps the columns of its first cell, with ``block_idx`` replaced by
+    ``start_block``/``end_block`` (end exclusive).
+    """
+    ordered = grid.sort_values(["run_id", "block_idx"], kind="stable")
+    runs = ordered.drop_duplicates("run_id").rename(columns={"block_idx": "start_block"})
+    end_blocks = ordered.groupby("run_id")["block_idx"].max() + 1
+    runs.insert(
+        runs.columns.get_loc("start_block") + 1,
+        "end_block",
+        runs["run_id"].map(end_blocks),
+    )
+    return runs.reset_index(drop=True)
+
+
+@dataclass(frozen=True)
+class RectStyle:
+    fill: str
+    alpha: float = 1.0
+    border: str = "solid"
+
+
+@dataclass(frozen=True)
+class LayoutRect:
+    x: float
+    y: float
+    width: float
+    height: float
+    style: str
+
+
+@dataclass(frozen=True)
+class LayoutLabel:
+    x: float
+    y: float
+    lines: tuple[str, ...]
+    font: str
+
+
+@dataclass
+class GridLayout:
+    """Backend-neutral scene: positioned rectangles and centered labels.
+
+    ``styles`` maps each rect style key to its fill/alpha/border and ``fonts``
+    maps each label font key to a pixel size; backends only draw what is here.
+    ``missing_codes`` lists crops labelled with an automatic code.
+    """
+
+    width: float
+    height: float
+    font_family: str
+    fonts: dict[str, int]
+    styles: dict[str, RectStyle]
+    rects: list[LayoutRect] = field(default_factory=list)
+    labels: list[LayoutLabel] = field(default_factory=list)
+    stroke: str = "#333333"
+    text_fill: str = "#111111"
+    missing_codes: set[str] = field(default_factory=set)
+
+
+def build_grid_layout(
+    runs: pd.DataFrame,
+    bed_notes: dict[int, str],
+    bed_count: int,
+    blocks_per_bed: int,
+    visuals: dict,
+    reserved_labels: dict[str, str],
+    crop_codes: dict[str, str] | None = None,
+) -> GridLayout:
+    """Place the bed-number column, run cells, notes column, and all labels."""
+    cell_size = int(visuals.get("cell_size", 40))
+    label_font_size = int(visuals.get("label_font_size", 10))
+    conflict_font_size = int(visuals.get("conflict_font_size", 8))
+    reserved_font_size = int(visuals.get("reserved_font_size", 9))
+    conflict_max_lines = int(visuals.get("conflict_max_lines", 4))
+    row_label_width = int(visuals.get("row_label_width", cell_size))
+    notes_width_ratio = float(visuals.get("notes_col_width_ratio", 0.33))
+    font_family = visuals.get("font_family", "Helvetica")
+    label_mode = visuals.get("label_mode", "full")
+
+    grid_width = blocks_per_bed * cell_size
+    notes_width = int(grid_width * notes_width_ratio)
+    x_offset = row_label_width
+    notes_x = x_offset + grid_width
+
+    layout = GridLayout(
+        width=row_label_width + grid_width + notes_width,
+        height=bed_count * cell_size,
+        font_family=font_family,
+        fonts={"tl": label_font_size, "tc": conflict_font_size, "tr": reserved_font_size},
+        styles={"frame": RectStyle(FRAME_FILL)},
+    )
+
+    # Row number column
+    for bed_id in range(1, bed_count + 1):
+        y = (bed_id - 1) * cell_size
+        layout.rects.append(LayoutRect(0, y, row_label_width, cell_size, "frame"))
+        layout.labels.append(
+            LayoutLabel(row_label_width / 2, y + cell_size / 2, (str(bed_id),), "tr")
         )
-    parts.append("</text>")
-    return "".join(parts)
 
+    # Notes column
+    notes_text_width = notes_width - 2 * LABEL_PADDING
+    for bed_id in range(1, bed_count + 1):
+        y = (bed_id - 1) * cell_size
+        layout.rects.append(LayoutRect(notes_x, y, notes_width, cell_size, "frame"))
+        notes_text = bed_notes.get(bed_id, "")
+        if notes_text:
+            lines = wrap_label(notes_text, font_family, reserved_font_size, notes_text_width, 2)
+            layout.labels.append(
+                LayoutLabel(notes_x + notes_width / 2, y + cell_size / 2, tuple(lines), "tr")
+            )
 
-def render_grid(
-    assignments_path: Path,
-    schedule_path: Path,
-    geometry_path: Path,
-    visuals_path: Path,
-    output_csv: Path,
-    output_svg: Path,
-    output_png: Path | None,
-    schema_version: int,
-) -> pd.DataFrame:
-    geometry = load_jsonl_config(geometry_path, schema_version)
-    visuals = load_jsonl_config(visuals_path, schema_version)
+    # Grid runs
+    style_keys: dict[RectStyle, str] = {}
+    for row in runs.to_dict("records"):
+        style = RectStyle(row["color"], float(row["alpha"]), row["border_style"])
+        style_key = style_keys.get(style)
+        if style_key is None:
+            style_key = f"s{len(style_keys)}"
+            style_keys[style] = style_key
+            layout.styles[style_key] = style
+
+        status = row["status"]
+        x = x_offset + row["start_block"] * cell_size
+        y = (row["bed_id"] - 1) * cell_size
+        run_width = (row["end_block"] - row["start_block"]) * cell_size
+        layout.rects.append(LayoutRect(x, y, run_width, cell_size, style_key))
 
+        lines: list[str] = []
+        if status == "CROP":
+            lines = build_crop_label_lines(
+                row["crop"],
+                row["variety"],
+                run_width,
+                label_font_size,
+                font_family,
+                label_mode,
+                crop_codes,
+                layout.missing_codes,
+            )
+            font = "tl"
+        elif status == "CONFLICT":
+            details = row["conflict_details"].split(" | ") if row["conflict_details"] else []
+            lines = build_conflict_label_lines(
+                details,
+                run_width,
+                conflict_font_size,
+                conflict_max_lines,
+                font_family,
+            )
+            font = "tc"
+        elif status in ("FLOWER", "BENEFICIAL"):
+            label = _reserved_label(status, reserved_labels)
+            lines = [
+                fit_label(label, font_family, reserved_font_size, run_width - 2 * LABEL_PADDING)
+            ]
+            font = "tr"
+        if lines:
+            layout.labels.append(
+                LayoutLabel(x + run_width / 2, y + cell_size / 2, tuple(lines), font)
+            )
+
+    return layout
+
+
+def warn_missing_crop_codes(crops: set[str]) -> None:
+    """Print one warning per crop that was labelled with an automatic code."""
+    for crop in sorted(crops):
+        print(f"Warning: No crop code for {crop}, using {auto_crop_code(crop)}")
+
+
+def write_grid_svg(handle: TextIO, layout: GridLayout) -> None:
+    """Stream ``layout`` as SVG to an open text handle.
+
+    Every rect style and font becomes one CSS class. Rect shapes and labels
+    that occur more than once are declared in <defs> and placed with <use>.
+    """
+    rules = [
+        css_rule("rect", {"stroke": layout.stroke, "stroke-width": 1}),
+        css_rule(
+            "text",
+            {
+                "font-family": html.escape(layout.font_family),
+                "text-anchor": "middle",
+                "fill": layout.text_fill,
+            },
+        ),
+    ]
+    for font, size in layout.fonts.items():
+        rules.append(css_rule(f".{font}", {"font-size": f"{size}px"}))
+    for style_key, style in layout.styles.items():
+        props: dict[str, object] = {"fill": style.fill}
+        if style.alpha != 1.0:
+            props["fill-opacity"] = fmt_num(style.alpha)
+        if style.border in BORDER_DASHARRAYS:
+            props["stroke-dasharray"] = BORDER_DASHARRAYS[style.border]
+        rules.append(css_rule(f".{style_key}", props))
+
+    shape_counts = Counter((r.width, r.height, r.style) for r in layout.rects)
+    shape_ids = {
+        shape: f"r{idx}"
+        for idx, shape in enumerate(s for s, count in shape_counts.items() if count > 1)
+    }
+    label_counts = Counter((label.lines, label.font) for label in layout.labels)
+    label_ids = {
+        key: f"t{idx}"
+        for idx, key in enumerate(k for k, count in label_counts.items() if count > 1)
+    }
+
+    with SvgWriter(handle, layout.width, layout.height) as svg:
+        svg.style(rules)
+        svg.start_defs()
+        for (width, height, style_key), symbol_id in shape_ids.items():
+            svg.symbol_rect(symbol_id, width, height, style_key)
+        for (lines, font), symbol_id in label_ids.items():
+            svg.symbol_text(symbol_id, list(lines), layout.fonts[font], font)
+        svg.end_defs()
+
+        for rect in layout.rects:
+            symbol_id = shape_ids.get((rect.width, rect.height, rect.style))
+            if symbol_id is not None:
+                svg.use(symbol_id, rect.x, rect.y)
+            else:
+                svg.rect(rect.x, rect.y, rect.width, rect.height, rect.style)
+        for label in layout.labels:
+            symbol_id = label_ids.get((label.lines, label.font))
+            if symbol_id is not None:
+                svg.use(symbol_id, label.x, label.y)
+            else:
+                svg.text(label.x, label.y, list(label.lines), layout.fonts[label.font], label.font)
+
+
+def write_grid_png(
+    layout: GridLayout,
+    svg_path: Path | None,
+    output_png: Path,
+    dpi: float,
+    backend: str = "native",
+) -> None:
+    """Rasterize the grid with the native painter or by re-reading the SVG."""
+    if backend == "native":
+        paint_png(layout, output_png, dpi)
+        return
+    if backend != "cairo":
+        raise ValueError(f"Unknown PNG backend: {backend}")
+    if svg_path is None:
+        raise ValueError("The cairo PNG backend rasterizes the SVG output; enable it")
+    try:
+        import cairosvg
+
+        cairosvg.svg2png(url=str(svg_path), write_to=str(output_png), scale=dpi / 96)
+    except Exception as exc:  # pragma: no cover - runtime-only dependency
+        print(f"Warning: PNG rasterization failed: {exc}")
+
+
+def grid_geometry(geometry: dict) -> tuple[int, int]:
+    """Return ``(bed_count, blocks_per_bed)`` after validating the bed layout."""
     bed_count = int(geometry["bed_count"])
     bed_length_ft = int(geometry["bed_length_ft"])
     block_size_ft = int(geometry["block_size_ft"])
     if bed_length_ft % block_size_ft != 0:
         raise ValueError("bed_length_ft must be divisible by block_size_ft")
+    return bed_count, bed_length_ft // block_size_ft
 
-    blocks_per_bed = bed_length_ft // block_size_ft
-    flower_blocks = geometry.get("flower_blocks", [])
-    beneficial_block = geometry.get("beneficial_block")
-    reserved_labels = geometry.get("reserved_labels", {})
 
-    df_assignments = build_assignments(
-        assignments_path,
-        schedule_path,
-        geometry_path,
-        schema_version,
+def load_assignments(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    schema_version: int,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Validate assignments and attach ``family``/``water`` from the schedule.
+
+    Returns ``(df_assignments, df_schedule)``; the schedule carries ``wave_id``
+    so callers can join further wave columns without re-reading it.
+    """
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    df_schedule = load_schedule(schedule_path)
+    df_assignments = validate_assignments(
+        pd.read_csv(assignments_path, comment="#"),
+        df_schedule,
+        geometry,
     )
+    return join_schedule(df_assignments, df_schedule), df_schedule
 
-    df_schedule = pd.read_csv(schedule_path, comment="#")
-    df_schedule = apply_wave_id(df_schedule)
+
+def join_schedule(df_assignments: pd.DataFrame, df_schedule: pd.DataFrame) -> pd.DataFrame:
+    """Attach ``family``/``water`` from a loaded schedule to validated assignments."""
     schedule_lookup = df_schedule[["wave_id", "plant_type", "water"]].rename(
         columns={"plant_type": "family"}
     )
@@ -184,323 +453,352 @@ def render_grid(
     crop_rows = df_assignments["status"] != "BENEFICIAL"
     if df_assignments.loc[crop_rows, "family"].isna().any():
         raise ValueError("Missing family data for some crop wave_id values")
+    return df_assignments
+
 
-    bed_notes = (
+def bed_notes_for(df_assignments: pd.DataFrame) -> dict[int, str]:
+    return (
         df_assignments.groupby("bed_id")["notes"]
         .apply(lambda s: "; ".join(sorted({v for v in s if isinstance(v, str) and v})))
         .to_dict()
     )
 
-    cell_items: dict[tuple[int, int], list[dict]] = {}
-    for bed_id in range(1, bed_count + 1):
-        for block_idx in range(blocks_per_bed):
-            items = []
-            if block_idx in flower_blocks:
-                items.append({"kind": "RESERVED", "status": "FLOWER"})
-            if beneficial_block is not None and block_idx == beneficial_block:
-                items.append({"kind": "RESERVED", "status": "BENEFICIAL"})
-            cell_items[(bed_id, block_idx)] = items
-
-    for _, row in df_assignments.iterrows():
-        bed_id = int(row["bed_id"])
-        for block_idx in range(int(row["start_block"]), int(row["end_block"])):
-            if row["status"] == "BENEFICIAL":
-                cell_items[(bed_id, block_idx)].append(
-                    {"kind": "RESERVED", "status": "BENEFICIAL"}
-                )
-                continue
-            cell_items[(bed_id, block_idx)].append(
+
+GRID_TEXT_COLUMNS = ["crop", "variety", "wave_id", "family", "water", "notes"]
+
+
+def _cell_occupants(
+    df_assignments: pd.DataFrame,
+    bed_count: int,
+    blocks_per_bed: int,
+    flower_blocks: list[int],
+    beneficial_block: int | None,
+    reserved_labels: dict[str, str],
+) -> pd.DataFrame:
+    """One row per (cell, occupant): geometry reservations, then assignments.
+
+    ``order`` ranks occupants within a cell the way conflicts are listed:
+    flower blocks, the beneficial block, then assignments in file order.
+    ``cell`` is the cell's row position in the bed-major grid.
+    """
+    beds = np.arange(bed_count)
+    parts = []
+    reserved = (
+        (0, "FLOWER", [b for b in range(blocks_per_bed) if b in flower_blocks]),
+        (1, "BENEFICIAL", [beneficial_block] if beneficial_block is not None else []),
+    )
+    for order, status, blocks in reserved:
+        if not blocks:
+            continue
+        cells = (beds[:, None] * blocks_per_bed + np.asarray(blocks)[None, :]).ravel()
+        parts.append(
+            pd.DataFrame(
                 {
-                    "kind": "CROP",
-                    "status": "CROP",
-                    "crop": row["crop"],
-                    "variety": row["variety"],
-                    "wave_id": row["wave_id"],
-                    "family": row["family"],
-                    "water": row["water"],
-                    "notes": row.get("notes", ""),
+                    "cell": cells,
+                    "order": order,
+                    "status": status,
+                    "detail": _reserved_label(status, reserved_labels),
                 }
             )
+        )
 
-    grid_rows = []
-    for (bed_id, block_idx), items in cell_items.items():
-        status = "EMPTY"
-        crop = variety = wave_id = family = water = notes = ""
-        conflict_details: list[str] = []
+    spans = (df_assignments["end_block"] - df_assignments["start_block"]).clip(lower=0)
+    spans = spans.to_numpy(dtype=int)
+    positions = np.repeat(np.arange(len(df_assignments)), spans)
+    expanded = df_assignments.iloc[positions].reset_index(drop=True)
+    offsets = np.arange(len(positions)) - np.repeat(np.cumsum(spans) - spans, spans)
+    block_idx = expanded["start_block"].to_numpy(dtype=int) + offsets
+    bed_idx = expanded["bed_id"].to_numpy(dtype=int) - 1
+
+    is_beneficial = (expanded["status"] == "BENEFICIAL").to_numpy()
+    occupants = pd.DataFrame(
+        {
+            "cell": bed_idx * blocks_per_bed + block_idx,
+            "order": 2 + positions,
+            "status": np.where(is_beneficial, "BENEFICIAL", "CROP"),
+        }
+    )
+    for column in GRID_TEXT_COLUMNS:
+        values = expanded[column] if column in expanded.columns else ""
+        occupants[column] = np.where(is_beneficial, "", values)
+    crop_detail = expanded["crop"].astype(str) + " / " + expanded["variety"].astype(str)
+    occupants["detail"] = np.where(
+        is_beneficial,
+        _reserved_label("BENEFICIAL", reserved_labels),
+        crop_detail,
+    )
+    parts.append(occupants)
 
-        if len(items) == 1:
-            item = items[0]
-            if item["kind"] == "RESERVED":
-                status = item["status"]
-            else:
-                status = "CROP"
-                crop = item["crop"]
-                variety = item["variety"]
-                wave_id = item["wave_id"]
-                family = item["family"]
-                water = item["water"]
-                notes = item.get("notes", "")
-        elif len(items) > 1:
-            status = "CONFLICT"
-            for item in items:
-                if item["kind"] == "RESERVED":
-                    conflict_details.append(_reserved_label(item["status"], reserved_labels))
-                else:
-                    conflict_details.append(f"{item['crop']} / {item['variety']}")
-
-        grid_rows.append(
-            {
-                "bed_id": bed_id,
-                "block_idx": block_idx,
-                "status": status,
-                "crop": crop,
-                "variety": variety,
-                "wave_id": wave_id,
-                "family": family,
-                "water": water,
-                "notes": notes,
-                "conflict_details": " | ".join(conflict_details),
-            }
-        )
+    return pd.concat(parts, ignore_index=True).sort_values(["cell", "order"], kind="stable")
+
+
+def build_grid(df_assignments: pd.DataFrame, geometry: dict, visuals: dict) -> pd.DataFrame:
+    """Expand assignments into one styled row per bed/block cell, with run ids.
+
+    A cell with one occupant takes its status and crop fields, a cell with
+    several becomes CONFLICT listing every occupant, and the rest are EMPTY.
+    """
+    bed_count, blocks_per_bed = grid_geometry(geometry)
+    flower_blocks = geometry.get("flower_blocks", []) or []
+    beneficial_block = geometry.get("beneficial_block")
+    reserved_labels = geometry.get("reserved_labels", {})
 
-    grid = pd.DataFrame(grid_rows)
+    occupants = _cell_occupants(
+        df_assignments,
+        bed_count,
+        blocks_per_bed,
+        flower_blocks,
+        beneficial_block,
+        reserved_labels,
+    )
+    counts = occupants.groupby("cell").size()
+    occupants = occupants.join(counts.rename("occupant_count"), on="cell")
+
+    n_cells = bed_count * blocks_per_bed
+    status = np.full(n_cells, "EMPTY", dtype=object)
+    columns = {column: np.full(n_cells, "", dtype=object) for column in GRID_TEXT_COLUMNS}
+    conflict_details = np.full(n_cells, "", dtype=object)
+
+    single = occupants[occupants["occupant_count"] == 1]
+    cells = single["cell"].to_numpy()
+    status[cells] = single["status"].to_numpy()
+    crop_single = single[single["status"] == "CROP"]
+    for column in GRID_TEXT_COLUMNS:
+        columns[column][crop_single["cell"].to_numpy()] = crop_single[column].to_numpy()
+
+    shared = occupants[occupants["occupant_count"] > 1]
+    if not shared.empty:
+        details = shared.groupby("cell", sort=True)["detail"].agg(" | ".join)
+        status[details.index.to_numpy()] = "CONFLICT"
+        conflict_details[details.index.to_numpy()] = details.to_numpy()
+
+    grid = pd.DataFrame(
+        {
+            "bed_id": np.repeat(np.arange(1, bed_count + 1), blocks_per_bed),
+            "block_idx": np.tile(np.arange(blocks_per_bed), bed_count),
+            "status": status,
+            **columns,
+            "conflict_details": conflict_details,
+        }
+    )
 
     family_colors = visuals.get("family_colors", {})
     water_alpha = visuals.get("water_alpha", {})
     water_borders = visuals.get("water_borders", {})
     status_colors = {**DEFAULT_STATUS_COLORS, **visuals.get("status_colors", {})}
 
-    def _color_for(row: pd.Series) -> str:
-        if row["status"] == "CROP":
-            return family_colors.get(row["family"], DEFAULT_STATUS_COLORS["CROP"])
-        return status_colors.get(row["status"], DEFAULT_STATUS_COLORS["EMPTY"])
+    is_crop = grid["status"] == "CROP"
+    crop_color = grid["family"].map(family_colors).fillna(DEFAULT_STATUS_COLORS["CROP"])
+    other_color = grid["status"].map(status_colors).fillna(DEFAULT_STATUS_COLORS["EMPTY"])
+    grid["color"] = crop_color.where(is_crop, other_color)
+    alpha = grid["water"].map(water_alpha).astype(float).fillna(1.0)
+    grid["alpha"] = alpha.where(is_crop, 1.0)
+    border = grid["water"].map(water_borders).fillna("solid").astype(str)
+    grid["border_style"] = border.where(is_crop, "solid")
 
-    def _alpha_for(row: pd.Series) -> float:
-        if row["status"] != "CROP":
-            return 1.0
-        return float(water_alpha.get(row["water"], 1.0))
+    grid["run_id"] = compute_run_ids(grid)
+    return grid
 
-    def _border_for(row: pd.Series) -> str:
-        if row["status"] != "CROP":
-            return "solid"
-        return str(water_borders.get(row["water"], "solid"))
 
-    grid["color"] = grid.apply(_color_for, axis=1)
-    grid["alpha"] = grid.apply(_alpha_for, axis=1)
-    grid["border_style"] = grid.apply(_border_for, axis=1)
+def layout_assignments(
+    df_assignments: pd.DataFrame,
+    geometry: dict,
+    visuals: dict,
+    crop_codes: dict[str, str] | None = None,
+) -> tuple[pd.DataFrame, GridLayout]:
+    """Build the cell grid and its positioned layout for loaded assignments."""
+    bed_count, blocks_per_bed = grid_geometry(geometry)
+    grid = build_grid(df_assignments, geometry, visuals)
+    layout = build_grid_layout(
+        build_runs(grid),
+        bed_notes_for(df_assignments),
+        bed_count,
+        blocks_per_bed,
+        visuals,
+        geometry.get("reserved_labels", {}),
+        crop_codes,
+    )
+    return grid, layout
 
-    # Build merged runs
-    runs = []
-    run_id = 0
-    for bed_id in range(1, bed_count + 1):
-        bed_rows = grid[grid["bed_id"] == bed_id].sort_values("block_idx")
-        current = None
-        for _, row in bed_rows.iterrows():
-            key = (
-                row["status"],
-                row["crop"],
-                row["variety"],
-                row["wave_id"],
-                row["conflict_details"],
-            )
-            if current is None:
-                current = {
-                    "bed_id": bed_id,
-                    "start_block": int(row["block_idx"]),
-                    "end_block": int(row["block_idx"]) + 1,
-                    "key": key,
-                    "row": row,
-                }
-                continue
-            if key == current["key"] and row["block_idx"] == current["end_block"]:
-                current["end_block"] += 1
-            else:
-                current["run_id"] = run_id
-                runs.append(current)
-                run_id += 1
-                current = {
-                    "bed_id": bed_id,
-                    "start_block": int(row["block_idx"]),
-                    "end_block": int(row["block_idx"]) + 1,
-                    "key": key,
-                    "row": row,
-                }
-        if current is not None:
-            current["run_id"] = run_id
-            runs.append(current)
-            run_id += 1
 
-    # Assign run_id to grid
-    run_lookup = {}
-    for run in runs:
-        for block_idx in range(run["start_block"], run["end_block"]):
-            run_lookup[(run["bed_id"], block_idx)] = run["run_id"]
-    grid["run_id"] = grid.apply(
-        lambda r: run_lookup[(r["bed_id"], r["block_idx"])], axis=1
-    )
+def write_grid_outputs(
+    grid: pd.DataFrame,
+    layout: GridLayout,
+    output_csv: Path | None,
+    output_svg: Path | None,
+    output_png: Path | None,
+    png_dpi: float,
+    png_backend: str = "native",
+    svg_source: Path | None = None,
+) -> None:
+    """Write whichever outputs are given; ``svg_source`` feeds the cairo backend."""
+    if output_csv is not None:
+        output_csv.parent.mkdir(parents=True, exist_ok=True)
+        grid.to_csv(output_csv, index=False)
+
+    if output_svg is not None:
+        output_svg.parent.mkdir(parents=True, exist_ok=True)
+        with output_svg.open("w", encoding="utf-8") as handle:
+            write_grid_svg(handle, layout)
 
-    output_csv.parent.mkdir(parents=True, exist_ok=True)
-    grid.to_csv(output_csv, index=False)
+    if output_png is not None:
+        output_png.parent.mkdir(parents=True, exist_ok=True)
+        svg_path = svg_source if svg_source is not None else output_svg
+        write_grid_png(layout, svg_path, output_png, png_dpi, png_backend)
 
-    # SVG render
-    cell_size = int(visuals.get("cell_size", 40))
-    font_family = visuals.get("font_family", "Helvetica")
-    label_font_size = int(visuals.get("label_font_size", 10))
-    conflict_font_size = int(visuals.get("conflict_font_size", 8))
-    reserved_font_size = int(visuals.get("reserved_font_size", 9))
-    conflict_max_lines = int(visuals.get("conflict_max_lines", 4))
-    row_label_width = int(visuals.get("row_label_width", cell_size))
-    notes_width_ratio = float(visuals.get("notes_col_width_ratio", 0.33))
 
-    grid_width = blocks_per_bed * cell_size
-    notes_width = int(grid_width * notes_width_ratio)
-    width_px = row_label_width + grid_width + notes_width
-    height_px = bed_count * cell_size
-    x_offset = row_label_width
+def _png_dpi(visuals: dict, png_dpi: float | None) -> float:
+    return png_dpi if png_dpi is not None else float(visuals.get("png_dpi", 96))
 
-    svg_parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width_px}" height="{height_px}" ',
-        f'viewBox="0 0 {width_px} {height_px}">',
-    ]
 
-    # Row number column
-    for bed_id in range(1, bed_count + 1):
-        y = (bed_id - 1) * cell_size
-        svg_parts.append(
-            f'<rect x="0" y="{y}" width="{row_label_width}" height="{cell_size}" '
-            f'fill="#FFFFFF" stroke="#333333" stroke-width="1" />'
-        )
-        svg_parts.append(
-            _svg_text(
-                row_label_width / 2,
-                y + cell_size / 2,
-                [str(bed_id)],
-                reserved_font_size,
-                font_family,
-                "#111111",
-            )
-        )
+def render_assignments(
+    df_assignments: pd.DataFrame,
+    geometry: dict,
+    visuals: dict,
+    output_csv: Path | None,
+    output_svg: Path | None,
+    output_png: Path | None,
+    png_dpi: float | None = None,
+    png_backend: str = "native",
+    crop_codes: dict[str, str] | None = None,
+) -> pd.DataFrame:
+    """Render already-loaded assignments; any output path may be skipped."""
+    grid, layout = layout_assignments(df_assignments, geometry, visuals, crop_codes)
+    warn_missing_crop_codes(layout.missing_codes)
+    write_grid_outputs(
+        grid,
+        layout,
+        output_csv,
+        output_svg,
+        output_png,
+        _png_dpi(visuals, png_dpi),
+        png_backend,
+    )
+    return grid
 
-    # Notes column
-    for bed_id in range(1, bed_count + 1):
-        y = (bed_id - 1) * cell_size
-        x = x_offset + grid_width
-        svg_parts.append(
-            f'<rect x="{x}" y="{y}" width="{notes_width}" height="{cell_size}" '
-            f'fill="#FFFFFF" stroke="#333333" stroke-width="1" />'
-        )
-        notes_text = bed_notes.get(bed_id, "")
-        if notes_text:
-            lines = wrap_text(
-                notes_text,
-                _line_capacity(reserved_font_size, notes_width),
-                2,
-            )
-            svg_parts.append(
-                _svg_text(
-                    x + notes_width / 2,
-                    y + cell_size / 2,
-                    lines,
-                    reserved_font_size,
-                    font_family,
-                    "#111111",
-                )
-            )
 
-    # Grid runs
-    for run in runs:
-        row = run["row"]
-        status = row["status"]
-        x = x_offset + run["start_block"] * cell_size
-        y = (run["bed_id"] - 1) * cell_size
-        run_width = (run["end_block"] - run["start_block"]) * cell_size
-        run_height = cell_size
-
-        fill = row["color"]
-        fill_opacity = row["alpha"]
-        border_style = row["border_style"]
-        stroke_dasharray = ""
-        if border_style == "dashed":
-            stroke_dasharray = "4,2"
-        elif border_style == "dotted":
-            stroke_dasharray = "1,2"
-
-        stroke_attr = (
-            f' stroke="#333333" stroke-width="1"'
-            + (f' stroke-dasharray="{stroke_dasharray}"' if stroke_dasharray else "")
-        )
+def renderer_version() -> str:
+    """Fingerprint of the renderer code and the libraries its pickles depend on."""
+    return cache_key(source_fingerprint(*RENDERER_SOURCES), pd.__version__, np.__version__)
+
 
-        svg_parts.append(
-            f'<rect x="{x}" y="{y}" width="{run_width}" height="{run_height}" '
-            f'fill="{fill}" fill-opacity="{fill_opacity}"{stroke_attr} />'
+def load_grid_layout(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    schema_version: int,
+    geometry: dict,
+    visuals: dict,
+    crop_codes: dict[str, str],
+    cache: RenderCache | None = None,
+) -> tuple[pd.DataFrame, GridLayout, str | None]:
+    """Validated grid and layout for a plan, plus its render key when cached.
+
+    With a ``cache``, the validated assignments frame is keyed by the renderer
+    version and the assignments, schedule, and geometry hashes; the grid and
+    layout add the visuals hash, crop codes, and the font face labels are
+    measured with. Both are reused on a hit.
+    """
+
+    def validated_assignments() -> pd.DataFrame:
+        df_assignments, _ = load_assignments(
+            assignments_path,
+            schedule_path,
+            geometry_path,
+            schema_version,
         )
+        return df_assignments
 
-        center_x = x + run_width / 2
-        center_y = y + run_height / 2
+    if cache is None:
+        grid, layout = layout_assignments(validated_assignments(), geometry, visuals, crop_codes)
+        return grid, layout, None
 
-        if status == "CROP":
-            lines = build_crop_label_lines(
-                row["crop"],
-                row["variety"],
-                run_width,
-                label_font_size,
-            )
-            svg_parts.append(
-                _svg_text(
-                    center_x,
-                    center_y,
-                    lines,
-                    label_font_size,
-                    font_family,
-                    "#111111",
-                )
-            )
-        elif status == "CONFLICT":
-            details = row["conflict_details"].split(" | ") if row["conflict_details"] else []
-            lines = build_conflict_label_lines(
-                details,
-                run_width,
-                conflict_font_size,
-                conflict_max_lines,
-            )
-            svg_parts.append(
-                _svg_text(
-                    center_x,
-                    center_y,
-                    lines,
-                    conflict_font_size,
-                    font_family,
-                    "#111111",
-                )
-            )
-        elif status in ("FLOWER", "BENEFICIAL"):
-            label = _reserved_label(status, reserved_labels)
-            lines = [fit_text(label, _line_capacity(reserved_font_size, run_width))]
-            svg_parts.append(
-                _svg_text(
-                    center_x,
-                    center_y,
-                    lines,
-                    reserved_font_size,
-                    font_family,
-                    "#111111",
-                )
-            )
+    assignments_key = cache_key(
+        renderer_version(),
+        schema_version,
+        file_digest(assignments_path),
+        file_digest(schedule_path),
+        file_digest(geometry_path),
+    )
+    font_family = visuals.get("font_family", "Helvetica")
+    render_key = cache_key(
+        assignments_key, file_digest(visuals_path), sorted(crop_codes.items()), font_face(font_family)
+    )
 
-    svg_parts.append("</svg>")
-    output_svg.parent.mkdir(parents=True, exist_ok=True)
-    output_svg.write_text("".join(svg_parts), encoding="utf-8")
+    def grid_and_layout() -> tuple[pd.DataFrame, GridLayout]:
+        df_assignments = cache.memo("assignments", assignments_key, validated_assignments)
+        return layout_assignments(df_assignments, geometry, visuals, crop_codes)
 
-    if output_png is not None:
-        try:
-            import cairosvg
+    grid, layout = cache.memo("layout", render_key, grid_and_layout)
+    return grid, layout, render_key
 
-            output_png.parent.mkdir(parents=True, exist_ok=True)
-            cairosvg.svg2png(url=str(output_svg), write_to=str(output_png))
-        except Exception as exc:  # pragma: no cover - runtime-only dependency
-            print(f"Warning: PNG rasterization failed: {exc}")
 
+def render_grid(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_csv: Path,
+    output_svg: Path,
+    output_png: Path | None,
+    schema_version: int,
+    png_dpi: float | None = None,
+    png_backend: str = "native",
+    cache: RenderCache | None = None,
+    crop_codes_path: Path | None = None,
+) -> pd.DataFrame:
+    """Render the grid CSV, SVG, and optional PNG.
+
+    With a ``cache``, each output is keyed by content hashes of the inputs it
+    depends on plus the renderer version, and is only rewritten when its key
+    changed. The validated assignments frame (assignments, schedule, geometry)
+    and the grid with its run layout (plus visuals) are reused from the cache.
+    """
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    crop_codes = load_crop_codes(crop_codes_path, schema_version)
+    grid_geometry(geometry)
+    dpi = _png_dpi(visuals, png_dpi)
+
+    grid, layout, render_key = load_grid_layout(
+        assignments_path,
+        schedule_path,
+        geometry_path,
+        visuals_path,
+        schema_version,
+        geometry,
+        visuals,
+        crop_codes,
+        cache,
+    )
+    warn_missing_crop_codes(layout.missing_codes)
+    if cache is None:
+        write_grid_outputs(grid, layout, output_csv, output_svg, output_png, dpi, png_backend)
+        return grid
+
+    outputs = [(output_csv, render_key), (output_svg, render_key)]
+    if output_png is not None:
+        outputs.append((output_png, cache_key(render_key, dpi, png_backend)))
+    stale = {path for path, key in outputs if not cache.is_fresh(path, key)}
+    write_grid_outputs(
+        grid,
+        layout,
+        output_csv if output_csv in stale else None,
+        output_svg if output_svg in stale else None,
+        output_png if output_png in stale else None,
+        dpi,
+        png_backend,
+        svg_source=output_svg,
+    )
+    for path, key in outputs:
+        if path not in stale:
+            cache.skipped.append(path)
+        elif path.exists():
+            # A failed cairo rasterization only warns, leaving no PNG to record.
+            cache.record(path, key)
+            cache.written.append(path)
+    cache.save()
     return grid
 
 
@@ -526,6 +824,11 @@ def main() -> int:
         default="data/plans/config/bed-visuals.jsonl",
         help="Path to bed visuals JSONL",
     )
+    parser.add_argument(
+        "--crop-codes",
+        default="data/plans/config/crop-codes.jsonl",
+        help="Path to crop code JSONL used by compact labels (optional)",
+    )
     parser.add_argument(
         "--output-csv",
         default="data/plans/bed-grid.csv",
@@ -546,6 +849,28 @@ def main() -> int:
         action="store_true",
         help="Skip PNG rasterization",
     )
+    parser.add_argument(
+        "--png-backend",
+        choices=["native", "cairo"],
+        default="native",
+        help="PNG renderer: native painter (default) or CairoSVG from the SVG",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="PNG resolution (default: png_dpi from visuals, else 96)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/render-grid",
+        help="Render cache directory (outputs with unchanged inputs are skipped)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always re-render every output",
+    )
     parser.add_argument(
         "--schema-version",
         type=int,
@@ -555,6 +880,7 @@ def main() -> int:
     args = parser.parse_args()
 
     output_png = None if args.skip_png else Path(args.output_png)
+    cache = None if args.no_cache else RenderCache(Path(args.cache_dir))
     try:
         render_grid(
             Path(args.assignments),
@@ -565,15 +891,24 @@ def main() -> int:
             Path(args.output_svg),
             output_png,
             args.schema_version,
+            png_dpi=args.dpi,
+            png_backend=args.png_backend,
+            cache=cache,
+            crop_codes_path=Path(args.crop_codes),
         )
     except Exception as exc:
         print(f"Error: {exc}")
         return 1
 
-    print(f"Saved grid CSV to {args.output_csv}")
-    print(f"Saved grid SVG to {args.output_svg}")
+    skipped = set(cache.skipped) if cache is not None else set()
+    outputs = [("CSV", Path(args.output_csv)), ("SVG", Path(args.output_svg))]
     if output_png is not None:
-        print(f"Saved grid PNG to {args.output_png}")
+        outputs.append(("PNG", output_png))
+    for label, path in outputs:
+        if path in skipped:
+            print(f"Grid {label} up to date: {path}")
+        else:
+            print(f"Saved grid {label} to {path}")
     return 0
 
 
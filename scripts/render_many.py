@@ -0,0 +1,251 @@
+#!/usr/bin/env -S uv run python
+"""Render the bed grid for many assignment plans in one run."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.build_assignments import load_schedule, validate_assignments
+from scripts.render_grid import (
+    grid_geometry,
+    join_schedule,
+    load_crop_codes,
+    load_jsonl_config,
+    render_assignments,
+)
+
+# Set once per worker process by _init_worker so tasks only ship plan paths.
+_WORKER_STATE: dict = {}
+
+
+def plan_names(plan_paths: list[Path]) -> dict[str, Path]:
+    """Output name per plan; directories expand to the CSV files inside them.
+
+    Plans are named by file stem. A stem seen twice is prefixed with its
+    parent directory so scenario folders holding the same file name do not
+    overwrite each other.
+    """
+    files: list[Path] = []
+    for path in plan_paths:
+        if path.is_dir():
+            files.extend(sorted(path.glob("*.csv")))
+        else:
+            files.append(path)
+    if not files:
+        raise ValueError("No plan files to render")
+
+    stems = Counter(path.stem for path in files)
+    names: dict[str, Path] = {}
+    for path in files:
+        name = f"{path.parent.name}-{path.stem}" if stems[path.stem] > 1 else path.stem
+        if name in names:
+            raise ValueError(f"Plans {names[name]} and {path} would share outputs {name!r}")
+        names[name] = path
+    return names
+
+
+def plan_outputs(
+    output_dir: Path,
+    name: str,
+    skip_png: bool,
+) -> tuple[Path, Path, Path | None]:
+    """``(csv, svg, png)`` paths for one plan, e.g. ``exports/plans/plan-a.svg``."""
+    png = None if skip_png else output_dir / f"{name}.png"
+    return output_dir / f"{name}.csv", output_dir / f"{name}.svg", png
+
+
+def _init_worker(
+    df_schedule: pd.DataFrame,
+    geometry: dict,
+    visuals: dict,
+    crop_codes: dict[str, str],
+    output_dir: Path,
+    png_dpi: float | None,
+    png_backend: str,
+    skip_png: bool,
+) -> None:
+    _WORKER_STATE.update(
+        df_schedule=df_schedule,
+        geometry=geometry,
+        visuals=visuals,
+        crop_codes=crop_codes,
+        output_dir=output_dir,
+        png_dpi=png_dpi,
+        png_backend=png_backend,
+        skip_png=skip_png,
+    )
+
+
+def _render_plan(task: tuple[str, Path]) -> tuple[str, str | None]:
+    """Validate and render one plan; return ``(name, error)`` instead of raising."""
+    name, path = task
+    state = _WORKER_STATE
+    try:
+        df_assignments = validate_assignments(
+            pd.read_csv(path, comment="#"),
+            state["df_schedule"],
+            state["geometry"],
+        )
+        output_csv, output_svg, output_png = plan_outputs(
+            state["output_dir"],
+            name,
+            state["skip_png"],
+        )
+        render_assignments(
+            join_schedule(df_assignments, state["df_schedule"]),
+            state["geometry"],
+            state["visuals"],
+            output_csv,
+            output_svg,
+            output_png,
+            png_dpi=state["png_dpi"],
+            png_backend=state["png_backend"],
+            crop_codes=state["crop_codes"],
+        )
+    except Exception as exc:
+        return name, str(exc)
+    return name, None
+
+
+def render_many(
+    plan_paths: list[Path],
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_dir: Path,
+    schema_version: int,
+    png_dpi: float | None = None,
+    png_backend: str = "native",
+    skip_png: bool = False,
+    workers: int | None = None,
+    crop_codes_path: Path | None = None,
+) -> dict[str, str | None]:
+    """Render every plan to ``output_dir/<name>.{csv,svg,png}``.
+
+    Geometry, visuals, crop codes, and the wave-id'd schedule are loaded once
+    and handed to each worker process at startup. Returns plan name -> error
+    message (``None`` when it rendered); one invalid plan does not stop the
+    others.
+    """
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    crop_codes = load_crop_codes(crop_codes_path, schema_version)
+    grid_geometry(geometry)
+    df_schedule = load_schedule(schedule_path)
+    tasks = list(plan_names(plan_paths).items())
+
+    init_args = (
+        df_schedule,
+        geometry,
+        visuals,
+        crop_codes,
+        output_dir,
+        png_dpi,
+        png_backend,
+        skip_png,
+    )
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        _init_worker(*init_args)
+        return dict(_render_plan(task) for task in tasks)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=init_args,
+    ) as pool:
+        return dict(pool.map(_render_plan, tasks))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "plans",
+        nargs="+",
+        help="Bed assignment CSVs, or directories of scenario CSVs",
+    )
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--geometry",
+        default="data/plans/config/bed-geometry.jsonl",
+        help="Path to bed geometry JSONL",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--crop-codes",
+        default="data/plans/config/crop-codes.jsonl",
+        help="Path to crop code JSONL used by compact labels (optional)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="exports/plans",
+        help="Directory for <plan>.csv/.svg/.png outputs",
+    )
+    parser.add_argument("--skip-png", action="store_true", help="Skip PNG rasterization")
+    parser.add_argument(
+        "--png-backend",
+        choices=["native", "cairo"],
+        default="native",
+        help="PNG renderer: native painter (default) or CairoSVG from the SVG",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="PNG resolution (default: png_dpi from visuals, else 96)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 renders in-process)",
+    )
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    try:
+        results = render_many(
+            [Path(plan) for plan in args.plans],
+            Path(args.schedule),
+            Path(args.geometry),
+            Path(args.visuals),
+            output_dir,
+            args.schema_version,
+            png_dpi=args.dpi,
+            png_backend=args.png_backend,
+            skip_png=args.skip_png,
+            workers=args.workers,
+            crop_codes_path=Path(args.crop_codes),
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    failed = {name: error for name, error in results.items() if error is not None}
+    for name, error in failed.items():
+        print(f"Error: {name}: {error}")
+    print(f"Saved {len(results) - len(failed)} of {len(results)} plans to {output_dir}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
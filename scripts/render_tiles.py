@@ -0,0 +1,330 @@
+#!/usr/bin/env -S uv run python
+"""Render the bed grid as fixed-size PNG tiles at several zoom levels, plus a manifest."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from scripts.io.raster import CSS_DPI, canvas_size, paint_region, save_png
+from scripts.io.text_layout import text_width
+from scripts.render_grid import (
+    GridLayout,
+    grid_geometry,
+    layout_assignments,
+    load_assignments,
+    load_crop_codes,
+    load_jsonl_config,
+    warn_missing_crop_codes,
+)
+
+# Below this many pixels per cell, outlines would swamp the fills.
+MIN_STROKED_CELL_PX = 4
+
+# Set once per worker process by _init_worker so tasks only ship tile coordinates.
+_WORKER_STATE: dict = {}
+
+
+def zoom_scales(width: float, height: float, tile_size: int, max_scale: float) -> list[float]:
+    """Scale per zoom level, halving from ``max_scale`` until one tile covers the grid."""
+    longest = max(width, height) * max_scale
+    levels = max(0, math.ceil(math.log2(longest / tile_size))) if longest > tile_size else 0
+    return [max_scale / 2 ** (levels - zoom) for zoom in range(levels + 1)]
+
+
+def tile_windows(width_px: int, height_px: int, tile_size: int) -> list[tuple[int, int, tuple]]:
+    """``(x, y, window)`` for each tile; edge tiles are cropped to the canvas."""
+    windows = []
+    for y in range(math.ceil(height_px / tile_size)):
+        for x in range(math.ceil(width_px / tile_size)):
+            left, top = x * tile_size, y * tile_size
+            window = (left, top, min(tile_size, width_px - left), min(tile_size, height_px - top))
+            windows.append((x, y, window))
+    return windows
+
+
+def element_bounds(layout: GridLayout) -> tuple[np.ndarray, np.ndarray]:
+    """Layout-unit ``(x0, y0, x1, y1)`` arrays for every rect and every label."""
+    rects = np.array(
+        [(r.x, r.y, r.x + r.width, r.y + r.height) for r in layout.rects],
+        dtype=float,
+    ).reshape(-1, 4)
+    labels = []
+    for label in layout.labels:
+        size = layout.fonts[label.font]
+        widest = max((text_width(line, layout.font_family, size) for line in label.lines), default=0)
+        half_w = widest / 2 + size
+        half_h = len(label.lines) * size * 1.2 / 2 + size
+        labels.append((label.x - half_w, label.y - half_h, label.x + half_w, label.y + half_h))
+    return rects, np.array(labels, dtype=float).reshape(-1, 4)
+
+
+def _overlapping(bounds: np.ndarray, box: tuple[float, float, float, float]) -> np.ndarray:
+    x0, y0, x1, y1 = box
+    hits = (bounds[:, 0] <= x1) & (bounds[:, 2] >= x0) & (bounds[:, 1] <= y1) & (bounds[:, 3] >= y0)
+    return np.flatnonzero(hits)
+
+
+def _init_worker(
+    layout: GridLayout,
+    output_dir: Path,
+    min_font_px: int,
+    cell_size: int,
+) -> None:
+    rect_bounds, label_bounds = element_bounds(layout)
+    _WORKER_STATE.update(
+        layout=layout,
+        rect_bounds=rect_bounds,
+        label_bounds=label_bounds,
+        output_dir=output_dir,
+        min_font_px=min_font_px,
+        cell_size=cell_size,
+    )
+
+
+def _render_tile(task: tuple[int, float, int, int, tuple]) -> Path:
+    """Paint one tile from the rects and labels that overlap it."""
+    zoom, scale, x, y, window = task
+    state = _WORKER_STATE
+    layout = state["layout"]
+    left, top, width_px, height_px = window
+    # Strokes sit just outside fills, so widen the box by a stroke in layout units.
+    margin = (max(1, round(scale)) + 1) / scale
+    box = (
+        left / scale - margin,
+        top / scale - margin,
+        (left + width_px) / scale + margin,
+        (top + height_px) / scale + margin,
+    )
+    rects = [layout.rects[i] for i in _overlapping(state["rect_bounds"], box)]
+    labels = [layout.labels[i] for i in _overlapping(state["label_bounds"], box)]
+    buf = paint_region(
+        layout,
+        scale,
+        window,
+        rects,
+        labels,
+        state["min_font_px"],
+        strokes=state["cell_size"] * scale >= MIN_STROKED_CELL_PX,
+    )
+
+    path = state["output_dir"] / str(zoom) / str(x) / f"{y}.png"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    save_png(buf, path, scale * CSS_DPI)
+    return path
+
+
+def field_extents(geometry: dict, cell_size: int) -> list[dict]:
+    """Named bed ranges from geometry ``fields`` with their layout-unit rows.
+
+    Without ``fields`` the whole farm is one field.
+    """
+    bed_count, _ = grid_geometry(geometry)
+    fields = geometry.get("fields") or [{"name": "Farm", "beds": [1, bed_count]}]
+    extents = []
+    for field in fields:
+        first, last = (int(bed) for bed in field["beds"])
+        if not 1 <= first <= last <= bed_count:
+            raise ValueError(f"Field {field['name']!r} beds {first}-{last} outside 1-{bed_count}")
+        extents.append(
+            {
+                "name": field["name"],
+                "first_bed": first,
+                "last_bed": last,
+                "y": (first - 1) * cell_size,
+                "height": (last - first + 1) * cell_size,
+            }
+        )
+    return extents
+
+
+def build_manifest(
+    layout: GridLayout,
+    scales: list[float],
+    tile_size: int,
+    fields: list[dict],
+) -> dict:
+    levels = []
+    for zoom, scale in enumerate(scales):
+        width_px, height_px = canvas_size(layout, scale)
+        levels.append(
+            {
+                "zoom": zoom,
+                "scale": scale,
+                "width": width_px,
+                "height": height_px,
+                "columns": math.ceil(width_px / tile_size),
+                "rows": math.ceil(height_px / tile_size),
+            }
+        )
+    return {
+        "tile_size": tile_size,
+        "url_template": "{z}/{x}/{y}.png",
+        "width": layout.width,
+        "height": layout.height,
+        "min_zoom": 0,
+        "max_zoom": len(scales) - 1,
+        "levels": levels,
+        "fields": fields,
+    }
+
+
+def render_tiles(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_dir: Path,
+    schema_version: int,
+    tile_size: int = 256,
+    png_dpi: float | None = None,
+    min_font_px: int = 4,
+    workers: int | None = None,
+    crop_codes_path: Path | None = None,
+) -> dict:
+    """Render every tile of every zoom level and write ``manifest.json``.
+
+    The top zoom level paints at ``png_dpi``; each lower level halves the
+    scale until the whole grid fits in one tile. Workers hold the layout and
+    paint one ``tile_size`` buffer at a time, so memory per tile is fixed no
+    matter how many beds the farm has.
+    """
+    if tile_size <= 0:
+        raise ValueError("tile_size must be positive")
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    crop_codes = load_crop_codes(crop_codes_path, schema_version)
+    df_assignments, _ = load_assignments(
+        assignments_path,
+        schedule_path,
+        geometry_path,
+        schema_version,
+    )
+    _, layout = layout_assignments(df_assignments, geometry, visuals, crop_codes)
+    warn_missing_crop_codes(layout.missing_codes)
+
+    dpi = png_dpi if png_dpi is not None else float(visuals.get("png_dpi", 96))
+    scales = zoom_scales(layout.width, layout.height, tile_size, dpi / CSS_DPI)
+    tasks = []
+    for zoom, scale in enumerate(scales):
+        width_px, height_px = canvas_size(layout, scale)
+        for x, y, window in tile_windows(width_px, height_px, tile_size):
+            tasks.append((zoom, scale, x, y, window))
+
+    cell_size = int(visuals.get("cell_size", 40))
+    init_args = (layout, output_dir, min_font_px, cell_size)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(*init_args)
+        for task in tasks:
+            _render_tile(task)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=init_args,
+        ) as pool:
+            for _ in pool.map(_render_tile, tasks, chunksize=16):
+                pass
+
+    manifest = build_manifest(layout, scales, tile_size, field_extents(geometry, cell_size))
+    manifest["tile_count"] = len(tasks)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "manifest.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    return manifest
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--assignments",
+        default="data/plans/bed-assignments.csv",
+        help="Path to bed assignments CSV",
+    )
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--geometry",
+        default="data/plans/config/bed-geometry.jsonl",
+        help="Path to bed geometry JSONL",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--crop-codes",
+        default="data/plans/config/crop-codes.jsonl",
+        help="Path to crop code JSONL used by compact labels (optional)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="exports/tiles",
+        help="Directory for {z}/{x}/{y}.png tiles and manifest.json",
+    )
+    parser.add_argument("--tile-size", type=int, default=256, help="Tile edge in pixels")
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="Resolution of the most detailed zoom level (default: png_dpi, else 96)",
+    )
+    parser.add_argument(
+        "--min-font-px",
+        type=int,
+        default=4,
+        help="Skip labels smaller than this at low zoom levels",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 renders in-process)",
+    )
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    try:
+        manifest = render_tiles(
+            Path(args.assignments),
+            Path(args.schedule),
+            Path(args.geometry),
+            Path(args.visuals),
+            output_dir,
+            args.schema_version,
+            tile_size=args.tile_size,
+            png_dpi=args.dpi,
+            min_font_px=args.min_font_px,
+            workers=args.workers,
+            crop_codes_path=Path(args.crop_codes),
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    print(
+        f"Saved {manifest['tile_count']} tiles across {manifest['max_zoom'] + 1} "
+        f"zoom levels to {output_dir}"
+    )
+    print(f"Saved tile manifest to {output_dir / 'manifest.json'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,335 @@
+#!/usr/bin/env -S uv run python
+"""Render week-by-week bed occupancy frames, an animated GIF, and a contact sheet."""
+
+from __future__ import annotations
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw
+
+from scripts.io.raster import rasterize, save_png
+from scripts.io.waves import occupancy_windows
+from scripts.render_grid import (
+    layout_assignments,
+    load_assignments,
+    load_crop_codes,
+    load_jsonl_config,
+    warn_missing_crop_codes,
+    write_grid_svg,
+)
+
+CAPTION_HEIGHT = 24
+
+# Set once per worker process by _init_worker so frames only ship a week index.
+_WORKER_STATE: dict = {}
+
+
+def season_weeks(
+    windows: pd.DataFrame,
+    start: str | None = None,
+    end: str | None = None,
+) -> pd.DatetimeIndex:
+    """Monday-anchored weeks spanning every occupancy window (or start..end)."""
+    first = pd.Timestamp(start) if start else windows["occupied_from"].min()
+    last = pd.Timestamp(end) if end else windows["occupied_until"].max()
+    if pd.isna(first) or pd.isna(last):
+        raise ValueError("No dated assignments to build a season from")
+    first = first - pd.Timedelta(days=first.weekday())
+    return pd.date_range(first, last, freq="7D")
+
+
+def build_occupancy_index(windows: pd.DataFrame, weeks: pd.DatetimeIndex) -> np.ndarray:
+    """Boolean matrix of shape (weeks, assignments): which rows occupy each week."""
+    starts = windows["occupied_from"].to_numpy(dtype="datetime64[ns]")
+    ends = windows["occupied_until"].to_numpy(dtype="datetime64[ns]")
+    week_starts = weeks.to_numpy(dtype="datetime64[ns]")[:, None]
+    week_ends = week_starts + np.timedelta64(6, "D")
+
+    undated = np.isnat(starts)
+    active = (starts[None, :] <= week_ends) & (ends[None, :] >= week_starts)
+    return active | undated[None, :]
+
+
+def _frame_paths(output_dir: Path, week_idx: int, week: pd.Timestamp) -> tuple[Path, Path]:
+    stem = f"week-{week_idx + 1:02d}-{week:%Y-%m-%d}"
+    frames_dir = output_dir / "frames"
+    return frames_dir / f"{stem}.svg", frames_dir / f"{stem}.png"
+
+
+def _init_worker(
+    windows: pd.DataFrame,
+    index: np.ndarray,
+    weeks: pd.DatetimeIndex,
+    geometry: dict,
+    visuals: dict,
+    output_dir: Path,
+    png_dpi: float,
+    preview_widths: tuple[int, int],
+    crop_codes: dict[str, str],
+) -> None:
+    _WORKER_STATE.update(
+        windows=windows,
+        index=index,
+        weeks=weeks,
+        geometry=geometry,
+        visuals=visuals,
+        output_dir=output_dir,
+        png_dpi=png_dpi,
+        preview_widths=preview_widths,
+        crop_codes=crop_codes,
+    )
+
+
+def _scaled(frame: Image.Image, width: int) -> Image.Image:
+    if frame.width == width:
+        return frame
+    height = max(1, round(frame.height * width / frame.width))
+    # reducing_gap box-reduces first, so huge farms shrink in one cheap pass.
+    return frame.resize((width, height), Image.Resampling.BILINEAR, reducing_gap=2.0)
+
+
+def _captioned(frame: Image.Image, caption: str) -> Image.Image:
+    canvas = Image.new("RGB", (frame.width, frame.height + CAPTION_HEIGHT), "white")
+    canvas.paste(frame.convert("RGB"), (0, CAPTION_HEIGHT))
+    ImageDraw.Draw(canvas).text((6, 6), caption, fill="#111111")
+    return canvas
+
+
+def _render_frame(week_idx: int) -> tuple[Path, Image.Image, Image.Image, set[str]]:
+    """Write one week's SVG and PNG frames; return the PNG path, previews, and
+    the crops labelled without a crop code.
+
+    The GIF frame and contact-sheet thumbnail are scaled, captioned, and (for
+    the GIF) palettized here from the in-memory raster, so the parent only
+    assembles small images and never decodes full-size frames.
+    """
+    state = _WORKER_STATE
+    week = state["weeks"][week_idx]
+    svg_path, png_path = _frame_paths(state["output_dir"], week_idx, week)
+    active = state["windows"].loc[state["index"][week_idx]]
+    _, layout = layout_assignments(
+        active,
+        state["geometry"],
+        state["visuals"],
+        state["crop_codes"],
+    )
+    with svg_path.open("w", encoding="utf-8") as handle:
+        write_grid_svg(handle, layout)
+    buf = rasterize(layout, state["png_dpi"])
+    save_png(buf, png_path, state["png_dpi"])
+
+    frame = Image.fromarray(buf)
+    gif_width, thumb_width = state["preview_widths"]
+    gif_frame = _captioned(_scaled(frame, gif_width), f"Week of {week:%Y-%m-%d}").quantize(
+        method=Image.Quantize.FASTOCTREE,
+        dither=Image.Dither.NONE,
+    )
+    thumb = _captioned(_scaled(frame, thumb_width), f"{week:%Y-%m-%d}")
+    return png_path, gif_frame, thumb, layout.missing_codes
+
+
+def write_animation(
+    frames: list[Image.Image],
+    output_gif: Path,
+    frame_ms: int = 500,
+) -> None:
+    frames[0].save(
+        output_gif,
+        save_all=True,
+        append_images=frames[1:],
+        duration=frame_ms,
+        loop=0,
+    )
+
+
+def write_contact_sheet(
+    thumbs: list[Image.Image],
+    output_png: Path,
+    columns: int = 8,
+) -> None:
+    cell_w = max(t.width for t in thumbs)
+    cell_h = max(t.height for t in thumbs)
+    columns = max(1, min(columns, len(thumbs)))
+    rows = -(-len(thumbs) // columns)
+    sheet = Image.new("RGB", (cell_w * columns, cell_h * rows), "white")
+    for idx, thumb in enumerate(thumbs):
+        sheet.paste(thumb, ((idx % columns) * cell_w, (idx // columns) * cell_h))
+    sheet.save(output_png)
+
+
+def render_timelapse(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_dir: Path,
+    schema_version: int,
+    workers: int | None = None,
+    start: str | None = None,
+    end: str | None = None,
+    png_dpi: float | None = None,
+    frame_ms: int = 500,
+    gif_width: int = 480,
+    thumb_width: int = 240,
+    crop_codes_path: Path | None = None,
+) -> list[Path]:
+    """Render one frame per season week in parallel; return the PNG frame paths.
+
+    Inputs are loaded and the occupancy index is built once in the parent;
+    each worker receives them once through the pool initializer and then only
+    a week index per frame.
+    """
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    crop_codes = load_crop_codes(crop_codes_path, schema_version)
+    df_assignments, df_schedule = load_assignments(
+        assignments_path,
+        schedule_path,
+        geometry_path,
+        schema_version,
+    )
+    windows = occupancy_windows(df_assignments, df_schedule)
+    weeks = season_weeks(windows, start, end)
+    index = build_occupancy_index(windows, weeks)
+
+    (output_dir / "frames").mkdir(parents=True, exist_ok=True)
+    dpi = png_dpi if png_dpi is not None else float(visuals.get("png_dpi", 96))
+    init_args = (
+        windows,
+        index,
+        weeks,
+        geometry,
+        visuals,
+        output_dir,
+        dpi,
+        (gif_width, thumb_width),
+        crop_codes,
+    )
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        _init_worker(*init_args)
+        results = [_render_frame(idx) for idx in range(len(weeks))]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=init_args,
+        ) as pool:
+            results = list(pool.map(_render_frame, range(len(weeks))))
+
+    warn_missing_crop_codes(set().union(*(missing for *_, missing in results)))
+    frame_paths = [path for path, *_ in results]
+    write_animation(
+        [gif for _, gif, _, _ in results],
+        output_dir / "bed-grid-timelapse.gif",
+        frame_ms,
+    )
+    write_contact_sheet(
+        [thumb for _, _, thumb, _ in results],
+        output_dir / "bed-grid-contact-sheet.png",
+    )
+    return frame_paths
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--assignments",
+        default="data/plans/bed-assignments.csv",
+        help="Path to bed assignments CSV",
+    )
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--geometry",
+        default="data/plans/config/bed-geometry.jsonl",
+        help="Path to bed geometry JSONL",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--crop-codes",
+        default="data/plans/config/crop-codes.jsonl",
+        help="Path to crop code JSONL used by compact labels (optional)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default="exports/timelapse",
+        help="Directory for frames, GIF, and contact sheet",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count; 1 renders in-process)",
+    )
+    parser.add_argument("--start", default=None, help="First week (YYYY-MM-DD)")
+    parser.add_argument("--end", default=None, help="Last week (YYYY-MM-DD)")
+    parser.add_argument("--dpi", type=float, default=None, help="Frame PNG resolution")
+    parser.add_argument(
+        "--frame-ms",
+        type=int,
+        default=500,
+        help="GIF frame duration in milliseconds",
+    )
+    parser.add_argument(
+        "--gif-width",
+        type=int,
+        default=480,
+        help="GIF frame width in pixels",
+    )
+    parser.add_argument(
+        "--thumb-width",
+        type=int,
+        default=240,
+        help="Contact sheet thumbnail width",
+    )
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    try:
+        frames = render_timelapse(
+            Path(args.assignments),
+            Path(args.schedule),
+            Path(args.geometry),
+            Path(args.visuals),
+            output_dir,
+            args.schema_version,
+            workers=args.workers,
+            start=args.start,
+            end=args.end,
+            png_dpi=args.dpi,
+            frame_ms=args.frame_ms,
+            gif_width=args.gif_width,
+            thumb_width=args.thumb_width,
+            crop_codes_path=Path(args.crop_codes),
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    print(f"Saved {len(frames)} frames to {output_dir / 'frames'}")
+    print(f"Saved animation to {output_dir / 'bed-grid-timelapse.gif'}")
+    print(f"Saved contact sheet to {output_dir / 'bed-grid-contact-sheet.png'}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
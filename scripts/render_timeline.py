@@ -0,0 +1,285 @@
+#!/usr/bin/env -S uv run python
+"""Render a Gantt-style timeline of succession waves to SVG and PNG."""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.build_assignments import load_schedule
+from scripts.calculate_succession_planting import NURSERY_LEAD_TIME_DAYS
+from scripts.io.schema import validate_required_columns
+from scripts.io.text_layout import ELLIPSIS, fit_label, wrap_label
+from scripts.io.waves import harvest_durations
+from scripts.render_grid import (
+    DEFAULT_STATUS_COLORS,
+    FRAME_FILL,
+    LABEL_PADDING,
+    GridLayout,
+    LayoutLabel,
+    LayoutRect,
+    RectStyle,
+    load_jsonl_config,
+    write_grid_png,
+    write_grid_svg,
+)
+
+BAND_FILL = "#F5F5F5"
+
+# Bar segments from order to end of harvest, each drawn as (alpha, border).
+SEGMENT_STYLES = {
+    "order": (0.2, "dotted"),
+    "grow": (0.5, "solid"),
+    "harvest": (1.0, "solid"),
+}
+
+# Bars sharing a lane keep at least this many days apart so labels don't touch.
+LANE_GAP_DAYS = 1
+
+
+def timeline_waves(df_schedule: pd.DataFrame) -> pd.DataFrame:
+    """One row per wave with ``order_date``, ``plant_date``, ``first_harvest_date``, ``harvest_end``.
+
+    ``order_date`` comes from the schedule when present; otherwise transplants
+    are ordered ``NURSERY_LEAD_TIME_DAYS`` before planting and direct-sown
+    crops on their plant date. ``harvest_end`` adds the harvest window the
+    time-lapse uses. Waves without plant or first harvest dates are dropped.
+    """
+    validate_required_columns(
+        df_schedule,
+        ["wave_id", "plant_type", "crop", "variety", "plant_date", "first_harvest_date"],
+        "succession schedule",
+    )
+    plant = pd.to_datetime(df_schedule["plant_date"], errors="coerce")
+    first_harvest = pd.to_datetime(df_schedule["first_harvest_date"], errors="coerce")
+    method = df_schedule.get("method", pd.Series("", index=df_schedule.index))
+    derived_order = plant.where(
+        method != "transplant",
+        plant - pd.Timedelta(days=NURSERY_LEAD_TIME_DAYS),
+    )
+    if "order_date" in df_schedule.columns:
+        order = pd.to_datetime(df_schedule["order_date"], errors="coerce").fillna(derived_order)
+    else:
+        order = derived_order
+
+    waves = pd.DataFrame(
+        {
+            "wave_id": df_schedule["wave_id"],
+            "plant_type": df_schedule["plant_type"].fillna("").astype(str),
+            "crop": df_schedule["crop"].astype(str),
+            "variety": df_schedule["variety"].fillna("").astype(str),
+            "order_date": order,
+            "plant_date": plant,
+            "first_harvest_date": first_harvest,
+            "harvest_end": first_harvest + harvest_durations(df_schedule),
+        }
+    )
+    waves = waves.dropna(subset=["plant_date", "first_harvest_date"])
+    return waves.drop_duplicates("wave_id").reset_index(drop=True)
+
+
+def assign_lanes(starts: np.ndarray, ends: np.ndarray, gap: float = 0) -> np.ndarray:
+    """Greedy interval partitioning: the fewest lanes with no overlaps in a lane.
+
+    Intervals are placed in start order. Each one reuses the lane that freed
+    up earliest when that lane is clear by ``start - gap``, else opens a new
+    lane, which is optimal and O(n log n).
+    """
+    lanes = np.empty(len(starts), dtype=int)
+    free: list[tuple[float, int]] = []
+    for idx in np.argsort(starts, kind="stable"):
+        if free and free[0][0] + gap <= starts[idx]:
+            _, lane = heapq.heappop(free)
+        else:
+            lane = len(free)
+        lanes[idx] = lane
+        heapq.heappush(free, (ends[idx], lane))
+    return lanes
+
+
+def month_starts(first: pd.Timestamp, last: pd.Timestamp) -> pd.DatetimeIndex:
+    """Month boundaries covering ``first``..``last``, ending on the month after ``last``."""
+    start = first.to_period("M").to_timestamp()
+    end = (last.to_period("M") + 1).to_timestamp()
+    return pd.date_range(start, end, freq="MS")
+
+
+def build_timeline_layout(waves: pd.DataFrame, visuals: dict) -> GridLayout:
+    """Place the month header, one band per plant_type, and the lane-packed bars.
+
+    Groups are sorted by name and each packs its waves into lanes with
+    ``assign_lanes``. Each bar has three segments: order to plant (faint,
+    dotted), plant to first harvest, and first harvest to end of harvest.
+    """
+    if waves.empty:
+        raise ValueError("No dated waves to draw a timeline from")
+    label_width = int(visuals.get("timeline_label_width", 120))
+    day_px = float(visuals.get("timeline_day_px", 4))
+    lane_height = int(visuals.get("timeline_lane_height", 16))
+    bar_font_size = int(visuals.get("timeline_font_size", 8))
+    group_font_size = int(visuals.get("timeline_group_font_size", 10))
+    font_family = visuals.get("font_family", "Helvetica")
+    family_colors = visuals.get("family_colors", {})
+    header_height = lane_height * 1.5
+    bar_inset = max(1, lane_height // 8)
+
+    months = month_starts(waves["order_date"].min(), waves["harvest_end"].max())
+    epoch = months[0]
+
+    def x_at(dates: pd.Series) -> np.ndarray:
+        return label_width + (dates - epoch).dt.days.to_numpy() * day_px
+
+    width = label_width + (months[-1] - epoch).days * day_px
+    layout = GridLayout(
+        width=width,
+        height=header_height,
+        font_family=font_family,
+        fonts={"tb": bar_font_size, "tg": group_font_size},
+        styles={"frame": RectStyle(FRAME_FILL), "band": RectStyle(BAND_FILL)},
+    )
+
+    layout.rects.append(LayoutRect(0, 0, label_width, header_height, "frame"))
+    layout.labels.append(LayoutLabel(label_width / 2, header_height / 2, ("Family",), "tg"))
+    month_x = x_at(pd.Series(months))
+    for month, x0, x1 in zip(months[:-1], month_x[:-1], month_x[1:]):
+        layout.rects.append(LayoutRect(x0, 0, x1 - x0, header_height, "frame"))
+        text = fit_label(f"{month:%b %Y}", font_family, group_font_size, x1 - x0 - 2 * LABEL_PADDING)
+        if text and text != ELLIPSIS:
+            layout.labels.append(LayoutLabel((x0 + x1) / 2, header_height / 2, (text,), "tg"))
+
+    y = header_height
+    for group_idx, (plant_type, group) in enumerate(waves.groupby("plant_type", sort=True)):
+        color = family_colors.get(plant_type, DEFAULT_STATUS_COLORS["CROP"])
+        for segment, (alpha, border) in SEGMENT_STYLES.items():
+            layout.styles[f"g{group_idx}-{segment}"] = RectStyle(color, alpha, border)
+
+        order_day = (group["order_date"] - epoch).dt.days.to_numpy()
+        end_day = (group["harvest_end"] - epoch).dt.days.to_numpy()
+        lanes = assign_lanes(order_day, end_day, LANE_GAP_DAYS)
+        group_height = (int(lanes.max()) + 1) * lane_height
+
+        band = "band" if group_idx % 2 else "frame"
+        layout.rects.append(LayoutRect(0, y, label_width, group_height, "frame"))
+        layout.rects.append(LayoutRect(label_width, y, width - label_width, group_height, band))
+        max_lines = max(1, int(group_height // (group_font_size * 1.2)))
+        title = f"{plant_type or 'Unassigned'} ({len(group)})"
+        lines = wrap_label(title, font_family, group_font_size, label_width - 2 * LABEL_PADDING, max_lines)
+        layout.labels.append(LayoutLabel(label_width / 2, y + group_height / 2, lines, "tg"))
+
+        edges = [x_at(group[column]) for column in ("order_date", "plant_date", "first_harvest_date", "harvest_end")]
+        bar_y = y + lanes * lane_height + bar_inset
+        bar_height = lane_height - 2 * bar_inset
+        for idx, row in enumerate(group.itertuples(index=False)):
+            for seg_idx, segment in enumerate(SEGMENT_STYLES):
+                x0, x1 = edges[seg_idx][idx], edges[seg_idx + 1][idx]
+                if x1 > x0:
+                    layout.rects.append(
+                        LayoutRect(x0, bar_y[idx], x1 - x0, bar_height, f"g{group_idx}-{segment}")
+                    )
+            name = f"{row.crop} / {row.variety}" if row.variety else row.crop
+            x0, x1 = edges[1][idx], edges[3][idx]
+            text = fit_label(name, font_family, bar_font_size, x1 - x0 - 2 * LABEL_PADDING)
+            if text and text != ELLIPSIS:
+                layout.labels.append(
+                    LayoutLabel((x0 + x1) / 2, bar_y[idx] + bar_height / 2, (text,), "tb")
+                )
+        y += group_height
+
+    layout.height = y
+    return layout
+
+
+def render_timeline(
+    schedule_path: Path,
+    visuals_path: Path,
+    output_svg: Path,
+    output_png: Path | None,
+    schema_version: int,
+    png_dpi: float | None = None,
+    png_backend: str = "native",
+) -> pd.DataFrame:
+    """Write the wave timeline; return the waves drawn with their dates."""
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    waves = timeline_waves(load_schedule(schedule_path))
+    layout = build_timeline_layout(waves, visuals)
+
+    output_svg.parent.mkdir(parents=True, exist_ok=True)
+    with output_svg.open("w", encoding="utf-8") as handle:
+        write_grid_svg(handle, layout)
+    if output_png is not None:
+        output_png.parent.mkdir(parents=True, exist_ok=True)
+        dpi = png_dpi if png_dpi is not None else float(visuals.get("png_dpi", 96))
+        write_grid_png(layout, output_svg, output_png, dpi, png_backend)
+    return waves
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--output-svg",
+        default="exports/wave-timeline.svg",
+        help="Path to output timeline SVG",
+    )
+    parser.add_argument(
+        "--output-png",
+        default="exports/wave-timeline.png",
+        help="Path to output timeline PNG",
+    )
+    parser.add_argument("--skip-png", action="store_true", help="Skip PNG rasterization")
+    parser.add_argument(
+        "--png-backend",
+        choices=["native", "cairo"],
+        default="native",
+        help="PNG renderer: native painter (default) or CairoSVG from the SVG",
+    )
+    parser.add_argument(
+        "--dpi",
+        type=float,
+        default=None,
+        help="PNG resolution (default: png_dpi from visuals, else 96)",
+    )
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    output_png = None if args.skip_png else Path(args.output_png)
+    try:
+        waves = render_timeline(
+            Path(args.schedule),
+            Path(args.visuals),
+            Path(args.output_svg),
+            output_png,
+            args.schema_version,
+            png_dpi=args.dpi,
+            png_backend=args.png_backend,
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    print(f"Saved timeline of {len(waves)} waves to {args.output_svg}")
+    if output_png is not None:
+        print(f"Saved timeline PNG to {args.output_png}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,213 @@
+#!/usr/bin/env -S uv run python
+"""Export the bed grid as a self-contained interactive HTML viewer."""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import html
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.io.waves import occupancy_windows
+from scripts.render_grid import (
+    bed_notes_for,
+    build_grid,
+    build_runs,
+    grid_geometry,
+    load_assignments,
+    load_jsonl_config,
+)
+
+TEMPLATE_PATH = Path(__file__).parent / "io" / "plan_viewer.html"
+PAYLOAD_VERSION = 1
+
+# Run columns shipped to the browser as indexes into the shared string table.
+STRING_COLUMNS = [
+    "status",
+    "crop",
+    "variety",
+    "wave_id",
+    "family",
+    "water",
+    "notes",
+    "conflict_details",
+    "color",
+    "border_style",
+]
+
+
+def _days(values: pd.Series, epoch: pd.Timestamp) -> list[int]:
+    """Whole days since ``epoch``; -1 marks a missing date."""
+    days = (pd.to_datetime(values, errors="coerce") - epoch).dt.days
+    return days.fillna(-1).astype(int).tolist()
+
+
+def viewer_payload(
+    df_assignments: pd.DataFrame,
+    df_schedule: pd.DataFrame,
+    geometry: dict,
+    visuals: dict,
+    title: str,
+) -> dict:
+    """Columnar run table plus schedule dates, with strings dictionary-encoded.
+
+    Each run carries its wave's plant date, first harvest date, and the end of
+    its occupancy window (the same window the time-lapse uses) as day offsets
+    from ``epoch``, which drive the viewer's date slider.
+    """
+    bed_count, blocks_per_bed = grid_geometry(geometry)
+    runs = build_runs(build_grid(df_assignments, geometry, visuals))
+
+    windows = occupancy_windows(df_assignments, df_schedule)
+    waves = df_schedule.drop_duplicates("wave_id").set_index("wave_id")
+    wave_dates = (
+        windows.dropna(subset=["occupied_from"])
+        .drop_duplicates("wave_id")
+        .set_index("wave_id")[["occupied_from", "occupied_until"]]
+    )
+    runs = runs.join(wave_dates, on="wave_id")
+    runs["first_harvest_date"] = runs["wave_id"].map(waves["first_harvest_date"])
+
+    dated = pd.concat([runs["occupied_from"], runs["occupied_until"]]).dropna()
+    epoch = dated.min() if not dated.empty else pd.Timestamp("1970-01-01")
+
+    bed_notes = bed_notes_for(df_assignments)
+    text = runs[STRING_COLUMNS].fillna("").astype(str)
+    notes_text = pd.Series(list(bed_notes.values()), dtype=str)
+    codes, strings = pd.factorize(
+        pd.concat([text[column] for column in STRING_COLUMNS] + [notes_text]),
+        sort=False,
+    )
+    n_runs = len(runs)
+
+    columns: dict[str, list] = {
+        "bed": runs["bed_id"].astype(int).tolist(),
+        "start": runs["start_block"].astype(int).tolist(),
+        "end": runs["end_block"].astype(int).tolist(),
+        "alpha": np.round(runs["alpha"].astype(float), 3).tolist(),
+        "plant": _days(runs["occupied_from"], epoch),
+        "first_harvest": _days(runs["first_harvest_date"], epoch),
+        "until": _days(runs["occupied_until"], epoch),
+    }
+    for idx, column in enumerate(STRING_COLUMNS):
+        columns[column] = codes[idx * n_runs : (idx + 1) * n_runs].tolist()
+    notes_codes = codes[len(STRING_COLUMNS) * n_runs :].tolist()
+
+    return {
+        "version": PAYLOAD_VERSION,
+        "title": title,
+        "bed_count": bed_count,
+        "blocks_per_bed": blocks_per_bed,
+        "block_size_ft": int(geometry["block_size_ft"]),
+        "epoch": f"{epoch:%Y-%m-%d}",
+        "strings": strings.tolist(),
+        "runs": columns,
+        "bed_notes": {"bed": list(bed_notes.keys()), "notes": notes_codes},
+        "family_colors": visuals.get("family_colors", {}),
+    }
+
+
+def encode_payload(payload: dict) -> str:
+    """Compact JSON, gzip-compressed and base64-encoded for inline embedding."""
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.b64encode(gzip.compress(raw, compresslevel=9, mtime=0)).decode("ascii")
+
+
+def write_viewer_html(output_html: Path, payload: dict) -> None:
+    template = TEMPLATE_PATH.read_text(encoding="utf-8")
+    page = template.replace("__TITLE__", html.escape(payload["title"])).replace(
+        "__PLAN_DATA__", encode_payload(payload)
+    )
+    output_html.parent.mkdir(parents=True, exist_ok=True)
+    output_html.write_text(page, encoding="utf-8")
+
+
+def render_viewer(
+    assignments_path: Path,
+    schedule_path: Path,
+    geometry_path: Path,
+    visuals_path: Path,
+    output_html: Path,
+    schema_version: int,
+    title: str | None = None,
+) -> dict:
+    geometry = load_jsonl_config(geometry_path, schema_version)
+    visuals = load_jsonl_config(visuals_path, schema_version)
+    df_assignments, df_schedule = load_assignments(
+        assignments_path,
+        schedule_path,
+        geometry_path,
+        schema_version,
+    )
+    payload = viewer_payload(
+        df_assignments,
+        df_schedule,
+        geometry,
+        visuals,
+        title or assignments_path.stem,
+    )
+    write_viewer_html(output_html, payload)
+    return payload
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--assignments",
+        default="data/plans/bed-assignments.csv",
+        help="Path to bed assignments CSV",
+    )
+    parser.add_argument(
+        "--schedule",
+        default="data/schedules/succession-schedule.csv",
+        help="Path to succession schedule CSV",
+    )
+    parser.add_argument(
+        "--geometry",
+        default="data/plans/config/bed-geometry.jsonl",
+        help="Path to bed geometry JSONL",
+    )
+    parser.add_argument(
+        "--visuals",
+        default="data/plans/config/bed-visuals.jsonl",
+        help="Path to bed visuals JSONL",
+    )
+    parser.add_argument(
+        "--output-html",
+        default="exports/bed-grid.html",
+        help="Path to output HTML viewer",
+    )
+    parser.add_argument("--title", default=None, help="Page title (default: plan file name)")
+    parser.add_argument(
+        "--schema-version",
+        type=int,
+        default=1,
+        help="Expected schema_version for inputs",
+    )
+    args = parser.parse_args()
+
+    try:
+        payload = render_viewer(
+            Path(args.assignments),
+            Path(args.schedule),
+            Path(args.geometry),
+            Path(args.visuals),
+            Path(args.output_html),
+            args.schema_version,
+            title=args.title,
+        )
+    except Exception as exc:
+        print(f"Error: {exc}")
+        return 1
+
+    print(f"Saved viewer with {len(payload['runs']['bed'])} runs to {args.output_html}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
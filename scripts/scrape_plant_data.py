@@ -2,210 +2,112 @@
 """Scrape plant data from supplier product pages.
 
 Performance notes:
-- Default batch size: 25 concurrent requests per batch
-- Batch delay: 1.0s between batches
-- These values balance speed with being respectful to the supplier websites
+- All requests share one pooled async HTTP client with keep-alive connections
+- Each supplier host gets a token bucket: bursts of up to --batch-size
+  requests, refilled at --batch-size per --batch-delay seconds (default 25/s)
+- Rows start as soon as their host has budget, so one slow page never holds
+  up the others
+- Each page is parsed once, keeping only the supplier's product sections; the
+  cache stores that small fragment rather than the page
+- Parsing runs in a process pool (--parse-workers) fed from the async fetch
+  stage; when the pool is backed up, fetching pauses instead of buffering pages
+- Rows are grouped by canonical product URL (query variants, fragments, and
+  host case dropped), so a page shared by several rows or input files is
+  fetched and parsed once and its result fanned out to every row
+- Finished rows are journaled as they land, so an interrupted run can
+  --resume without refetching them
 """
 from __future__ import annotations
 
 import argparse
-import hashlib
+import asyncio
 import json
-import re
-import tempfile
+import math
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-import httpx
 import pandas as pd
-from bs4 import BeautifulSoup
-from tenacity import retry, stop_after_attempt, wait_exponential
-
-# Columns expected from SDSC pages (order matters for output)
-# Note: planting_season is scraped but validated against existing 'season' column
-# Fields common to both sources get web_ prefix, SDSC-only get sdsc_ prefix
-SDSC_COLUMNS: list[str] = [
-    "web_botanical_name",
-    "web_soil_temp",
-    "web_planting_depth",
-    "sdsc_days_to_germ",
-    "web_days_to_maturity",
-    "sdsc_succession",
-    "web_best_planting_method",
-    "web_thin_to",
-    "web_final_spacing",
-    "sdsc_area_to_sow",
-    "web_seeds_per_packet",  # SDSC calls this "approx_seed_count" but we map it
-    "sdsc_product_weight",
-    "sdsc_plant_height",
-    "sdsc_plant_spread",
-]
+
+from scripts.io.ai_memo import DEFAULT_MEMO_PATH, AiMemo
+from scripts.io.http_cache import (
+    DEFAULT_CACHE_PATH,
+    DEFAULT_MAX_MB,
+    DEFAULT_TTL_DAYS,
+    DAY_SECONDS,
+    HttpCache,
+    fetch_cached,
+    parse_ttls,
+)
+from scripts.io.http_client import AsyncFetcher, politeness_rate
+from scripts.io.page_extract import extract_fragment, fragment_cache_key
+from scripts.io.scrape_changes import append_change_log, change_log_path_for, fingerprint, refresh_records
+from scripts.io.scrape_journal import ScrapeJournal, journal_path_for, load_journal, merge_records
+from scripts.io.parse_pool import ParsePool, default_workers
+from scripts.io.scrape_metrics import ScrapeMetrics, report_path_for
+from scripts.io.tnh_gen import PROMPTS_DIR, PromptBatcher, run_prompt
+from scripts.io.urls import is_http_url, product_url
+from scripts.suppliers import SUPPLIERS, get_supplier, scraped_columns, supplier_for_url
+from scripts.suppliers.johnnys import JS
 
 # Additional fields we scrape for validation but don't add as columns
 VALIDATION_ONLY_FIELDS: list[str] = [
     "planting_season",  # Validated against existing 'season' column
 ]
 
-# Columns expected from Johnny's Selected Seeds pages
-# Fields common to both sources get web_ prefix, JS-only get js_ prefix
-JS_COLUMNS: list[str] = [
-    "web_botanical_name",
-    "web_planting_depth",
-    "web_days_to_maturity",
-    "web_thin_to",
-    "web_final_spacing",
-    "web_seeds_per_packet",
-    "js_growing_notes",  # JS-only field
-]
-
 METADATA_COLUMNS: list[str] = [
     "scrape_status",
     "scrape_date",
+    "scrape_fingerprint",
 ]
 
-# Preserve order from SDSC_COLUMNS (most complete), then add JS-only, then metadata
-_sdsc_set = set(SDSC_COLUMNS)
-_js_only = [c for c in JS_COLUMNS if c not in _sdsc_set]
-ALL_SCRAPED_COLUMNS: list[str] = SDSC_COLUMNS + _js_only + METADATA_COLUMNS
-
-USER_AGENT = "HappyFarmBot/1.0 (educational research)"
-
-# Normalize table header labels to our column names (with prefixes)
-SDSC_LABEL_MAP: dict[str, str] = {
-    "product_weight": "sdsc_product_weight",
-    "planting_season": "planting_season",
-    "soil_temp_for_germination": "web_soil_temp",
-    "soil_temp": "web_soil_temp",
-    "planting_depth": "web_planting_depth",
-    "area_to_sow": "sdsc_area_to_sow",
-    "days_to_germ": "sdsc_days_to_germ",
-    "days_to_maturity": "web_days_to_maturity",
-    "best_planting_method": "web_best_planting_method",
-    "thin_to": "web_thin_to",
-    "final_spacing": "web_final_spacing",
-    "succession": "sdsc_succession",
-    "approx._seed_count": "web_seeds_per_packet",  # Map SDSC's approx_seed_count to unified field
-    "approx_seed_count": "web_seeds_per_packet",   # Map SDSC's approx_seed_count to unified field
-    "botanical_name": "web_botanical_name",
-    "plant_spread": "sdsc_plant_spread",
-    "plant_height": "sdsc_plant_height",
-}
-
-
-def normalize_label(label: str) -> str:
-    """Normalize table header labels to snake_case keys."""
-    normalized = re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
-    normalized = re.sub(r"_+", "_", normalized)
-    return normalized
-
-
-def get_cache_path(url: str) -> Path:
-    """Generate a deterministic cache filename from the URL."""
-    url_hash = hashlib.md5(url.encode()).hexdigest()
-    cache_dir = Path(tempfile.gettempdir()) / "happy-farm-scraper"
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    return cache_dir / f"{url_hash}.html"
-
-
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(min=1, max=10))
-def fetch_url(url: str) -> str:
-    headers = {"User-Agent": USER_AGENT}
-    response = httpx.get(url, headers=headers, timeout=10.0)
-    response.raise_for_status()
-    return response.text
-
-
-def fetch_with_cache(url: str, use_cache: bool = True) -> str:
-    cache_path = get_cache_path(url)
-
-    if use_cache and cache_path.exists():
-        return cache_path.read_text()
-
-    html = fetch_url(url)
-    soup = BeautifulSoup(html, "html.parser")
-    body = soup.find("body")
-    body_html = str(body) if body else html
-
-    if use_cache:
-        cache_path.write_text(body_html)
-
-    return body_html
-
-
-def parse_sdsc(html: str) -> dict[str, Any]:
-    soup = BeautifulSoup(html, "html.parser")
-    table = soup.find("table", class_="woocommerce-product-attributes")
-    if not table:
-        return {}
-
-    data: dict[str, Any] = {}
-    for row in table.find_all("tr"):
-        th = row.find("th")
-        td = row.find("td")
-        if not th or not td:
-            continue
+# Every registered supplier's columns (most complete supplier first), then metadata
+SUPPLIER_COLUMNS: list[str] = scraped_columns()
+ALL_SCRAPED_COLUMNS: list[str] = SUPPLIER_COLUMNS + METADATA_COLUMNS
 
-        label = normalize_label(th.get_text(strip=True))
-        value = td.get_text(strip=True)
 
-        column = SDSC_LABEL_MAP.get(label)
-        if column:
-            data[column] = value
+async def fetch_with_cache(
+    fetcher: AsyncFetcher,
+    url: str,
+    cache: HttpCache | None = None,
+    supplier: str = "",
+    parse_pool: ParsePool | None = None,
+) -> dict[str, Any]:
+    """Extracted page fragment, served from ``cache`` within the supplier's TTL.
 
-    return data
+    The page is parsed once on download, in ``parse_pool`` when given, and
+    only the fragment is cached, so cache hits skip HTML parsing entirely.
+    """
+    fragment = await fetch_cached(
+        fetcher,
+        cache,
+        url,
+        ttl_key=supplier,
+        transform=partial(extract_fragment, supplier=supplier),
+        key=fragment_cache_key(url, supplier),
+        parse_pool=parse_pool,
+    )
+    return json.loads(fragment)
 
 
-def parse_js_with_ai(html: str, prompt_file: Path | None = None) -> dict[str, Any]:
-    """Parse Johnny's Seeds HTML using tnh-gen CLI for AI extraction.
+def parse_js_with_ai(fragment: dict[str, Any], prompt_file: Path | None = None) -> dict[str, Any]:
+    """Parse Johnny's Seeds page sections using tnh-gen CLI for AI extraction.
 
     Args:
-        html: HTML content from Johnny's Seeds product page
+        fragment: Page sections from ``extract_js``
         prompt_file: Path to prompt template file (defaults to prompts/extract_johnnys_seeds_data.md)
 
     Returns:
         Dictionary of extracted plant data fields
     """
-    import subprocess
-
-    soup = BeautifulSoup(html, "html.parser")
-
-    # Extract relevant sections
-    sections = []
-
-    # 1. Extract "Quick Facts" section (has days to maturity, latin name, etc.)
-    quick_facts = soup.find("div", class_="c-facts")
-    if quick_facts:
-        sections.append(f"QUICK FACTS SECTION:\n{quick_facts.get_text(' ', strip=True)}")
-
-    # 2. Extract "details" section (has packet size and notes)
-    details_section = soup.find("div", class_="details")
-    if details_section:
-        sections.append(f"DETAILS SECTION:\n{details_section.get_text(' ', strip=True)}")
-
-    # 3. Extract "Growing Information" accordion section
-    # Find the accordion item with "Growing Information" heading
-    for accordion_item in soup.find_all("div", class_="c-accordion__item"):
-        heading_link = accordion_item.find("a", class_="c-accordion__heading__link")
-        if heading_link and "Growing Information" in heading_link.get_text(strip=True):
-            accordion_body = accordion_item.find("div", class_="c-accordion__body")
-            if accordion_body:
-                sections.append(f"GROWING INFORMATION SECTION:\n{accordion_body.get_text(' ', strip=True)}")
-                break
-
-    if not sections:
-        return {}
-
-    text_content = "\n\n".join(sections)
+    text_content = JS.prompt_input(fragment)
     if not text_content:
         return {}
 
     # Default prompt file location
     if prompt_file is None:
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent
-        prompt_file = project_root / "prompts" / "extract_johnnys_seeds_data.md"
+        prompt_file = PROMPTS_DIR / f"{JS.prompt_key}.md"
 
     if not prompt_file.exists():
         raise FileNotFoundError(
@@ -213,217 +115,376 @@ def parse_js_with_ai(html: str, prompt_file: Path | None = None) -> dict[str, An
             "Please ensure prompts/extract_johnnys_seeds_data.md exists."
         )
 
-    # Write text content to temp file for tnh-gen to process
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as tmp:
-        tmp.write(text_content)
-        tmp_path = tmp.name
+    # Use the prompt filename without extension as the key
+    return JS.prompt_fields(run_prompt(Path(prompt_file).stem, text_content))
 
-    try:
-        # Call tnh-gen CLI (installed via pipx)
-        # Configure to use happy-farm's prompts directory via environment variable
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent
-        prompts_dir = project_root / "prompts"
-
-        # Use the prompt filename without extension as the key
-        prompt_key = Path(prompt_file).stem  # e.g., "extract_johnnys_seeds_data"
-
-        # Run tnh-gen with TNH_PROMPT_DIR environment variable to override catalog location
-        # tnh-gen is installed via pipx --editable, so it's globally available
-        env = {"TNH_PROMPT_DIR": str(prompts_dir)}
-        result = subprocess.run(
-            [
-                "tnh-gen", "--api", "run",
-                "--prompt", prompt_key,
-                "--input-file", tmp_path
-            ],
-            env={**subprocess.os.environ, **env},  # Merge with existing env
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
 
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"tnh-gen failed with exit code {result.returncode}.\n"
-                f"stdout: {result.stdout}\n"
-                f"stderr: {result.stderr}"
-            )
+def row_values(
+    row: pd.Series,
+    scraped: dict[str, Any],
+    status: str,
+    expected_cols: list[str],
+    overwrite: bool = False,
+) -> dict[str, Any]:
+    """Column values to write for a finished row.
+
+    Scraped fields, plus NOT_FOUND for expected fields the page lacked and
+    N/A for the other supplier's fields, wherever the row has no value yet.
+    With ``overwrite``, expected fields the page lacked are NOT_FOUND even
+    if the row had a value. A scraped planting season is checked against the
+    row's ``season`` and not written.
+    """
+    values = dict(scraped)
 
-        # Parse JSON output from tnh-gen
-        # tnh-gen returns a response envelope: {"status": "succeeded", "result": {"text": "..."}}
-        result_text = result.stdout.strip()
+    # Validate planting_season vs existing season column
+    scraped_season = values.pop("planting_season", None)
+    if scraped_season:
+        existing_season = row.get("season")
+        if isinstance(existing_season, str) and existing_season.strip():
+            if existing_season.lower() != str(scraped_season).lower():
+                print(f"⚠️  Season mismatch for {row.get('variety')}: "
+                      f"existing='{existing_season}' vs scraped='{scraped_season}'")
 
-        response = json.loads(result_text)
+    def empty(col: str) -> bool:
+        return col in row.index and col not in values and (pd.isna(row[col]) or row[col] == "")
 
-        # Extract the actual data from the response envelope
-        if response.get("status") != "succeeded":
-            raise RuntimeError(f"tnh-gen extraction failed: {response}")
+    # Mark expected-but-missing fields
+    for col in expected_cols:
+        if empty(col) or (overwrite and col in row.index and col not in values):
+            values[col] = "NOT_FOUND"
 
-        # Get the text field from result
-        extracted_text = response.get("result", {}).get("text", "").strip()
+    # Mark non-expected fields as N/A
+    for col in SUPPLIER_COLUMNS:
+        if col not in expected_cols and empty(col):
+            values[col] = "N/A"
 
-        # Remove markdown code fences if present in extracted text
-        if extracted_text.startswith("```"):
-            extracted_text = extracted_text.split("```")[1]
-            if extracted_text.startswith("json"):
-                extracted_text = extracted_text[4:]
-            extracted_text = extracted_text.strip()
+    values["scrape_status"] = status
+    values["scrape_date"] = pd.Timestamp.now().isoformat()
+    return values
 
-        data = json.loads(extracted_text)
 
-        # Map scientific_name to web_botanical_name if present
-        if "scientific_name" in data and data["scientific_name"]:
-            data["web_botanical_name"] = data["scientific_name"]
-            del data["scientific_name"]
+def row_supplier(row: pd.Series) -> str:
+    """The row's supplier code, or the one registered for its URL's host."""
+    supplier = row.get("supplier")
+    if isinstance(supplier, str) and supplier.strip():
+        return supplier.strip().upper()
+    plugin = supplier_for_url(_row_url(row) or "")
+    return plugin.code if plugin is not None else ""
 
-        return data
 
-    finally:
-        # Clean up temp file
-        Path(tmp_path).unlink(missing_ok=True)
+def page_key(row: pd.Series) -> tuple[str, str] | None:
+    """``(supplier, canonical URL)`` shared by every row for the same product page.
 
+    None for rows without an http(s) URL, which are never fetched.
+    """
+    url = _row_url(row)
+    if not is_http_url(url):
+        return None
+    return (row_supplier(row), product_url(url))
+
+
+async def scrape_page(
+    fetcher: AsyncFetcher,
+    url: str,
+    supplier: str,
+    cache: HttpCache | None = None,
+    batchers: dict[str, PromptBatcher] | None = None,
+    item_id: str = "0",
+    parse_pool: ParsePool | None = None,
+) -> tuple[dict[str, Any], str, list[str]]:
+    """Scrape one product page. Returns (scraped_data, status, expected_cols).
+
+    The supplier's plugin decides how the page is read. Downloaded pages are
+    reduced to fragments in ``parse_pool`` (or a worker thread), and tnh-gen
+    calls also run off the event loop, so other fetches keep moving. With
+    ``batchers`` (one per prompt key), pages read by a model join a batched
+    tnh-gen call (as ``item_id``) instead of starting one each.
+    """
+    plugin = get_supplier(supplier)
+    if plugin is None:
+        return ({}, "success", [])
 
-def mark_missing_fields(
-    df: pd.DataFrame, idx: int, expected_cols: list[str], scraped: dict[str, Any]
-) -> None:
-    # Mark expected-but-missing fields
-    for col in expected_cols:
-        if col in df.columns and (
-            pd.isna(df.at[idx, col]) or df.at[idx, col] == ""
-        ):
-            if col not in scraped:
-                df.at[idx, col] = "NOT_FOUND"
+    try:
+        fragment = await fetch_with_cache(fetcher, url, cache, plugin.code, parse_pool)
 
-    # Mark non-expected fields as N/A
-    all_possible_cols = set(SDSC_COLUMNS + JS_COLUMNS)
-    for col in all_possible_cols:
-        if col not in expected_cols and col in df.columns:
-            if pd.isna(df.at[idx, col]) or df.at[idx, col] == "":
-                df.at[idx, col] = "N/A"
+        if plugin.prompt_key is None:
+            scraped = plugin.parse(fragment)
+        else:
+            started = time.perf_counter()
+            text = plugin.prompt_input(fragment)
+            batcher = (batchers or {}).get(plugin.prompt_key)
+            if not text:
+                scraped = {}
+            elif batcher is not None:
+                scraped = plugin.prompt_fields(await batcher.submit(item_id, text))
+            else:
+                scraped = plugin.prompt_fields(await asyncio.to_thread(run_prompt, plugin.prompt_key, text))
+            if fetcher.metrics is not None:
+                fetcher.metrics.record_time(plugin.code, "llm", time.perf_counter() - started)
+
+        return (scraped, "success", list(plugin.columns))
 
+    except Exception as exc:
+        print(f"Failed to scrape {url}: {exc}")
+        return ({}, "failed", [])
+
+
+RowRef = tuple[str, Any, pd.Series]
+
+
+async def _scrape_rows(
+    rows_to_process: list[RowRef],
+    cache: HttpCache | None,
+    max_in_flight: int,
+    rate: float,
+    js_batch_size: int = 1,
+    ai_memo: AiMemo | None = None,
+    journal: ScrapeJournal | None = None,
+    metrics: ScrapeMetrics | None = None,
+    parse_workers: int = 1,
+    refresh: bool = False,
+) -> list[dict[str, Any]]:
+    """Scrape each distinct page once and fan its result out to every row.
+
+    ``rows_to_process`` holds ``(file, index, row)`` for rows from any number
+    of input files; rows are grouped by ``page_key``. Pages are fetched on
+    the event loop and parsed in ``parse_workers`` processes; once the parse
+    stage is full, finished downloads wait for it while holding their
+    in-flight slot, so no new fetches start. Each finished row is journaled
+    as it lands, with a fingerprint of what its page yielded; ``refresh``
+    replaces stored fields the page no longer has. Returns one ``{"file", "row", "url", "values"}``
+    record per row, for ``merge_records``.
+    """
+    semaphore = asyncio.Semaphore(max_in_flight)
+    batchers = {
+        supplier.prompt_key: PromptBatcher(supplier.prompt_key, js_batch_size, memo=ai_memo)
+        for supplier in SUPPLIERS.values()
+        if supplier.prompt_key is not None
+    }
+    pages: dict[tuple[str, str], list[RowRef]] = {}
+    records: list[dict[str, Any]] = []
+
+    def finish(refs: list[RowRef], scraped: dict[str, Any], status: str, expected_cols: list[str]) -> None:
+        for file, idx, row in refs:
+            values = row_values(row, scraped, status, expected_cols, overwrite=refresh)
+            if status == "success":
+                values["scrape_fingerprint"] = fingerprint(scraped, expected_cols)
+            record = {"file": file, "row": idx, "url": _row_url(row), "values": values}
+            if journal is not None:
+                journal.append(record)
+            records.append(record)
+            if metrics is not None:
+                metrics.record_row(row_supplier(row), status)
+
+    for ref in rows_to_process:
+        key = page_key(ref[2])
+        if key is None:
+            finish([ref], {}, "failed", [])
+        else:
+            pages.setdefault(key, []).append(ref)
+
+    with ParsePool(parse_workers) as parse_pool:
+        async with AsyncFetcher(
+            rate=rate,
+            burst=max_in_flight,
+            max_connections=max_in_flight,
+            metrics=metrics,
+        ) as fetcher:
+
+            async def run(
+                item_id: int,
+                key: tuple[str, str],
+            ) -> tuple[tuple[str, str], tuple[dict[str, Any], str, list[str]]]:
+                supplier, url = key
+                async with semaphore:
+                    started = time.perf_counter()
+                    result = await scrape_page(fetcher, url, supplier, cache, batchers, str(item_id), parse_pool)
+                    if metrics is not None:
+                        metrics.record_time(supplier, "row", time.perf_counter() - started)
+                    return key, result
+
+            tasks = [run(item_id, key) for item_id, key in enumerate(pages)]
+            for done, future in enumerate(asyncio.as_completed(tasks), start=1):
+                key, (scraped, status, expected_cols) = await future
+                finish(pages[key], scraped, status, expected_cols)
+                if done % max_in_flight == 0:
+                    print(f"Scraped {done}/{len(tasks)} pages...")
+
+    for prompt_key, batcher in batchers.items():
+        if batcher.batches:
+            print(f"Sent {prompt_key} pages to tnh-gen in {batcher.batches} batched calls")
+    return records
+
+
+def print_report_summary(report: dict[str, Any]) -> None:
+    """One line per host: requests, latency percentiles, retries, rate-limit wait."""
+    for host, stats in report["hosts"].items():
+        total = stats.get("total", {})
+        wait = stats.get("rate_limit_wait", {})
+        print(
+            f"  {host}: {stats.get('requests', 0)} requests, "
+            f"p50 {total.get('p50_ms', 0):g} ms, p95 {total.get('p95_ms', 0):g} ms, "
+            f"{stats.get('retries', 0)} retries, "
+            f"mean rate-limit wait {wait.get('mean_ms', 0):g} ms"
+        )
 
-def scrape_single_row(
-    idx: int,
-    row: pd.Series,
-    use_cache: bool = False,
-) -> tuple[int, dict[str, Any], str, list[str]]:
-    """Scrape a single row. Returns (idx, scraped_data, status, expected_cols)."""
-    url = row.get("url")
-    supplier = str(row.get("supplier", "")).upper()
 
-    if not isinstance(url, str) or not url:
-        return (idx, {}, "failed", [])
+def _row_url(row: pd.Series) -> str | None:
+    url = row.get("url")
+    return url if isinstance(url, str) else None
 
-    try:
-        html = fetch_with_cache(url, use_cache=use_cache)
-
-        if supplier == "SDSC":
-            scraped = parse_sdsc(html)
-            expected_cols = SDSC_COLUMNS
-        elif supplier == "JS":
-            scraped = parse_js_with_ai(html)
-            expected_cols = JS_COLUMNS
-        else:
-            scraped = {}
-            expected_cols = []
-
-        # Validate planting_season vs existing season column
-        if "planting_season" in scraped and scraped["planting_season"]:
-            existing_season = row.get("season")
-            scraped_season = scraped["planting_season"]
-            if existing_season and str(existing_season).strip():
-                if str(existing_season).lower() != str(scraped_season).lower():
-                    print(f"⚠️  Season mismatch for {row.get('variety')}: "
-                          f"existing='{existing_season}' vs scraped='{scraped_season}'")
-            # Don't write planting_season to avoid duplicate column
-            del scraped["planting_season"]
-
-        return (idx, scraped, "success", expected_cols)
 
-    except Exception as exc:
-        print(f"Failed to scrape {url}: {exc}")
-        return (idx, {}, "failed", [])
+def output_path_for(csv_path: Path) -> Path:
+    """Default output next to the input, e.g. ``herb-data-enriched.csv``."""
+    return csv_path.with_name(f"{csv_path.stem}-enriched{csv_path.suffix}")
 
 
-def scrape_plant_data(
-    csv_path: Path,
-    output_path: Path,
-    use_cache: bool = False,
+def scrape_plant_files(
+    files: list[tuple[Path, Path]],
+    cache: HttpCache | None = None,
     retry_failed_only: bool = False,
     only_new: bool = False,
     batch_size: int = 20,
     batch_delay: float = 1.0,
+    js_batch_size: int = 1,
+    ai_memo: AiMemo | None = None,
+    journal_path: Path | None = None,
+    resume: bool = False,
+    report_path: Path | None = None,
+    parse_workers: int = 1,
+    refresh: bool = False,
+    change_log_path: Path | None = None,
 ) -> None:
-    df = pd.read_csv(csv_path)
-
-    for col in ALL_SCRAPED_COLUMNS:
-        if col not in df.columns:
-            df[col] = None
-
-    # Collect rows to process
-    rows_to_process = []
-    for idx, row in df.iterrows():
-        if retry_failed_only and row.get("scrape_status") != "failed":
-            continue
-        if only_new:
-            status = row.get("scrape_status")
-            # Process if scrape_status is missing, empty, or not "success"
-            if pd.notna(status) and status == "success":
+    """Scrape the selected rows of each ``(input, output)`` pair in one run.
+
+    Rows from all inputs are grouped by canonical product URL, so a page
+    listed in several rows or files is fetched and parsed once.
+
+    With ``journal_path``, each finished row is appended to a JSONL journal
+    as it lands; ``resume`` replays that journal and skips the rows it
+    already holds. Results are merged into each table in one update at the
+    end, and the journal is removed once the outputs are written. With
+    ``report_path``, request, cache, parse, and LLM timings are written there
+    as JSON. Downloaded pages are parsed in ``parse_workers`` processes.
+
+    ``refresh`` rechecks every row (through ``cache``, so pages within their
+    TTL are not requested and older ones cost a conditional GET) and writes
+    only rows whose page fingerprint changed. Their field-level diffs are
+    appended to ``change_log_path``.
+    """
+    tables: dict[str, pd.DataFrame] = {}
+    rows_to_process: list[RowRef] = []
+    for csv_path, _ in files:
+        df = pd.read_csv(csv_path)
+
+        for col in ALL_SCRAPED_COLUMNS:
+            if col not in df.columns:
+                df[col] = None
+        tables[str(csv_path)] = df
+
+        # Collect rows to process
+        for idx, row in df.iterrows():
+            if retry_failed_only and row.get("scrape_status") != "failed":
                 continue
-        rows_to_process.append((idx, row))
-
-    if not rows_to_process:
+            if only_new and not refresh:
+                status = row.get("scrape_status")
+                # Process if scrape_status is missing, empty, or not "success"
+                if pd.notna(status) and status == "success":
+                    continue
+            rows_to_process.append((str(csv_path), idx, row))
+
+    # Journals from single-file runs carry no "file"; they belong to the first input.
+    first_file = str(files[0][0])
+    records: list[dict[str, Any]] = []
+    if resume and journal_path is not None:
+        for record in load_journal(journal_path):
+            df = tables.get(record.setdefault("file", first_file))
+            if df is not None and record["row"] in df.index and _row_url(df.loc[record["row"]]) == record["url"]:
+                records.append(record)
+        done = {(record["file"], record["row"]) for record in records}
+        rows_to_process = [ref for ref in rows_to_process if ref[:2] not in done]
+        print(f"Resuming from {journal_path}: {len(done)} rows already scraped")
+
+    if rows_to_process:
+        rate = politeness_rate(batch_size, batch_delay)
+        distinct = len({key for ref in rows_to_process if (key := page_key(ref[2])) is not None})
+        print(
+            f"Processing {len(rows_to_process)} rows from {len(files)} files, {distinct} distinct pages "
+            f"({batch_size} in flight, {rate:g} requests/s per host)..."
+        )
+        journal = ScrapeJournal(journal_path, resume=resume) if journal_path is not None else None
+        metrics = ScrapeMetrics() if report_path is not None else None
+        try:
+            records += asyncio.run(
+                _scrape_rows(
+                    rows_to_process,
+                    cache,
+                    batch_size,
+                    rate,
+                    js_batch_size,
+                    ai_memo,
+                    journal,
+                    metrics,
+                    parse_workers,
+                    refresh,
+                )
+            )
+        finally:
+            if journal is not None:
+                journal.close()
+        if metrics is not None:
+            settings = {
+                "batch_size": batch_size,
+                "batch_delay": batch_delay,
+                "requests_per_second_per_host": None if math.isinf(rate) else rate,
+                "js_batch_size": js_batch_size,
+                "cache": cache is not None,
+                "rows_to_process": len(rows_to_process),
+                "distinct_pages": distinct,
+                "parse_workers": parse_workers,
+            }
+            report = metrics.write_report(report_path, settings)
+            print_report_summary(report)
+            print(f"Saved scrape report to {report_path}")
+        if cache is not None:
+            print(
+                f"Cache: {cache.hits} fresh, {cache.revalidated} revalidated (304), "
+                f"{cache.misses} downloaded"
+            )
+        if ai_memo is not None and ai_memo.hits + ai_memo.misses:
+            print(f"AI memo: {ai_memo.hits} reused, {ai_memo.misses} sent to tnh-gen")
+    else:
         print("No rows to process")
-        # Reorder and save anyway
+
+    if refresh:
+        records, changes, counts = refresh_records(tables, records, SUPPLIER_COLUMNS)
+        print(
+            f"Refresh: {counts['changed']} changed, {counts['unchanged']} unchanged, "
+            f"{counts['fingerprinted']} fingerprinted, {counts['new']} new, {counts['failed']} failed"
+        )
+        if change_log_path is not None and changes:
+            append_change_log(change_log_path, changes)
+            print(f"Logged {len(changes)} field changes to {change_log_path}")
+
+    for csv_path, output_path in files:
+        df = tables[str(csv_path)]
+        merge_records(df, [record for record in records if record["file"] == str(csv_path)])
+
+        # Reorder columns: original columns, then scraped data, then metadata at end
         original_cols = [c for c in df.columns if c not in ALL_SCRAPED_COLUMNS]
         scraped_data_cols = [c for c in ALL_SCRAPED_COLUMNS if c not in METADATA_COLUMNS and c in df.columns]
         metadata_cols = [c for c in METADATA_COLUMNS if c in df.columns]
         df = df[original_cols + scraped_data_cols + metadata_cols]
-        df.to_csv(output_path, index=False)
-        return
-
-    print(f"Processing {len(rows_to_process)} rows in batches of {batch_size}...")
 
-    # Process in batches with threading
-    for batch_start in range(0, len(rows_to_process), batch_size):
-        batch_end = min(batch_start + batch_size, len(rows_to_process))
-        batch = rows_to_process[batch_start:batch_end]
-
-        print(f"Processing batch {batch_start//batch_size + 1} ({len(batch)} rows)...")
-
-        # Use ThreadPoolExecutor to process batch concurrently
-        with ThreadPoolExecutor(max_workers=batch_size) as executor:
-            futures = {
-                executor.submit(scrape_single_row, idx, row, use_cache): idx
-                for idx, row in batch
-            }
-
-            for future in as_completed(futures):
-                idx, scraped, status, expected_cols = future.result()
-
-                # Update dataframe with results
-                for key, value in scraped.items():
-                    if key in df.columns:
-                        df.at[idx, key] = value
-
-                mark_missing_fields(df, idx, expected_cols, scraped)
-                df.at[idx, "scrape_status"] = status
-                df.at[idx, "scrape_date"] = pd.Timestamp.now().isoformat()
-
-        # Delay between batches (except for last batch)
-        if batch_end < len(rows_to_process):
-            print(f"Waiting {batch_delay}s before next batch...")
-            time.sleep(batch_delay)
+        df.to_csv(output_path, index=False)
+        print(f"Saved enriched data to {output_path}")
+    if journal_path is not None:
+        journal_path.unlink(missing_ok=True)
 
-    # Reorder columns: original columns, then scraped data, then metadata at end
-    original_cols = [c for c in df.columns if c not in ALL_SCRAPED_COLUMNS]
-    scraped_data_cols = [c for c in ALL_SCRAPED_COLUMNS if c not in METADATA_COLUMNS and c in df.columns]
-    metadata_cols = [c for c in METADATA_COLUMNS if c in df.columns]
-    df = df[original_cols + scraped_data_cols + metadata_cols]
 
-    df.to_csv(output_path, index=False)
-    print(f"Saved enriched data to {output_path}")
+def scrape_plant_data(csv_path: Path, output_path: Path, **kwargs: Any) -> None:
+    """Scrape one plant CSV; see ``scrape_plant_files`` for the options."""
+    scrape_plant_files([(csv_path, output_path)], **kwargs)
 
 
 def parse_args() -> argparse.Namespace:
@@ -431,19 +492,85 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--input",
         type=Path,
-        default=Path("data/plants/vegetable-data.csv"),
-        help="Input CSV with plant rows and URLs.",
+        nargs="+",
+        default=[Path("data/plants/vegetable-data.csv")],
+        help="Input CSVs with plant rows and URLs; pages shared between rows or files are fetched once.",
     )
     parser.add_argument(
         "--output",
         type=Path,
-        default=Path("data/plants/vegetable-data-enriched.csv"),
-        help="Output CSV path for enriched data.",
+        nargs="+",
+        default=None,
+        help="Output CSV path for each input (default: <input>-enriched.csv).",
     )
     parser.add_argument(
         "--use-cache",
         action="store_true",
-        help="Cache fetched HTML in the system temp dir.",
+        help="Keep fetched pages in a persistent cache and revalidate them when stale.",
+    )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"SQLite cache file (default: {DEFAULT_CACHE_PATH}).",
+    )
+    parser.add_argument(
+        "--cache-ttl-days",
+        type=float,
+        default=DEFAULT_TTL_DAYS,
+        help=f"Days a cached page is used without revalidating (default: {DEFAULT_TTL_DAYS:g}).",
+    )
+    parser.add_argument(
+        "--supplier-ttl",
+        action="append",
+        default=[],
+        metavar="SUPPLIER=DAYS",
+        help="Per-supplier cache TTL override, e.g. SDSC=14 (repeatable).",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=DEFAULT_MAX_MB,
+        help=f"Evict least recently used pages above this size (default: {DEFAULT_MAX_MB:g}).",
+    )
+    parser.add_argument(
+        "--ai-memo-path",
+        type=Path,
+        default=DEFAULT_MEMO_PATH,
+        help=f"SQLite memo of tnh-gen results by input, prompt, and model (default: {DEFAULT_MEMO_PATH}).",
+    )
+    parser.add_argument(
+        "--no-ai-memo",
+        action="store_true",
+        help="Send every Johnny's page to tnh-gen, even if its text was extracted before.",
+    )
+    parser.add_argument(
+        "--journal",
+        type=Path,
+        default=None,
+        help="JSONL checkpoint of finished rows (default: <output>.journal.jsonl).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip rows already in the journal of an interrupted run.",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="JSON report of request, cache, parse, and LLM timings (default: <output>.report.json).",
+    )
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Recheck every row through the cache; write only rows whose page changed and log the diffs.",
+    )
+    parser.add_argument(
+        "--change-log",
+        type=Path,
+        default=None,
+        help="CSV of field-level changes found by --refresh (default: <output>.changes.csv).",
     )
     parser.add_argument(
         "--retry-failed",
@@ -459,28 +586,67 @@ def parse_args() -> argparse.Namespace:
         "--batch-size",
         type=int,
         default=25,
-        help="Number of rows to process concurrently per batch (default: 25).",
+        help="Max rows in flight, and the per-host request burst (default: 25).",
     )
     parser.add_argument(
         "--batch-delay",
         type=float,
         default=1.0,
-        help="Delay in seconds between batches (default: 1.0).",
+        help="Seconds for a host to earn back a full burst; 0 disables rate limiting (default: 1.0).",
+    )
+    parser.add_argument(
+        "--js-batch-size",
+        type=int,
+        default=10,
+        help="Pages per tnh-gen call for suppliers read by a model, e.g. Johnny's; 1 runs one call per page (default: 10).",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=default_workers(),
+        help="Processes parsing downloaded pages; 1 parses in a thread (default: CPU count).",
     )
-    return parser.parse_args()
+    args = parser.parse_args()
+    if args.output is None:
+        args.output = [output_path_for(path) for path in args.input]
+    elif len(args.output) != len(args.input):
+        parser.error("--output needs one path per --input")
+    return args
 
 
 def main() -> None:
     args = parse_args()
-    scrape_plant_data(
-        csv_path=args.input,
-        output_path=args.output,
-        use_cache=args.use_cache,
-        retry_failed_only=args.retry_failed,
-        only_new=not args.all,  # Default to only_new=True unless --all is specified
-        batch_size=args.batch_size,
-        batch_delay=args.batch_delay,
-    )
+    cache = None
+    if args.use_cache or args.refresh:
+        cache = HttpCache(
+            args.cache_path,
+            default_ttl=args.cache_ttl_days * DAY_SECONDS,
+            ttls=parse_ttls(args.supplier_ttl),
+            max_bytes=int(args.cache_max_mb * 1024 * 1024),
+        )
+    ai_memo = None if args.no_ai_memo else AiMemo(args.ai_memo_path)
+    try:
+        scrape_plant_files(
+            list(zip(args.input, args.output)),
+            cache=cache,
+            retry_failed_only=args.retry_failed,
+            only_new=not args.all,  # Default to only_new=True unless --all is specified
+            batch_size=args.batch_size,
+            batch_delay=args.batch_delay,
+            js_batch_size=args.js_batch_size,
+            ai_memo=ai_memo,
+            journal_path=args.journal or journal_path_for(args.output[0]),
+            resume=args.resume,
+            report_path=args.report or report_path_for(args.output[0]),
+            parse_workers=args.parse_workers,
+            refresh=args.refresh,
+            change_log_path=args.change_log or change_log_path_for(args.output[0]),
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+        if ai_memo is not None:
+            ai_memo.close()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,52 @@
+"""Registry of seed supplier plugins.
+
+Every module in this package (other than ``base``) is a plugin, imported
+when the package is, and registers one ``Supplier``. Adding a supplier is a
+new module here; the scraper and the discovery crawler look suppliers up by
+code or by URL host and need no edits.
+"""
+
+from __future__ import annotations
+
+import importlib
+import pkgutil
+from urllib.parse import urlsplit
+
+from scripts.suppliers.base import Supplier
+
+SUPPLIERS: dict[str, Supplier] = {}
+_HOSTS: dict[str, Supplier] = {}
+
+
+def register(supplier: Supplier) -> Supplier:
+    code = supplier.code.upper()
+    if code in SUPPLIERS:
+        raise ValueError(f"Supplier {code} is already registered")
+    SUPPLIERS[code] = supplier
+    for host in supplier.hosts:
+        _HOSTS[host.lower().removeprefix("www.")] = supplier
+    return supplier
+
+
+def get_supplier(code: str) -> Supplier | None:
+    """Plugin for a supplier code from the plant CSVs (case-insensitive)."""
+    return SUPPLIERS.get(str(code).strip().upper())
+
+
+def supplier_for_url(url: str) -> Supplier | None:
+    """Plugin whose hosts include ``url``'s host, with or without ``www.``."""
+    host = (urlsplit(url).hostname or "").removeprefix("www.")
+    return _HOSTS.get(host)
+
+
+def scraped_columns() -> list[str]:
+    """Every supplier's columns, most complete supplier first, without repeats."""
+    columns: dict[str, None] = {}
+    for supplier in sorted(SUPPLIERS.values(), key=lambda s: (-len(s.columns), s.code)):
+        columns.update(dict.fromkeys(supplier.columns))
+    return list(columns)
+
+
+for _module in pkgutil.iter_modules(__path__):
+    if _module.name != "base" and not _module.name.startswith("_"):
+        importlib.import_module(f"{__name__}.{_module.name}")
@@ -0,0 +1,115 @@
+"""What a supplier plugin declares, and builders for its page extractors.
+
+A plugin module calls ``register(Supplier(...))`` once at import. Everything
+that can be prepared ahead of time (strainers, compiled URL patterns, label
+lookups) is built there, so extracting a page only runs that supplier's own
+precompiled steps, however many suppliers are registered.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from typing import Any, Callable
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml builds the tree several times faster; html.parser needs no extra install.
+HTML_PARSER = "lxml" if find_spec("lxml") is not None else "html.parser"
+
+Fragment = dict[str, Any]
+
+
+def has_class(*names: str) -> Callable[[str | None], bool]:
+    """Strainer matcher for elements carrying any of ``names`` among their classes.
+
+    ``SoupStrainer`` compares a plain ``class_`` string with the whole
+    attribute, so ``class="woocommerce-product-attributes shop_attributes"``
+    would not match ``"woocommerce-product-attributes"``.
+    """
+    wanted = set(names)
+    return lambda value: value is not None and not wanted.isdisjoint(value.split())
+
+
+def normalize_label(label: str) -> str:
+    """Normalize table header labels to snake_case keys."""
+    normalized = re.sub(r"[^a-z0-9]+", "_", label.lower()).strip("_")
+    normalized = re.sub(r"_+", "_", normalized)
+    return normalized
+
+
+def attribute_table_extractor(table_class: str) -> Callable[[str], Fragment]:
+    """``html -> {"attributes": [[label, value], ...]}`` for a two-column spec table.
+
+    Only tables carrying ``table_class`` are built into the tree.
+    """
+    strainer = SoupStrainer("table", class_=has_class(table_class))
+
+    def extract(html: str) -> Fragment:
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+        table = soup.find("table")
+        if not table:
+            return {}
+
+        attributes = []
+        for row in table.find_all("tr"):
+            th = row.find("th")
+            td = row.find("td")
+            if th and td:
+                attributes.append([th.get_text(strip=True), td.get_text(strip=True)])
+        return {"attributes": attributes}
+
+    return extract
+
+
+def label_mapper(label_map: dict[str, str]) -> Callable[[Fragment], dict[str, Any]]:
+    """``{"attributes": [...]} -> {column: value}`` through ``label_map``.
+
+    ``label_map`` is keyed by ``normalize_label`` output. Each raw label is
+    normalized once and remembered, so repeat pages are plain dict lookups.
+    """
+    columns = {normalize_label(label): column for label, column in label_map.items()}
+    resolved: dict[str, str | None] = {}
+
+    def parse(fragment: Fragment) -> dict[str, Any]:
+        data: dict[str, Any] = {}
+        for label, value in fragment.get("attributes", []):
+            if label not in resolved:
+                resolved[label] = columns.get(normalize_label(label))
+            column = resolved[label]
+            if column:
+                data[column] = value
+        return data
+
+    return parse
+
+
+def no_fields(fragment: Fragment) -> dict[str, Any]:
+    return {}
+
+
+@dataclass(frozen=True)
+class Supplier:
+    """One seed supplier: where its pages live and how to read them.
+
+    ``extract`` reduces a downloaded page to a small JSON-able fragment (it
+    runs in a parse worker and its output is what the HTTP cache stores).
+    Suppliers read without a model turn the fragment into column values with
+    ``parse``. Suppliers read by a model set ``prompt_key`` instead: the
+    fragment becomes prompt input through ``prompt_input`` and the model's
+    answer becomes column values through ``prompt_fields``.
+    """
+
+    code: str
+    name: str
+    hosts: tuple[str, ...]
+    columns: tuple[str, ...]
+    extract: Callable[[str], Fragment]
+    parse: Callable[[Fragment], dict[str, Any]] = no_fields
+    prompt_key: str | None = None
+    prompt_input: Callable[[Fragment], str] = lambda fragment: ""
+    prompt_fields: Callable[[dict[str, Any]], dict[str, Any]] = dict
+    seeds: tuple[str, ...] = ()
+    product: re.Pattern[str] = field(default=re.compile(r"(?!)"))
+    listing: re.Pattern[str] = field(default=re.compile(r"(?!)"))
@@ -0,0 +1,85 @@
+"""Johnny's Selected Seeds: free-text product sections read by tnh-gen."""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from scripts.suppliers import register
+from scripts.suppliers.base import HTML_PARSER, Fragment, Supplier, has_class
+
+# Columns expected from Johnny's Selected Seeds pages
+# Fields common to both sources get web_ prefix, JS-only get js_ prefix
+JS_COLUMNS: list[str] = [
+    "web_botanical_name",
+    "web_planting_depth",
+    "web_days_to_maturity",
+    "web_thin_to",
+    "web_final_spacing",
+    "web_seeds_per_packet",
+    "js_growing_notes",  # JS-only field
+]
+
+JS_PROMPT_KEY = "extract_johnnys_seeds_data"
+
+JS_STRAINER = SoupStrainer("div", class_=has_class("c-facts", "details", "c-accordion__item"))
+
+
+def extract_js(html: str) -> Fragment:
+    """``{"sections": [...]}``: Quick Facts, details, and Growing Information text."""
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=JS_STRAINER)
+    sections = []
+
+    quick_facts = soup.find("div", class_="c-facts")
+    if quick_facts:
+        sections.append(f"QUICK FACTS SECTION:\n{quick_facts.get_text(' ', strip=True)}")
+
+    details_section = soup.find("div", class_="details")
+    if details_section:
+        sections.append(f"DETAILS SECTION:\n{details_section.get_text(' ', strip=True)}")
+
+    for accordion_item in soup.find_all("div", class_="c-accordion__item"):
+        heading_link = accordion_item.find("a", class_="c-accordion__heading__link")
+        if heading_link and "Growing Information" in heading_link.get_text(strip=True):
+            accordion_body = accordion_item.find("div", class_="c-accordion__body")
+            if accordion_body:
+                sections.append(f"GROWING INFORMATION SECTION:\n{accordion_body.get_text(' ', strip=True)}")
+                break
+
+    return {"sections": sections} if sections else {}
+
+
+def js_prompt_input(fragment: Fragment) -> str:
+    """Prompt input for one Johnny's page: its extracted sections."""
+    return "\n\n".join(fragment.get("sections", []))
+
+
+def js_fields(data: dict[str, Any]) -> dict[str, Any]:
+    """Map the model's ``scientific_name`` to ``web_botanical_name``."""
+    data = dict(data)
+    if data.get("scientific_name"):
+        data["web_botanical_name"] = data.pop("scientific_name")
+    return data
+
+
+JS = register(
+    Supplier(
+        code="JS",
+        name="Johnny's Selected Seeds",
+        hosts=("johnnyseeds.com",),
+        columns=tuple(JS_COLUMNS),
+        extract=extract_js,
+        prompt_key=JS_PROMPT_KEY,
+        prompt_input=js_prompt_input,
+        prompt_fields=js_fields,
+        seeds=(
+            "https://www.johnnyseeds.com/vegetables/",
+            "https://www.johnnyseeds.com/herbs/",
+            "https://www.johnnyseeds.com/flowers/",
+        ),
+        product=re.compile(r"^/(?:vegetables|herbs|flowers)/[^?]+-\d+[A-Z]*\.html"),
+        listing=re.compile(r"^/(?:vegetables|herbs|flowers)/(?:[^.?]+/)?(?:\?(?:start|sz)=.*)?$"),
+    )
+)
@@ -0,0 +1,68 @@
+"""San Diego Seed Company: WooCommerce product attribute table."""
+
+from __future__ import annotations
+
+import re
+
+from scripts.suppliers import register
+from scripts.suppliers.base import Supplier, attribute_table_extractor, label_mapper
+
+# Columns expected from SDSC pages (order matters for output)
+# Note: planting_season is scraped but validated against existing 'season' column
+# Fields common to both sources get web_ prefix, SDSC-only get sdsc_ prefix
+SDSC_COLUMNS: list[str] = [
+    "web_botanical_name",
+    "web_soil_temp",
+    "web_planting_depth",
+    "sdsc_days_to_germ",
+    "web_days_to_maturity",
+    "sdsc_succession",
+    "web_best_planting_method",
+    "web_thin_to",
+    "web_final_spacing",
+    "sdsc_area_to_sow",
+    "web_seeds_per_packet",  # SDSC calls this "approx_seed_count" but we map it
+    "sdsc_product_weight",
+    "sdsc_plant_height",
+    "sdsc_plant_spread",
+]
+
+# Normalize table header labels to our column names (with prefixes)
+SDSC_LABEL_MAP: dict[str, str] = {
+    "product_weight": "sdsc_product_weight",
+    "planting_season": "planting_season",
+    "soil_temp_for_germination": "web_soil_temp",
+    "soil_temp": "web_soil_temp",
+    "planting_depth": "web_planting_depth",
+    "area_to_sow": "sdsc_area_to_sow",
+    "days_to_germ": "sdsc_days_to_germ",
+    "days_to_maturity": "web_days_to_maturity",
+    "best_planting_method": "web_best_planting_method",
+    "thin_to": "web_thin_to",
+    "final_spacing": "web_final_spacing",
+    "succession": "sdsc_succession",
+    "approx._seed_count": "web_seeds_per_packet",  # Map SDSC's approx_seed_count to unified field
+    "approx_seed_count": "web_seeds_per_packet",   # Map SDSC's approx_seed_count to unified field
+    "botanical_name": "web_botanical_name",
+    "plant_spread": "sdsc_plant_spread",
+    "plant_height": "sdsc_plant_height",
+}
+
+SDSC = register(
+    Supplier(
+        code="SDSC",
+        name="San Diego Seed Company",
+        hosts=("sandiegoseedcompany.com",),
+        columns=tuple(SDSC_COLUMNS),
+        extract=attribute_table_extractor("woocommerce-product-attributes"),
+        parse=label_mapper(SDSC_LABEL_MAP),
+        seeds=(
+            "https://sandiegoseedcompany.com/product-sitemap.xml",
+            "https://sandiegoseedcompany.com/product-category/vegetables/",
+            "https://sandiegoseedcompany.com/product-category/herbs/",
+            "https://sandiegoseedcompany.com/product-category/flowers/",
+        ),
+        product=re.compile(r"^/product/[^?]+"),
+        listing=re.compile(r"^/product-category/"),
+    )
+)
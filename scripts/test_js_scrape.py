@@ -1,30 +1,48 @@
 #!/usr/bin/env -S uv run python
 """Test Johnny's Seeds scraping with tnh-gen integration."""
 
+import argparse
+import asyncio
 from pathlib import Path
 import sys
 
-# Add parent to path to import scrape_plant_data
-sys.path.insert(0, str(Path(__file__).parent))
+# Add repo root to path so the scripts package imports resolve
+sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scrape_plant_data import fetch_with_cache, parse_js_with_ai
+from scripts.io.http_cache import HttpCache
+from scripts.io.http_client import AsyncFetcher
+from scripts.scrape_plant_data import fetch_with_cache, parse_js_with_ai
 
 # Test URL from the vegetable data CSV
 TEST_URL = "https://www.johnnyseeds.com/vegetables/broccoli/standard-broccoli/belstar-organic-f1-broccoli-seed-2815G.html"
 
+
+async def fetch(url: str) -> dict:
+    with HttpCache() as cache:
+        async with AsyncFetcher() as fetcher:
+            return await fetch_with_cache(fetcher, url, cache, "JS")
+
 def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--url",
+        default=TEST_URL,
+        help="Product page to scrape (e.g. a mock_supplier_server.py URL for offline runs)",
+    )
+    args = parser.parse_args()
+
     print(f"Testing Johnny's Seeds scraper with tnh-gen")
-    print(f"URL: {TEST_URL}\n")
+    print(f"URL: {args.url}\n")
 
     try:
-        # Fetch the HTML
-        print("Fetching HTML...")
-        html = fetch_with_cache(TEST_URL, use_cache=True)
-        print(f"✓ Fetched {len(html)} characters\n")
+        # Fetch the page sections
+        print("Fetching page sections...")
+        fragment = asyncio.run(fetch(args.url))
+        print(f"✓ Extracted {len(fragment.get('sections', []))} sections\n")
 
         # Parse with AI
         print("Parsing with tnh-gen...")
-        data = parse_js_with_ai(html)
+        data = parse_js_with_ai(fragment)
 
         print("✓ Extraction successful!\n")
         print("Extracted data:")
@@ -0,0 +1,109 @@
+import json
+from functools import partial
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+import httpx
+import pandas as pd
+import pytest
+
+ASSIGNMENTS_HEADER = "bed_id,start_ft,length_ft,status,crop,variety,wave_id,plant_date,notes\n"
+
+CARROT_ASSIGNMENT = "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,Roots\n"
+
+CARROT_SCHEDULE = (
+    "plant_type,crop,variety,water,plant_date,succession_days,row_feet\n"
+    "Root Vegetable,Carrot,Bolero,medium,2026-02-21,21,10\n"
+)
+
+# Two Carrot waves three weeks apart, each harvested for one week.
+CARROT_HARVEST_SCHEDULE = (
+    "plant_type,crop,variety,water,plant_date,first_harvest_date,"
+    "harvest_weeks_per_planting,succession_days,row_feet\n"
+    "Root Vegetable,Carrot,Bolero,medium,2026-03-02,2026-03-16,1,21,10\n"
+    "Root Vegetable,Carrot,Bolero,medium,2026-03-23,2026-04-06,1,21,10\n"
+)
+
+GEOMETRY = {"schema_version": 1, "bed_count": 2, "bed_length_ft": 20, "block_size_ft": 5}
+
+ROOT_COLORS = {"family_colors": {"Root Vegetable": "#D97A1E"}}
+
+
+def write_jsonl(path: Path, objects: list[dict]) -> None:
+    lines = [json.dumps(obj) for obj in objects]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+PlanInputs = Callable[..., tuple[Path, Path, Path, Path]]
+
+
+@pytest.fixture
+def plan_inputs(tmp_path: Path) -> PlanInputs:
+    """Write a small plan under ``tmp_path``; each test passes only its delta.
+
+    ``assignments`` is CSV rows without the header, ``schedule`` a full CSV,
+    ``geometry`` overrides the bed layout, and ``visuals`` are the JSONL
+    objects after the schema line. Returns
+    ``(assignments, schedule, geometry, visuals)``.
+    """
+
+    def write(
+        assignments: str = CARROT_ASSIGNMENT,
+        schedule: str = CARROT_SCHEDULE,
+        geometry: dict | None = None,
+        visuals: tuple[dict, ...] = (ROOT_COLORS,),
+    ) -> tuple[Path, Path, Path, Path]:
+        assignments_path = tmp_path / "assignments.csv"
+        assignments_path.write_text(ASSIGNMENTS_HEADER + assignments, encoding="utf-8")
+        schedule_path = tmp_path / "schedule.csv"
+        schedule_path.write_text(schedule, encoding="utf-8")
+        geometry_path = tmp_path / "geometry.jsonl"
+        write_jsonl(
+            geometry_path,
+            [{**GEOMETRY, **(geometry or {})}, {"flower_blocks": [0], "beneficial_block": None}],
+        )
+        visuals_path = tmp_path / "visuals.jsonl"
+        write_jsonl(visuals_path, [{"schema_version": 1}, *visuals])
+        return assignments_path, schedule_path, geometry_path, visuals_path
+
+    return write
+
+
+@pytest.fixture
+def harvest_schedule() -> str:
+    """Schedule CSV with harvest windows, for renderers that track occupancy."""
+    return CARROT_HARVEST_SCHEDULE
+
+
+@pytest.fixture
+def write_plants(tmp_path: Path) -> Callable[..., Path]:
+    """Write ``plants.csv`` with one SDSC row per URL (under ``directory`` if given)."""
+
+    def write(urls: list[str], directory: Path | None = None) -> Path:
+        csv_path = (directory or tmp_path) / "plants.csv"
+        csv_path.parent.mkdir(parents=True, exist_ok=True)
+        pd.DataFrame(
+            {
+                "crop": [f"Crop {i}" for i in range(len(urls))],
+                "variety": [f"Variety {i}" for i in range(len(urls))],
+                "supplier": ["SDSC"] * len(urls),
+                "url": urls,
+            }
+        ).to_csv(csv_path, index=False)
+        return csv_path
+
+    return write
+
+
+@pytest.fixture
+def mock_fetcher(monkeypatch: pytest.MonkeyPatch) -> Callable[..., None]:
+    """Route a module's ``AsyncFetcher`` (the scraper's by default) through ``handler``."""
+    from scripts.io.http_client import AsyncFetcher
+
+    def install(handler: Callable[[httpx.Request], httpx.Response], module: ModuleType | None = None) -> None:
+        if module is None:
+            import scripts.scrape_plant_data as module
+        monkeypatch.setattr(module, "AsyncFetcher", partial(AsyncFetcher, transport=httpx.MockTransport(handler)))
+
+    return install
@@ -0,0 +1,65 @@
+from pathlib import Path
+
+import scripts.io.tnh_gen as tnh_gen
+from scripts.io.ai_memo import AiMemo
+
+
+def _prompts(tmp_path: Path) -> Path:
+    prompts_dir = tmp_path / "prompts"
+    prompts_dir.mkdir()
+    (prompts_dir / "extract_in_row_spacing.md").write_text("Return inches.")
+    (prompts_dir / "extract_in_row_spacing_batch.md").write_text("Return inches by id.")
+    return prompts_dir
+
+
+def test_memo_key_tracks_text_prompt_and_model(tmp_path: Path) -> None:
+    prompts_dir = _prompts(tmp_path)
+    path = tmp_path / "memo.sqlite"
+    with AiMemo(path, model="m1", prompts_dir=prompts_dir) as memo:
+        memo.put("extract_in_row_spacing", '12" apart', {"in_row_spacing_inches": 12})
+        assert memo.get("extract_in_row_spacing", '12" apart') == {"in_row_spacing_inches": 12}
+        assert memo.get("extract_in_row_spacing", '18" apart') is None
+        assert (memo.hits, memo.misses) == (1, 1)
+
+    with AiMemo(path, model="m2", prompts_dir=prompts_dir) as memo:
+        assert memo.get("extract_in_row_spacing", '12" apart') is None
+
+    (prompts_dir / "extract_in_row_spacing_batch.md").write_text("Return centimetres by id.")
+    with AiMemo(path, model="m1", prompts_dir=prompts_dir) as memo:
+        assert memo.get("extract_in_row_spacing", '12" apart') is None
+
+
+def test_memo_evicts_least_recently_used(tmp_path: Path) -> None:
+    clock = iter(range(100))
+    memo = AiMemo(
+        tmp_path / "memo.sqlite",
+        max_entries=2,
+        model="m",
+        prompts_dir=_prompts(tmp_path),
+        clock=lambda: next(clock),
+    )
+    for text in ("a", "b", "c"):
+        memo.put("extract_in_row_spacing", text, {"text": text})
+    memo.get("extract_in_row_spacing", "a")
+
+    assert memo.evict() == 1
+    assert memo.get("extract_in_row_spacing", "b") is None
+    assert memo.get("extract_in_row_spacing", "a") == {"text": "a"}
+    memo.close()
+
+
+def test_run_batch_only_sends_unmemoized_items(tmp_path: Path, monkeypatch) -> None:
+    sent = []
+
+    def fake_run_prompt(prompt_key: str, input_text: str, timeout: float = 60) -> dict:
+        sent.append(input_text)
+        return {"in_row_spacing_inches": len(input_text)}
+
+    monkeypatch.setattr(tnh_gen, "run_prompt", fake_run_prompt)
+    with AiMemo(tmp_path / "memo.sqlite", model="m", prompts_dir=_prompts(tmp_path)) as memo:
+        first = tnh_gen.run_batch("extract_in_row_spacing", {"0": "abc"}, memo=memo)
+        second = tnh_gen.run_batch("extract_in_row_spacing", {"0": "abc", "1": "de"}, memo=memo)
+
+    assert first == {"0": {"in_row_spacing_inches": 3}}
+    assert second == {"0": {"in_row_spacing_inches": 3}, "1": {"in_row_spacing_inches": 2}}
+    assert sent == ["abc", "de"]
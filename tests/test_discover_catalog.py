@@ -0,0 +1,124 @@
+import re
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+import scripts.discover_catalog as discover_module
+from scripts.discover_catalog import SupplierSite
+from scripts.io.http_cache import HttpCache
+
+SITE = SupplierSite(
+    "SDSC",
+    ("https://seeds.test/sitemap_index.xml", "https://seeds.test/product-category/vegetables/"),
+    product=re.compile(r"^/product/[^?]+"),
+    listing=re.compile(r"^/product-category/"),
+)
+
+PAGES = {
+    "/sitemap_index.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<sitemap><loc>https://seeds.test/product-sitemap.xml</loc></sitemap>
+</sitemapindex>""",
+    "/product-sitemap.xml": """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+<url><loc>https://seeds.test/product/kale-seeds/</loc></url>
+<url><loc>https://seeds.test/product/beet-seeds/</loc></url>
+</urlset>""",
+    "/product-category/vegetables/": """<html><body>
+<a href="/product/kale-seeds/?utm_source=menu">Kale</a>
+<a href="https://SEEDS.test/product/chard-seeds/#reviews">Chard</a>
+<a href="https://elsewhere.test/product/other/">Other site</a>
+<a href="/cart/">Cart</a>
+<a class="next" href="/product-category/vegetables/page/2/">Next</a>
+</body></html>""",
+    "/product-category/vegetables/page/2/": """<html><body>
+<a href="/product/chard-seeds/?attribute_pa_size=1-oz">Chard</a>
+<a href="/product/radish-seeds/">Radish</a>
+</body></html>""",
+}
+
+
+def test_discover_catalog_diffs_against_plants(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, text=PAGES[request.url.path], headers={"etag": '"v1"'})
+
+    mock_fetcher(handler, discover_module)
+    plants = write_plants(
+        ["https://seeds.test/product/kale-seeds/?utm_campaign=x", "https://seeds.test/product/gone-seeds/"]
+    )
+    output = tmp_path / "catalog.csv"
+
+    with HttpCache(tmp_path / "cache.sqlite") as cache:
+        catalog = discover_module.discover_catalog([plants], output, [SITE], cache=cache, batch_delay=0)
+
+    statuses = dict(zip(catalog["url"], catalog["status"]))
+    assert statuses == {
+        "https://seeds.test/product/beet-seeds/": "new",
+        "https://seeds.test/product/chard-seeds/": "new",
+        "https://seeds.test/product/kale-seeds/": "known",
+        "https://seeds.test/product/radish-seeds/": "new",
+        "https://seeds.test/product/gone-seeds/": "vanished",
+    }
+    assert sorted(requests) == sorted(PAGES)
+    assert pd.read_csv(output)["url"].tolist() == catalog["url"].tolist()
+
+
+def test_discover_catalog_second_run_is_incremental(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        return httpx.Response(200, text=PAGES[request.url.path])
+
+    mock_fetcher(handler, discover_module)
+    plants = write_plants([])
+    output = tmp_path / "catalog.csv"
+
+    with HttpCache(tmp_path / "cache.sqlite") as cache:
+        discover_module.discover_catalog([plants], output, [SITE], cache=cache, batch_delay=0)
+    pd.read_csv(output).assign(first_seen="2020-01-01").to_csv(output, index=False)
+    requests.clear()
+
+    with HttpCache(tmp_path / "cache.sqlite") as cache:
+        catalog = discover_module.discover_catalog([plants], output, [SITE], cache=cache, batch_delay=0)
+
+    assert requests == []
+    assert set(catalog["first_seen"]) == {"2020-01-01"}
+    assert len(catalog) == 4
+
+
+def test_discover_catalog_skips_vanished_when_pages_fail(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/product-category/vegetables/page/2/":
+            return httpx.Response(404)
+        return httpx.Response(200, text=PAGES[request.url.path])
+
+    mock_fetcher(handler, discover_module)
+    plants = write_plants(["https://seeds.test/product/gone-seeds/"])
+
+    catalog = discover_module.discover_catalog([plants], tmp_path / "catalog.csv", [SITE], batch_delay=0)
+
+    assert "vanished" not in set(catalog["status"])
+
+
+def test_discover_catalog_skips_vanished_when_max_pages_truncates(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=PAGES[request.url.path])
+
+    mock_fetcher(handler, discover_module)
+    plants = write_plants(["https://seeds.test/product/gone-seeds/"])
+
+    catalog = discover_module.discover_catalog(
+        [plants], tmp_path / "catalog.csv", [SITE], batch_delay=0, max_pages=2
+    )
+
+    assert "vanished" not in set(catalog["status"])
+    assert discover_module.build_catalog(
+        discover_module.CrawlResult(pages=2, truncated={"SDSC"}),
+        {"https://seeds.test/product/gone-seeds/": ("SDSC", "plants.csv")},
+        ["SDSC"],
+    ).empty
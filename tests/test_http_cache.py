@@ -0,0 +1,67 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scripts.io.http_cache import HttpCache, fetch_cached, parse_ttls
+from scripts.io.http_client import AsyncFetcher
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_fetch_cached_serves_fresh_then_revalidates(tmp_path: Path) -> None:
+    clock = FakeClock()
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, text="<html><body>page</body></html>", headers={"ETag": '"v1"'})
+
+    async def fetch(cache: HttpCache) -> str:
+        async with AsyncFetcher(transport=httpx.MockTransport(handler)) as fetcher:
+            return await fetch_cached(fetcher, cache, "https://seeds.test/p", "SDSC", str.upper)
+
+    with HttpCache(tmp_path / "http.sqlite", default_ttl=60, ttls={"sdsc": 10}, clock=clock) as cache:
+        assert asyncio.run(fetch(cache)) == "<HTML><BODY>PAGE</BODY></HTML>"
+        clock.now += 5
+        assert asyncio.run(fetch(cache)) == "<HTML><BODY>PAGE</BODY></HTML>"
+        clock.now += 10
+        assert asyncio.run(fetch(cache)) == "<HTML><BODY>PAGE</BODY></HTML>"
+        assert (cache.misses, cache.hits, cache.revalidated) == (1, 1, 1)
+
+    assert seen == [None, '"v1"']
+    # The cache outlives the process: a new handle still has the page.
+    with HttpCache(tmp_path / "http.sqlite", clock=clock) as reopened:
+        entry = reopened.get("https://seeds.test/p")
+        assert entry is not None and entry.etag == '"v1"'
+
+
+def test_evict_drops_least_recently_used(tmp_path: Path) -> None:
+    clock = FakeClock()
+    cache = HttpCache(tmp_path / "http.sqlite", max_bytes=10**9, clock=clock)
+    for idx in range(3):
+        clock.now += 1
+        cache.store(f"https://seeds.test/{idx}", f"body {idx} " * 200, None, None)
+    clock.now += 1
+    cache.touch("https://seeds.test/0")
+    cache.max_bytes = cache.total_bytes() - 1
+
+    assert cache.evict() == 1
+    assert cache.get("https://seeds.test/1") is None
+    assert cache.get("https://seeds.test/0") is not None
+    cache.close()
+
+
+def test_parse_ttls_reads_days() -> None:
+    assert parse_ttls(["sdsc=2", "JS=0.5"]) == {"SDSC": 172800.0, "JS": 43200.0}
+    with pytest.raises(ValueError, match="SUPPLIER=DAYS"):
+        parse_ttls(["14"])
@@ -0,0 +1,50 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from scripts.io.http_client import AsyncFetcher, TokenBucket, politeness_rate
+
+
+def test_token_bucket_bursts_then_holds_rate() -> None:
+    async def take(count: int) -> float:
+        bucket = TokenBucket(rate=50, capacity=2)
+        start = time.monotonic()
+        for _ in range(count):
+            await bucket.acquire()
+        return time.monotonic() - start
+
+    assert asyncio.run(take(2)) < 0.02
+    # Two burst tokens, then four more at 50/s.
+    assert asyncio.run(take(6)) >= 0.075
+
+
+def test_fetcher_reuses_one_client_and_limits_each_host() -> None:
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.host, time.monotonic()))
+        return httpx.Response(200, text=f"<body>{request.url.path}</body>")
+
+    async def fetch_all() -> list[str]:
+        async with AsyncFetcher(rate=40, burst=1, transport=httpx.MockTransport(handler)) as fetcher:
+            urls = [f"https://{host}/p{i}" for host in ("a.test", "b.test") for i in range(3)]
+            responses = await asyncio.gather(*(fetcher.get(url) for url in urls))
+            return [response.text for response in responses]
+
+    texts = asyncio.run(fetch_all())
+
+    assert texts[0] == "<body>/p0</body>"
+    for host in ("a.test", "b.test"):
+        times = [at for seen_host, at in seen if seen_host == host]
+        assert times[-1] - times[0] >= 2 / 40 - 0.005
+    # Hosts have separate buckets, so b.test does not wait behind a.test.
+    assert min(at for host, at in seen if host == "b.test") - seen[0][1] < 0.02
+
+
+def test_politeness_rate_matches_old_batch_budget() -> None:
+    assert politeness_rate(25, 1.0) == 25
+    assert politeness_rate(5, 0) == float("inf")
+    with pytest.raises(ValueError):
+        politeness_rate(0, 1.0)
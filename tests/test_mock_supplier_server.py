@@ -0,0 +1,85 @@
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pandas as pd
+import pytest
+
+import scripts.scrape_plant_data as scrape_module
+from scripts.io.http_cache import HttpCache
+from scripts.io.http_client import RETRY_WAIT_MAX, AsyncFetcher
+from scripts.io.tnh_gen import PromptBatcher
+from scripts.mock_supplier_server import MockBehavior, MockSupplierServer, write_fixture_plants
+from scripts.scrape_plant_data import scrape_plant_data
+
+CORPUS = Path(__file__).parent / "fixtures" / "suppliers"
+
+
+@pytest.fixture
+def fake_tnh_gen(tmp_path: Path, monkeypatch) -> Path:
+    log = tmp_path / "tnh-gen.log"
+    monkeypatch.setenv("TNH_GEN", str(CORPUS / "fake-tnh-gen"))
+    monkeypatch.setenv("FAKE_TNH_GEN_LOG", str(log))
+    return log
+
+
+def test_scrape_fixture_corpus_offline(tmp_path: Path, fake_tnh_gen: Path, monkeypatch) -> None:
+    plants = tmp_path / "plants.csv"
+    output = tmp_path / "enriched.csv"
+    # The three Johnny's pages fill one batch; a long linger keeps a slow run from splitting it.
+    monkeypatch.setattr(scrape_module, "PromptBatcher", partial(PromptBatcher, linger=30))
+
+    with MockSupplierServer(CORPUS) as server:
+        write_fixture_plants(CORPUS, server.base_url, plants)
+        scrape_plant_data(plants, output, batch_size=8, batch_delay=0, js_batch_size=3)
+        stats = dict(server.stats)
+
+    df = pd.read_csv(output, keep_default_na=False).set_index("variety")
+    assert (df["scrape_status"] == "success").all()
+    assert df.at["Waltham 29", "web_final_spacing"] == '≥24" apart'
+    assert str(df.at["Waltham 29", "web_seeds_per_packet"]) == "65"
+    assert df.at["Belstar F1", "web_botanical_name"] == "Brassica oleracea"
+    assert df.at["Bronco F1", "web_final_spacing"] == '12-18"'
+    assert stats["ok"] == 8
+    assert fake_tnh_gen.read_text().split() == ["extract_johnnys_seeds_data_batch"]
+
+
+def test_stale_cache_revalidates_against_fixture_etags(tmp_path: Path, fake_tnh_gen: Path) -> None:
+    plants = tmp_path / "plants.csv"
+    output = tmp_path / "enriched.csv"
+
+    with MockSupplierServer(CORPUS) as server:
+        write_fixture_plants(CORPUS, server.base_url, plants)
+        for _ in range(2):
+            with HttpCache(tmp_path / "cache.sqlite", default_ttl=0) as cache:
+                scrape_plant_data(plants, output, cache=cache, batch_size=8, batch_delay=0)
+        stats = dict(server.stats)
+
+    assert cache.revalidated == 8
+    assert (stats["ok"], stats["not_modified"]) == (8, 8)
+
+
+@pytest.mark.parametrize(("retry_after", "expected_wait"), [(3, 3.0), (60, RETRY_WAIT_MAX)])
+def test_throttled_pages_are_retried(
+    tmp_path: Path, monkeypatch, retry_after: int, expected_wait: float
+) -> None:
+    plants = tmp_path / "plants.csv"
+    output = tmp_path / "enriched.csv"
+    waits = []
+
+    async def record_sleep(seconds: float) -> None:
+        waits.append(seconds)
+
+    monkeypatch.setattr(AsyncFetcher.get.retry, "sleep", record_sleep)
+
+    with MockSupplierServer(CORPUS, MockBehavior(fail_first=1, retry_after=retry_after)) as server:
+        df = write_fixture_plants(CORPUS, server.base_url, plants)
+        df[df["supplier"] == "SDSC"].head(2).to_csv(plants, index=False)
+        assert httpx.get(server.base_url + "/sdsc/missing/").status_code == 404
+        scrape_plant_data(plants, output, batch_size=2, batch_delay=0)
+        stats = dict(server.stats)
+
+    assert pd.read_csv(output)["scrape_status"].tolist() == ["success", "success"]
+    assert (stats["throttled"], stats["ok"], stats["not_found"]) == (2, 2, 1)
+    # Each page waits as long as its 429 asked, capped at RETRY_WAIT_MAX.
+    assert waits == [expected_wait, expected_wait]
@@ -0,0 +1,54 @@
+import json
+
+from scripts.io.page_extract import extract_fragment, fragment_cache_key
+from scripts.suppliers.johnnys import extract_js
+from scripts.suppliers.sdsc import SDSC
+
+extract_sdsc = SDSC.extract
+
+NAV = "".join(f'<li><a href="/c{i}">Category {i}</a></li>' for i in range(200))
+
+SDSC_PAGE = f"""<html><body><nav><ul>{NAV}</ul></nav>
+<table class="shop_table"><tr><th>Price</th><td>$3</td></tr></table>
+<table class="woocommerce-product-attributes shop_attributes">
+<tr><th>Botanical Name</th><td>Brassica oleracea</td></tr>
+<tr><th>Approx. Seed Count</th><td>300</td></tr>
+<tr><td>no header</td></tr>
+</table></body></html>"""
+
+JS_PAGE = f"""<html><body><nav><ul>{NAV}</ul></nav>
+<div class="c-facts c-facts--compact"><span>Days to maturity</span> <span>65</span></div>
+<div class="details"><p>Packet: 100 seeds</p></div>
+<div class="c-accordion__item">
+  <a class="c-accordion__heading__link">Product Details</a>
+  <div class="c-accordion__body">Not this one</div>
+</div>
+<div class="c-accordion__item">
+  <a class="c-accordion__heading__link">Growing Information</a>
+  <div class="c-accordion__body"><p>Sow 1/4" deep.</p></div>
+</div></body></html>"""
+
+
+def test_extract_sdsc_keeps_only_attribute_pairs() -> None:
+    assert extract_sdsc(SDSC_PAGE) == {
+        "attributes": [["Botanical Name", "Brassica oleracea"], ["Approx. Seed Count", "300"]]
+    }
+    assert extract_sdsc("<html><body><p>Sold out</p></body></html>") == {}
+
+
+def test_extract_js_sections() -> None:
+    assert extract_js(JS_PAGE) == {
+        "sections": [
+            "QUICK FACTS SECTION:\nDays to maturity 65",
+            "DETAILS SECTION:\nPacket: 100 seeds",
+            'GROWING INFORMATION SECTION:\nSow 1/4" deep.',
+        ]
+    }
+
+
+def test_extract_fragment_is_small_json() -> None:
+    fragment = extract_fragment(SDSC_PAGE, "sdsc")
+    assert json.loads(fragment)["attributes"][0] == ["Botanical Name", "Brassica oleracea"]
+    assert len(fragment) < len(SDSC_PAGE) / 10
+    assert extract_fragment(SDSC_PAGE, "OTHER") == "{}"
+    assert fragment_cache_key("https://seeds.test/p", "SDSC") != fragment_cache_key("https://seeds.test/p", "JS")
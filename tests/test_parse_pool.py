@@ -0,0 +1,65 @@
+import asyncio
+import os
+import threading
+import time
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+import scripts.scrape_plant_data as scrape_module
+from scripts.io.http_client import AsyncFetcher
+from scripts.io.parse_pool import ParsePool
+
+SDSC_PAGE = """<html><body><table class="woocommerce-product-attributes shop_attributes">
+<tr><th>Botanical Name</th><td>Brassica oleracea</td></tr>
+</table></body></html>"""
+
+
+def test_parse_pool_runs_in_worker_processes() -> None:
+    async def run() -> list[int]:
+        with ParsePool(workers=2) as pool:
+            return await asyncio.gather(*(pool.run(os.getpid) for _ in range(4)))
+
+    pids = asyncio.run(run())
+
+    assert os.getpid() not in pids
+
+
+def test_parse_pool_caps_pending_work() -> None:
+    lock = threading.Lock()
+    active = [0, 0]
+
+    def parse(_: int) -> None:
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+
+    async def run() -> None:
+        with ParsePool(workers=1, max_pending=2) as pool:
+            await asyncio.gather(*(pool.run(parse, i) for i in range(8)))
+
+    asyncio.run(run())
+
+    assert active[1] <= 2
+
+
+def test_scrape_parses_pages_in_process_pool(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(
+        scrape_module,
+        "AsyncFetcher",
+        partial(AsyncFetcher, transport=httpx.MockTransport(lambda request: httpx.Response(200, text=SDSC_PAGE))),
+    )
+    csv_path = tmp_path / "plants.csv"
+    pd.DataFrame(
+        {"variety": ["A", "B"], "supplier": ["SDSC", "SDSC"], "url": ["https://seeds.test/a/", "https://seeds.test/b/"]}
+    ).to_csv(csv_path, index=False)
+    output = tmp_path / "enriched.csv"
+
+    scrape_module.scrape_plant_data(csv_path, output, batch_delay=0, parse_workers=2)
+
+    assert pd.read_csv(output)["web_botanical_name"].tolist() == ["Brassica oleracea"] * 2
@@ -0,0 +1,38 @@
+import numpy as np
+
+from scripts.io.raster import hex_to_rgb, rasterize
+from scripts.render_grid import GridLayout, LayoutLabel, LayoutRect, RectStyle
+
+
+def _layout() -> GridLayout:
+    return GridLayout(
+        width=80,
+        height=40,
+        font_family="Helvetica",
+        fonts={"tl": 10},
+        styles={"s0": RectStyle("#FF0000"), "s1": RectStyle("#0000FF", 0.5, "dashed")},
+        rects=[LayoutRect(0, 0, 40, 40, "s0"), LayoutRect(40, 0, 40, 40, "s1")],
+        labels=[LayoutLabel(20, 20, ("Hi",), "tl")],
+    )
+
+
+def test_hex_to_rgb() -> None:
+    assert hex_to_rgb("#D97A1E") == (217, 122, 30)
+    assert hex_to_rgb("#fff") == (255, 255, 255)
+
+
+def test_rasterize_fills_blends_and_strokes() -> None:
+    buf = rasterize(_layout())
+    assert buf.shape == (40, 80, 4)
+    assert tuple(buf[35, 5, :3]) == (255, 0, 0)
+    # 50% blue over the white background
+    assert tuple(buf[35, 60, :3]) == (128, 128, 255)
+    assert tuple(buf[0, 10, :3]) == (0x33, 0x33, 0x33)
+    # Label pixels are darkened around the run center
+    assert buf[15:22, 14:26, 1].min() < 100
+
+
+def test_rasterize_scales_with_dpi() -> None:
+    buf = rasterize(_layout(), dpi=192)
+    assert buf.shape == (80, 160, 4)
+    assert np.all(buf[..., 3] == 255)
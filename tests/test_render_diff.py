@@ -0,0 +1,119 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+import scripts.render_grid as render_grid
+from scripts.io.render_cache import RenderCache
+from scripts.render_diff import classify_changes, render_diff
+
+
+BASE = (
+    "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n"
+    "2,5,10,CROP,Lettuce,Salanova,Lettuce:Salanova:2026-03-07,2026-03-07,\n"
+)
+
+SCHEDULE = (
+    "plant_type,crop,variety,water,plant_date,succession_days,row_feet\n"
+    "Root Vegetable,Carrot,Bolero,medium,2026-02-21,21,10\n"
+    "Leafy Green,Lettuce,Salanova,high,2026-03-07,14,10\n"
+)
+
+
+def _grid(cells: list[tuple]) -> pd.DataFrame:
+    return pd.DataFrame(
+        cells,
+        columns=["bed_id", "block_idx", "status", "crop", "variety", "wave_id"],
+    )
+
+
+def test_classify_changes_labels_each_kind() -> None:
+    base = _grid(
+        [
+            (1, 0, "CROP", "Carrot", "Bolero", "C1"),
+            (1, 1, "CROP", "Beet", "Chioggia", "B1"),
+            (1, 2, "CROP", "Kale", "Lacinato", "K1"),
+            (1, 3, "EMPTY", "", "", ""),
+            (2, 0, "CROP", "Pea", "Sugar", "P1"),
+            (2, 1, "EMPTY", "", "", ""),
+            (2, 2, "FLOWER", "", "", ""),
+        ]
+    )
+    new = _grid(
+        [
+            (1, 0, "CROP", "Carrot", "Bolero", "C2"),
+            (1, 1, "CROP", "Radish", "Cherry", "R1"),
+            (1, 2, "EMPTY", "", "", ""),
+            (1, 3, "CROP", "Onion", "Red", "O1"),
+            (2, 0, "CROP", "Pea", "Sugar", "P1"),
+            (2, 1, "CROP", "Kale", "Lacinato", "K1"),
+            (2, 2, "BENEFICIAL", "", "", ""),
+        ]
+    )
+
+    changes = classify_changes(base, new)["change"].tolist()
+    assert changes == [
+        "moved_wave",
+        "changed_crop",
+        "removed",
+        "added",
+        "unchanged",
+        "moved_wave",
+        "changed_status",
+    ]
+    with pytest.raises(ValueError, match="geometry"):
+        classify_changes(base, new.iloc[:-1])
+
+
+def test_render_diff_writes_table_and_reuses_cached_base(tmp_path: Path, plan_inputs, monkeypatch) -> None:
+    base, schedule, geometry, visuals = plan_inputs(BASE, SCHEDULE, geometry={"bed_count": 3}, visuals=())
+    plan = tmp_path / "plan.csv"
+    plan.write_text(
+        "bed_id,start_ft,length_ft,status,crop,variety,wave_id,plant_date,notes\n"
+        "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n"
+        "3,5,5,CROP,Lettuce,Salanova,Lettuce:Salanova:2026-03-07,2026-03-07,\n",
+        encoding="utf-8",
+    )
+    outputs = tmp_path / "out"
+    cache = RenderCache(tmp_path / "cache")
+    render_grid.render_grid(
+        base,
+        schedule,
+        geometry,
+        visuals,
+        outputs / "base.csv",
+        outputs / "base.svg",
+        None,
+        1,
+        cache=cache,
+    )
+
+    loaded = []
+    original = render_grid.load_assignments
+    monkeypatch.setattr(
+        render_grid,
+        "load_assignments",
+        lambda path, *args: loaded.append(path.name) or original(path, *args),
+    )
+    table = render_diff(
+        base,
+        plan,
+        schedule,
+        geometry,
+        visuals,
+        outputs / "diff.svg",
+        None,
+        outputs / "diff.csv",
+        1,
+        cache=RenderCache(tmp_path / "cache"),
+    )
+
+    assert loaded == ["plan.csv"]
+    assert table[["bed_id", "start_ft", "end_ft", "change"]].values.tolist() == [
+        [2, 5, 15, "removed"],
+        [3, 5, 10, "moved_wave"],
+    ]
+    assert (outputs / "diff.csv").read_text().startswith("bed_id,start_ft,end_ft,change,")
+    svg = (outputs / "diff.svg").read_text()
+    assert "removed (1)" in svg
+    assert "moved wave (1)" in svg
@@ -1,4 +1,7 @@
-from scripts.render_grid import build_conflict_label_lines, build_crop_label_lines, fit_text
+import pytest
+
+from scripts.io.text_layout import fit_text
+from scripts.render_grid import build_conflict_label_lines, build_crop_label_lines
 
 
 def test_fit_text_truncates() -> None:
@@ -17,3 +20,25 @@ def test_build_conflict_label_lines() -> None:
     lines = build_conflict_label_lines(details, width_px=120, font_size=8, max_lines=3)
     assert lines[0] == "!"
     assert lines[-1].startswith("+")
+
+
+def test_build_crop_label_lines_auto_mode_falls_back_to_crop_code() -> None:
+    codes = {"Chinese Cabbage": "CHCA"}
+    wide = build_crop_label_lines("Chinese Cabbage", "Bilko F1", 120, 6, label_mode="auto")
+    narrow = build_crop_label_lines(
+        "Chinese Cabbage", "Bilko F1", 40, 6, label_mode="auto", crop_codes=codes
+    )
+    assert wide == ["Chinese Cabbage", "Bilko F1"]
+    assert narrow == ["CHCA.-BIL."]
+
+
+def test_build_crop_label_lines_rejects_unknown_mode() -> None:
+    with pytest.raises(ValueError, match="label_mode"):
+        build_crop_label_lines("Carrots", "Bolero", 120, 10, label_mode="tiny")
+
+
+def test_build_crop_label_lines_collects_missing_codes() -> None:
+    missing: set[str] = set()
+    for _ in range(2):
+        build_crop_label_lines("Kohlrabi", "Kolibri", 120, 10, label_mode="crop_code", missing_codes=missing)
+    assert missing == {"Kohlrabi"}
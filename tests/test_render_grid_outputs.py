@@ -0,0 +1,130 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from scripts.render_grid import render_grid
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+ASSIGNMENTS = (
+    "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,Roots\n"
+    "2,5,5,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n"
+    "2,10,5,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n"
+)
+
+VISUALS = (
+    {"family_colors": {"Root Vegetable": "#D97A1E"}},
+    {"water_alpha": {"medium": 0.7}, "water_borders": {"medium": "dashed"}},
+)
+
+
+def test_render_grid_svg_shares_styles_and_symbols(tmp_path: Path, plan_inputs) -> None:
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, visuals=VISUALS)
+    output_svg = tmp_path / "grid.svg"
+
+    grid = render_grid(
+        assignments,
+        schedule,
+        geometry,
+        visuals,
+        tmp_path / "grid.csv",
+        output_svg,
+        None,
+        1,
+    )
+
+    assert grid["run_id"].nunique() == 6
+    root = ET.parse(output_svg).getroot()
+    css = root.find(f"{SVG}style").text
+    assert "fill:#D97A1E;fill-opacity:0.7;stroke-dasharray:4,2" in css
+    # The "Carrot / Bolero" label repeats in both beds but is declared once.
+    label_defs = [el for el in root.find(f"{SVG}defs") if el.tag == f"{SVG}text"]
+    carrot_labels = [el for el in label_defs if len(el) and el[0].text == "Carrot"]
+    assert len(carrot_labels) == 1
+    label_ref = "#" + carrot_labels[0].get("id")
+    uses = root.findall(f"{SVG}use")
+    assert sum(el.get("{http://www.w3.org/1999/xlink}href") == label_ref for el in uses) == 2
+    body_text = [el for el in root if el.tag == f"{SVG}text"]
+    assert all("fill" not in el.attrib for el in body_text)
+
+
+def test_render_grid_native_png(tmp_path: Path, plan_inputs) -> None:
+    from PIL import Image
+
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, visuals=VISUALS)
+    output_png = tmp_path / "grid.png"
+
+    render_grid(
+        assignments,
+        schedule,
+        geometry,
+        visuals,
+        tmp_path / "grid.csv",
+        tmp_path / "grid.svg",
+        output_png,
+        1,
+        png_dpi=192,
+    )
+
+    with Image.open(output_png) as image:
+        # 40px row labels + 4 blocks * 40px + int(160 * 0.33) notes, doubled
+        assert image.size == ((40 + 160 + 52) * 2, 2 * 40 * 2)
+
+
+def test_render_grid_cache_skips_unchanged_outputs(tmp_path: Path, plan_inputs, monkeypatch) -> None:
+    import scripts.render_grid as render_grid_module
+    from scripts.io.render_cache import RenderCache
+
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, visuals=VISUALS)
+    outputs = (tmp_path / "grid.csv", tmp_path / "grid.svg", tmp_path / "grid.png")
+
+    def render(**kwargs: object) -> RenderCache:
+        cache = RenderCache(tmp_path / "cache")
+        render_grid(assignments, schedule, geometry, visuals, *outputs, 1, cache=cache, **kwargs)
+        return cache
+
+    assert render().written == list(outputs)
+    assert render().skipped == list(outputs)
+
+    cache = render(png_dpi=192)
+    assert cache.skipped == list(outputs[:2])
+    assert cache.written == [outputs[2]]
+
+    outputs[1].unlink()
+    assert render(png_dpi=192).written == [outputs[1]]
+
+    # A visuals change re-renders everything but reuses the validated assignments.
+    def fail_load(*args: object) -> None:
+        raise AssertionError("assignments should come from the cache")
+
+    monkeypatch.setattr(render_grid_module, "load_assignments", fail_load)
+    with visuals.open("a", encoding="utf-8") as handle:
+        handle.write('{"stroke_color": "#000000"}\n')
+    assert render().written == list(outputs)
+
+
+def test_render_grid_cache_ignores_png_that_failed_to_rasterize(tmp_path: Path, plan_inputs, monkeypatch) -> None:
+    import sys
+
+    from scripts.io.render_cache import RenderCache
+
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, visuals=VISUALS)
+    outputs = (tmp_path / "grid.csv", tmp_path / "grid.svg", tmp_path / "grid.png")
+    monkeypatch.setitem(sys.modules, "cairosvg", None)
+
+    def render() -> RenderCache:
+        cache = RenderCache(tmp_path / "cache")
+        render_grid(assignments, schedule, geometry, visuals, *outputs, 1, png_backend="cairo", cache=cache)
+        return cache
+
+    assert render().written == list(outputs[:2])
+    assert not outputs[2].exists()
+    # The CSV and SVG were recorded even though the PNG was not written.
+    assert render().skipped == list(outputs[:2])
+
+
+def test_render_grid_warns_about_missing_crop_codes_on_every_render(tmp_path: Path, plan_inputs, capsys) -> None:
+    inputs = plan_inputs(ASSIGNMENTS, visuals=({"label_mode": "crop_code"},))
+
+    for _ in range(2):
+        render_grid(*inputs, tmp_path / "grid.csv", tmp_path / "grid.svg", None, 1)
+        assert capsys.readouterr().out.count("No crop code for Carrot") == 1
@@ -0,0 +1,110 @@
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.render_grid import build_grid, build_runs, compute_run_ids, render_grid
+
+
+def _grid(rows: list[tuple[int, int, str, str]]) -> pd.DataFrame:
+    return pd.DataFrame(
+        [
+            {
+                "bed_id": bed_id,
+                "block_idx": block_idx,
+                "status": status,
+                "crop": crop,
+                "variety": "",
+                "wave_id": crop,
+                "conflict_details": "",
+            }
+            for bed_id, block_idx, status, crop in rows
+        ]
+    )
+
+
+def test_compute_run_ids_merges_adjacent_cells_per_bed() -> None:
+    grid = _grid(
+        [
+            (1, 0, "FLOWER", ""),
+            (1, 1, "CROP", "Carrots"),
+            (1, 2, "CROP", "Carrots"),
+            (1, 3, "CROP", "Beets"),
+            (2, 0, "CROP", "Beets"),
+            (2, 1, "CROP", "Beets"),
+        ]
+    )
+    assert compute_run_ids(grid).tolist() == [0, 1, 1, 2, 3, 3]
+
+
+def test_compute_run_ids_is_order_independent() -> None:
+    grid = _grid(
+        [
+            (2, 1, "CROP", "Beets"),
+            (1, 1, "CROP", "Carrots"),
+            (2, 0, "CROP", "Beets"),
+            (1, 0, "CROP", "Carrots"),
+        ]
+    )
+    assert compute_run_ids(grid).tolist() == [1, 0, 1, 0]
+
+
+def test_build_runs_reports_block_spans() -> None:
+    grid = _grid(
+        [
+            (1, 0, "FLOWER", ""),
+            (1, 1, "CROP", "Carrots"),
+            (1, 2, "CROP", "Carrots"),
+            (1, 3, "EMPTY", ""),
+        ]
+    )
+    grid["run_id"] = compute_run_ids(grid)
+    runs = build_runs(grid)
+    assert runs["run_id"].tolist() == [0, 1, 2]
+    assert runs["start_block"].tolist() == [0, 1, 3]
+    assert runs["end_block"].tolist() == [1, 3, 4]
+    assert runs.loc[1, "crop"] == "Carrots"
+
+
+def test_build_grid_marks_overlapping_occupants_as_conflict() -> None:
+    assignments = pd.DataFrame(
+        {
+            "bed_id": [1, 1],
+            "start_block": [0, 2],
+            "end_block": [2, 3],
+            "status": ["CROP", "CROP"],
+            "crop": ["Carrot", "Beet"],
+            "variety": ["Bolero", "Chioggia"],
+            "wave_id": ["c", "b"],
+            "family": ["Root", "Root"],
+            "water": ["medium", "medium"],
+        }
+    )
+    geometry = {"bed_count": 1, "bed_length_ft": 15, "block_size_ft": 5, "flower_blocks": [2]}
+    visuals = {"family_colors": {"Root": "#D97A1E"}, "water_alpha": {"medium": 0.7}}
+
+    grid = build_grid(assignments, geometry, visuals)
+
+    assert grid["status"].tolist() == ["CROP", "CROP", "CONFLICT"]
+    assert grid.loc[2, "conflict_details"] == "FLOWER | Beet / Chioggia"
+    assert grid["color"].tolist()[:2] == ["#D97A1E", "#D97A1E"]
+    assert grid["alpha"].tolist() == [0.7, 0.7, 1.0]
+    assert grid["run_id"].tolist() == [0, 0, 1]
+
+
+def test_build_grid_matches_per_cell_reference(tmp_path: Path) -> None:
+    # expected-grid.csv was written by the per-cell build_grid before it was vectorized.
+    fixtures = Path(__file__).resolve().parent / "fixtures" / "grid-conflicts"
+    output_csv = tmp_path / "grid.csv"
+
+    render_grid(
+        fixtures / "assignments.csv",
+        fixtures / "schedule.csv",
+        fixtures / "geometry.jsonl",
+        fixtures / "visuals.jsonl",
+        output_csv,
+        tmp_path / "grid.svg",
+        None,
+        1,
+    )
+
+    assert output_csv.read_bytes() == (fixtures / "expected-grid.csv").read_bytes()
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+import pytest
+
+import scripts.render_many as render_many_module
+from scripts.render_many import plan_names, render_many
+
+
+def _write_plan(path: Path, bed_id: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        "bed_id,start_ft,length_ft,status,crop,variety,wave_id,plant_date,notes\n"
+        f"{bed_id},5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n",
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_plan_names_prefix_repeated_stems(tmp_path: Path) -> None:
+    dry = _write_plan(tmp_path / "dry" / "plan.csv", 1)
+    wet = _write_plan(tmp_path / "wet" / "plan.csv", 1)
+    extra = _write_plan(tmp_path / "wet" / "early.csv", 1)
+
+    assert plan_names([dry, tmp_path / "wet"]) == {
+        "dry-plan": dry,
+        "early": extra,
+        "wet-plan": wet,
+    }
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError, match="No plan files"):
+        plan_names([tmp_path / "empty"])
+
+
+def test_render_many_loads_schedule_once_and_reports_bad_plans(
+    tmp_path: Path, plan_inputs, monkeypatch
+) -> None:
+    _, schedule, geometry, visuals = plan_inputs(visuals=())
+    plans = [
+        _write_plan(tmp_path / "plans" / "north.csv", 1),
+        _write_plan(tmp_path / "plans" / "south.csv", 2),
+        _write_plan(tmp_path / "plans" / "broken.csv", 9),
+    ]
+    loads = []
+    original = render_many_module.load_schedule
+    monkeypatch.setattr(
+        render_many_module,
+        "load_schedule",
+        lambda path: loads.append(path) or original(path),
+    )
+    output_dir = tmp_path / "out"
+
+    results = render_many(
+        plans,
+        schedule,
+        geometry,
+        visuals,
+        output_dir,
+        1,
+        skip_png=True,
+        workers=1,
+    )
+
+    assert loads == [schedule]
+    assert results == {"north": None, "south": None, "broken": "bed_id out of bounds"}
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        "north.csv",
+        "north.svg",
+        "south.csv",
+        "south.svg",
+    ]
+    assert "Carrot" in (output_dir / "south.csv").read_text()
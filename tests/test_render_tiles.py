@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from scripts.render_tiles import field_extents, render_tiles, tile_windows, zoom_scales
+
+
+ASSIGNMENTS = (
+    "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,Roots\n"
+    "4,5,5,CROP,Carrot,Bolero,Carrot:Bolero:2026-02-21,2026-02-21,\n"
+)
+
+GEOMETRY = {
+    "bed_count": 4,
+    "fields": [{"name": "North", "beds": [1, 2]}, {"name": "South", "beds": [3, 4]}],
+}
+
+
+def test_zoom_scales_halve_until_one_tile_fits() -> None:
+    assert zoom_scales(100, 1000, 256, 1.0) == [0.25, 0.5, 1.0]
+    assert zoom_scales(100, 100, 256, 2.0) == [2.0]
+
+
+def test_tile_windows_crop_edge_tiles() -> None:
+    windows = tile_windows(300, 100, 256)
+    assert windows == [(0, 0, (0, 0, 256, 100)), (1, 0, (256, 0, 44, 100))]
+
+
+def test_field_extents_reject_beds_outside_farm() -> None:
+    geometry = {"bed_count": 4, "bed_length_ft": 20, "block_size_ft": 5}
+    assert field_extents(geometry, 40)[0]["height"] == 160
+    with pytest.raises(ValueError, match="outside"):
+        field_extents({**geometry, "fields": [{"name": "East", "beds": [3, 6]}]}, 40)
+
+
+def test_render_tiles_writes_pyramid_and_manifest(tmp_path: Path, plan_inputs) -> None:
+    from PIL import Image
+
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, geometry=GEOMETRY)
+    output_dir = tmp_path / "tiles"
+
+    manifest = render_tiles(
+        assignments,
+        schedule,
+        geometry,
+        visuals,
+        output_dir,
+        1,
+        tile_size=64,
+        workers=1,
+    )
+
+    # 40 + 4 * 40 + 52 = 252 wide, 4 * 40 = 160 tall at the top level.
+    top = manifest["levels"][-1]
+    assert (top["width"], top["height"], top["columns"], top["rows"]) == (252, 160, 4, 3)
+    assert manifest["levels"][0]["columns"] == manifest["levels"][0]["rows"] == 1
+    assert [field["name"] for field in manifest["fields"]] == ["North", "South"]
+    assert json.loads((output_dir / "manifest.json").read_text()) == manifest
+    tiles = sorted(output_dir.glob("*/*/*.png"))
+    assert len(tiles) == manifest["tile_count"]
+    with Image.open(output_dir / str(manifest["max_zoom"]) / "3" / "2.png") as edge:
+        assert edge.size == (252 - 3 * 64, 160 - 2 * 64)
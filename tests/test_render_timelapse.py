@@ -0,0 +1,101 @@
+from pathlib import Path
+
+import pandas as pd
+
+from scripts.io.waves import occupancy_windows
+from scripts.render_timelapse import build_occupancy_index, render_timelapse, season_weeks
+
+
+ASSIGNMENTS = (
+    "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-03-02,2026-03-02,\n"
+    "2,5,5,CROP,Carrot,Bolero,Carrot:Bolero:2026-03-23,2026-03-23,\n"
+)
+
+
+def test_occupancy_windows_span_maturity_and_harvest() -> None:
+    assignments = pd.DataFrame(
+        {
+            "wave_id": ["Carrot:Bolero:2026-03-02", "BENEFICIAL"],
+            "status": ["CROP", "BENEFICIAL"],
+            "plant_date": ["2026-03-02", ""],
+        }
+    )
+    schedule = pd.DataFrame(
+        {
+            "wave_id": ["Carrot:Bolero:2026-03-02"],
+            "plant_date": ["2026-03-02"],
+            "first_harvest_date": ["2026-03-16"],
+            "harvest_weeks_per_planting": [2],
+        }
+    )
+
+    windows = occupancy_windows(assignments, schedule)
+
+    assert windows.loc[0, "occupied_from"] == pd.Timestamp("2026-03-02")
+    assert windows.loc[0, "occupied_until"] == pd.Timestamp("2026-03-30")
+    assert pd.isna(windows.loc[1, "occupied_from"])
+
+
+def test_build_occupancy_index_keeps_undated_rows_active() -> None:
+    windows = pd.DataFrame(
+        {
+            "occupied_from": pd.to_datetime(["2026-03-02", "2026-03-23", None]),
+            "occupied_until": pd.to_datetime(["2026-03-10", "2026-03-30", None]),
+        }
+    )
+    weeks = season_weeks(windows.dropna())
+
+    index = build_occupancy_index(windows, weeks)
+
+    assert weeks[0] == pd.Timestamp("2026-03-02")
+    assert index.tolist() == [
+        [True, False, True],
+        [True, False, True],
+        [False, False, True],
+        [False, True, True],
+        [False, True, True],
+    ]
+
+
+def test_render_timelapse_writes_frames_animation_and_sheet(
+    tmp_path: Path, plan_inputs, harvest_schedule: str
+) -> None:
+    from PIL import Image
+
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, harvest_schedule)
+    output_dir = tmp_path / "timelapse"
+
+    frames = render_timelapse(
+        assignments,
+        schedule,
+        geometry,
+        visuals,
+        output_dir,
+        1,
+        workers=1,
+        gif_width=120,
+        thumb_width=60,
+    )
+
+    assert [path.name for path in frames][:2] == [
+        "week-01-2026-03-02.png",
+        "week-02-2026-03-09.png",
+    ]
+    assert all(path.with_suffix(".svg").exists() for path in frames)
+    assert "Carrot" in frames[0].with_suffix(".svg").read_text(encoding="utf-8")
+    with Image.open(output_dir / "bed-grid-timelapse.gif") as gif:
+        assert gif.n_frames == len(frames)
+        assert gif.width == 120
+    with Image.open(output_dir / "bed-grid-contact-sheet.png") as sheet:
+        assert sheet.width == 60 * len(frames)
+
+
+def test_render_timelapse_warns_about_missing_crop_codes_once(
+    tmp_path: Path, plan_inputs, harvest_schedule: str, capsys
+) -> None:
+    inputs = plan_inputs(ASSIGNMENTS, harvest_schedule, visuals=({"label_mode": "crop_code"},))
+
+    frames = render_timelapse(*inputs, tmp_path / "timelapse", 1, workers=1)
+
+    assert len(frames) > 1
+    assert capsys.readouterr().out.count("No crop code for Carrot") == 1
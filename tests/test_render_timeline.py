@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from scripts.render_timeline import assign_lanes, render_timeline, timeline_waves
+
+
+SCHEDULE = (
+    "plant_type,crop,variety,method,water,plant_date,first_harvest_date,"
+    "succession_days,harvest_weeks_per_planting,row_feet\n"
+    "Brassica,Broccoli,Belstar F1,transplant,medium,2026-03-07,2026-05-16,21,2,10\n"
+    "Root Vegetable,Carrot,Bolero,direct_sow,medium,2026-02-21,2026-05-02,21,,10\n"
+    "Root Vegetable,Carrot,Bolero,direct_sow,medium,2026-03-14,2026-05-23,21,3,10\n"
+)
+
+VISUALS = ({"family_colors": {"Brassica": "#6A9A1F", "Root Vegetable": "#D97A1E"}},)
+
+
+def test_assign_lanes_uses_fewest_lanes() -> None:
+    starts = np.array([0, 1, 5, 6, 10])
+    ends = np.array([4, 9, 8, 12, 11])
+
+    lanes = assign_lanes(starts, ends)
+
+    assert lanes.tolist() == [0, 1, 0, 2, 0]
+    assert assign_lanes(starts, ends, gap=2).max() == 2
+
+
+def test_timeline_waves_derive_order_and_harvest_end() -> None:
+    schedule = pd.DataFrame(
+        {
+            "wave_id": ["a", "b"],
+            "plant_type": ["Brassica", "Root Vegetable"],
+            "crop": ["Broccoli", "Carrot"],
+            "variety": ["Belstar F1", "Bolero"],
+            "method": ["transplant", "direct_sow"],
+            "plant_date": ["2026-03-07", "2026-02-21"],
+            "first_harvest_date": ["2026-05-16", "2026-05-02"],
+            "harvest_weeks_per_planting": [2, None],
+            "succession_days": [21, 21],
+        }
+    )
+
+    waves = timeline_waves(schedule)
+
+    assert waves["order_date"].dt.strftime("%Y-%m-%d").tolist() == ["2026-01-31", "2026-02-21"]
+    assert waves["harvest_end"].dt.strftime("%Y-%m-%d").tolist() == ["2026-05-30", "2026-05-23"]
+
+
+def test_render_timeline_writes_svg_and_png(tmp_path: Path, plan_inputs) -> None:
+    _, schedule, _, visuals = plan_inputs(schedule=SCHEDULE, visuals=VISUALS)
+    output_svg = tmp_path / "timeline.svg"
+    output_png = tmp_path / "timeline.png"
+
+    waves = render_timeline(schedule, visuals, output_svg, output_png, 1)
+
+    assert len(waves) == 3
+    svg = output_svg.read_text(encoding="utf-8")
+    assert "Root Vegetable (2)" in svg
+    assert "Broccoli / Belstar F1" in svg
+    assert "fill:#D97A1E" in svg
+    assert "Jan 2026" in svg
+    assert output_png.exists()
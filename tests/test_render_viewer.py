@@ -0,0 +1,40 @@
+import base64
+import gzip
+import json
+from pathlib import Path
+
+from scripts.render_viewer import encode_payload, render_viewer
+
+
+ASSIGNMENTS = (
+    "1,5,10,CROP,Carrot,Bolero,Carrot:Bolero:2026-03-02,2026-03-02,Thin early\n"
+    "2,10,5,CROP,Carrot,Bolero,Carrot:Bolero:2026-03-23,2026-03-23,\n"
+)
+
+
+def test_render_viewer_embeds_columnar_payload(tmp_path: Path, plan_inputs, harvest_schedule: str) -> None:
+    assignments, schedule, geometry, visuals = plan_inputs(ASSIGNMENTS, harvest_schedule)
+    output_html = tmp_path / "viewer.html"
+
+    payload = render_viewer(assignments, schedule, geometry, visuals, output_html, 1, title="Spring")
+
+    runs, strings = payload["runs"], payload["strings"]
+    crop_runs = [i for i, code in enumerate(runs["status"]) if strings[code] == "CROP"]
+    assert [(runs["bed"][i], runs["start"][i], runs["end"][i]) for i in crop_runs] == [
+        (1, 1, 3),
+        (2, 2, 3),
+    ]
+    first = crop_runs[0]
+    assert payload["epoch"] == "2026-03-02"
+    # Planted day 0, first harvest day 14, cleared a week later.
+    assert (runs["plant"][first], runs["first_harvest"][first], runs["until"][first]) == (0, 14, 21)
+    assert strings[runs["wave_id"][first]] == "Carrot:Bolero:2026-03-02"
+    assert strings[runs["notes"][first]] == "Thin early"
+    assert all(len(column) == len(runs["bed"]) for column in runs.values())
+
+    page = output_html.read_text(encoding="utf-8")
+    assert "<title>Spring</title>" in page
+    assert "__PLAN_DATA__" not in page
+    embedded = page.split('type="application/octet-stream">')[1].split("</script>")[0]
+    assert embedded == encode_payload(payload)
+    assert json.loads(gzip.decompress(base64.b64decode(embedded))) == payload
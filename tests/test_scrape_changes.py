@@ -0,0 +1,81 @@
+import time
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+import scripts.scrape_plant_data as scrape_module
+from scripts.io.http_cache import HttpCache
+from scripts.io.http_client import AsyncFetcher
+from scripts.io.scrape_changes import fingerprint
+
+PAGE = """<html><body><table class="woocommerce-product-attributes">
+<tr><th>Botanical Name</th><td>Brassica oleracea</td></tr>
+<tr><th>Days to Maturity</th><td>{days}</td></tr>
+<tr><th>Approx. Seed Count</th><td>65</td></tr>
+</table></body></html>"""
+
+
+def test_fingerprint_ignores_key_order_and_extra_fields() -> None:
+    columns = ["a", "b"]
+    assert fingerprint({"a": 1, "b": 2}, columns) == fingerprint({"b": 2, "a": 1, "c": 3}, columns)
+    assert fingerprint({"a": 1}, columns) != fingerprint({"a": 1, "b": 2}, columns)
+
+
+def test_refresh_writes_only_changed_rows(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    days = {"/p0": "75+", "/p1": "60"}
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        etag = f'"{path}-{days[path]}"'
+        requests.append((path, request.headers.get("if-none-match")))
+        if request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers={"etag": etag})
+        return httpx.Response(200, text=PAGE.format(days=days[path]), headers={"etag": etag})
+
+    mock_fetcher(handler)
+    csv_path = write_plants(["https://seeds.test/p0", "https://seeds.test/p1"])
+    output = tmp_path / "enriched.csv"
+    change_log = tmp_path / "changes.csv"
+
+    with HttpCache(tmp_path / "cache.sqlite", default_ttl=0) as cache:
+        scrape_module.scrape_plant_data(csv_path, output, cache=cache, batch_delay=0)
+    first = pd.read_csv(output, keep_default_na=False)
+    days["/p1"] = "65"
+    requests.clear()
+    time.sleep(0.01)
+
+    with HttpCache(tmp_path / "cache.sqlite", default_ttl=0) as cache:
+        scrape_module.scrape_plant_data(
+            output, output, cache=cache, batch_delay=0, refresh=True, change_log_path=change_log
+        )
+
+    second = pd.read_csv(output, keep_default_na=False)
+    assert sorted(requests) == [("/p0", '"/p0-75+"'), ("/p1", '"/p1-60"')]
+    assert second["web_days_to_maturity"].astype(str).tolist() == ["75+", "65"]
+    assert second["scrape_date"].iloc[0] == first["scrape_date"].iloc[0]
+    assert second["scrape_date"].iloc[1] != first["scrape_date"].iloc[1]
+    assert second["scrape_fingerprint"].iloc[1] != first["scrape_fingerprint"].iloc[1]
+    log = pd.read_csv(change_log, dtype=str)
+    assert log[["variety", "field", "old", "new"]].values.tolist() == [
+        ["Variety 1", "web_days_to_maturity", "60", "65"]
+    ]
+
+
+def test_refresh_keeps_good_rows_when_fetch_fails(tmp_path: Path, write_plants, mock_fetcher, monkeypatch) -> None:
+    mock_fetcher(lambda request: httpx.Response(200, text=PAGE.format(days="75+")))
+    csv_path = write_plants(["https://seeds.test/p0"])
+    output = tmp_path / "enriched.csv"
+    scrape_module.scrape_plant_data(csv_path, output, batch_delay=0)
+
+    def broken(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("down")
+
+    mock_fetcher(broken)
+    monkeypatch.setattr(AsyncFetcher.get.retry, "stop", lambda retry_state: True)
+    scrape_module.scrape_plant_data(output, output, batch_delay=0, refresh=True)
+
+    df = pd.read_csv(output, keep_default_na=False)
+    assert df["scrape_status"].tolist() == ["success"]
+    assert df["web_days_to_maturity"].tolist() == ["75+"]
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+import scripts.scrape_plant_data as scrape_module
+from scripts.io.scrape_journal import ScrapeJournal, load_journal, merge_records
+
+SDSC_PAGE = """<html><body><table class="woocommerce-product-attributes">
+<tr><th>Botanical Name</th><td>Brassica oleracea</td></tr>
+</table></body></html>"""
+
+URLS = [f"https://seeds.test/p{i}" for i in range(3)]
+
+
+def test_load_journal_skips_truncated_line_and_merge_keeps_last(tmp_path: Path) -> None:
+    path = tmp_path / "journal.jsonl"
+    with ScrapeJournal(path) as journal:
+        journal.append({"row": 0, "url": "a", "values": {"count": "12 seeds"}})
+        journal.append({"row": 0, "url": "a", "values": {"count": "15 seeds", "status": "success"}})
+    with path.open("a") as handle:
+        handle.write('{"row": 1, "url": "b", "val')
+
+    records = load_journal(path)
+    df = pd.DataFrame({"count": [1.0, 2.0], "status": [None, None]})
+    merge_records(df, records)
+
+    assert len(records) == 2
+    assert df["count"].tolist() == ["15 seeds", 2.0]
+    assert df["status"].tolist() == ["success", None]
+
+
+def test_rows_are_journaled_as_they_finish(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    journal = tmp_path / "enriched.csv.journal.jsonl"
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(len(load_journal(journal)))
+        return httpx.Response(200, text=SDSC_PAGE)
+
+    mock_fetcher(handler)
+    output = tmp_path / "enriched.csv"
+    scrape_module.scrape_plant_data(
+        write_plants(URLS), output, batch_size=1, batch_delay=0, journal_path=journal
+    )
+
+    # The last page is fetched after earlier rows were already on disk.
+    assert seen[0] == 0 and seen[-1] >= 1
+    assert not journal.exists()
+
+
+def test_resume_skips_journaled_rows(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, text=SDSC_PAGE)
+
+    mock_fetcher(handler)
+    csv_path = write_plants(URLS)
+    output = tmp_path / "enriched.csv"
+    journal = tmp_path / "journal.jsonl"
+    done = {"web_botanical_name": "From journal", "scrape_status": "success"}
+    records = [
+        {"row": 0, "url": "https://seeds.test/p0", "values": done},
+        {"row": 1, "url": "https://seeds.test/moved", "values": done},
+    ]
+    journal.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+    scrape_module.scrape_plant_data(csv_path, output, batch_delay=0, journal_path=journal, resume=True)
+
+    df = pd.read_csv(output)
+    assert sorted(requests) == ["https://seeds.test/p1", "https://seeds.test/p2"]
+    assert df["web_botanical_name"].tolist() == ["From journal", "Brassica oleracea", "Brassica oleracea"]
+    assert df["scrape_status"].tolist() == ["success"] * 3
+    assert not journal.exists()
@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+
+from scripts.io.http_cache import HttpCache
+from scripts.io.scrape_metrics import histogram
+from scripts.mock_supplier_server import MockBehavior, MockSupplierServer, write_fixture_plants
+from scripts.scrape_plant_data import scrape_plant_data
+
+CORPUS = Path(__file__).parent / "fixtures" / "suppliers"
+
+
+def test_histogram_buckets_and_percentiles() -> None:
+    stats = histogram([0.001, 0.004, 0.02, 0.02, 12.0])
+
+    assert stats["count"] == 5
+    assert stats["p50_ms"] == 20.0
+    assert stats["max_ms"] == 12000.0
+    assert stats["counts"][:3] == [2, 0, 2]
+    assert stats["counts"][-1] == 1
+    assert histogram([]) == {"count": 0}
+
+
+def test_scrape_report_covers_hosts_retries_and_suppliers(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setenv("TNH_GEN", str(CORPUS / "fake-tnh-gen"))
+    plants = tmp_path / "plants.csv"
+    output = tmp_path / "enriched.csv"
+    report_path = tmp_path / "report.json"
+
+    with MockSupplierServer(CORPUS, MockBehavior(fail_first=1)) as server:
+        df = write_fixture_plants(CORPUS, server.base_url, plants)
+        df.groupby("supplier").head(1).to_csv(plants, index=False)
+        with HttpCache(tmp_path / "cache.sqlite") as cache:
+            scrape_plant_data(plants, output, cache=cache, batch_delay=0, report_path=report_path)
+
+    report = json.loads(report_path.read_text())
+    host = report["hosts"]["127.0.0.1"]
+    assert report["rows"] == 2
+    assert (host["requests"], host["status_429"], host["status_200"], host["retries"]) == (4, 2, 2, 2)
+    assert host["bytes"] > 0
+    assert {"total", "connect", "ttfb", "download", "rate_limit_wait"} <= set(host)
+    assert report["suppliers"]["SDSC"]["parse"]["count"] == 1
+    assert report["suppliers"]["SDSC"]["cache_miss"] == 1
+    assert report["suppliers"]["JS"]["llm"]["count"] == 1
+    assert report["suppliers"]["JS"]["rows_success"] == 1
+    assert report["settings"]["requests_per_second_per_host"] is None
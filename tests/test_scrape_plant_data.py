@@ -0,0 +1,114 @@
+import json
+from pathlib import Path
+
+import httpx
+import pandas as pd
+
+import scripts.io.tnh_gen as tnh_gen
+import scripts.scrape_plant_data as scrape_module
+from scripts.io.http_cache import HttpCache
+from scripts.io.page_extract import fragment_cache_key
+
+SDSC_PAGE = """<html><head><title>Seeds</title></head><body>
+<table class="woocommerce-product-attributes">
+<tr><th>Botanical Name</th><td>Brassica oleracea</td></tr>
+<tr><th>Days to Maturity</th><td>75+</td></tr>
+<tr><th>Final Spacing</th><td>&ge;24" apart</td></tr>
+</table></body></html>"""
+
+
+def test_scrape_plant_data_fetches_rows_concurrently(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, text=SDSC_PAGE)
+
+    mock_fetcher(handler)
+    urls = [f"https://seeds.test/p{i}" for i in range(4)]
+    csv_path = write_plants(urls)
+    output = tmp_path / "enriched.csv"
+
+    scrape_module.scrape_plant_data(csv_path, output, batch_size=2, batch_delay=0)
+
+    df = pd.read_csv(output, keep_default_na=False)
+    assert df["scrape_status"].tolist() == ["success"] * 4
+    assert df["web_botanical_name"].tolist() == ["Brassica oleracea"] * 4
+    assert df["web_final_spacing"].iloc[0] == '≥24" apart'
+    assert df["sdsc_plant_height"].iloc[0] == "NOT_FOUND"
+    assert df["js_growing_notes"].iloc[0] == "N/A"
+    assert sorted(requests) == urls
+
+
+def test_scrape_plant_data_caches_extracted_fragment(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, text=SDSC_PAGE)
+
+    mock_fetcher(handler)
+    csv_path = write_plants(["https://seeds.test/p0"])
+    output = tmp_path / "enriched.csv"
+
+    for _ in range(2):
+        with HttpCache(tmp_path / "cache.sqlite") as cache:
+            scrape_module.scrape_plant_data(csv_path, output, cache=cache, batch_delay=0)
+
+    assert requests == ["https://seeds.test/p0"]
+    assert pd.read_csv(output)["web_botanical_name"].tolist() == ["Brassica oleracea"]
+    with HttpCache(tmp_path / "cache.sqlite") as cache:
+        entry = cache.get(fragment_cache_key("https://seeds.test/p0", "SDSC"))
+    assert "<table" not in entry.body
+    assert json.loads(entry.body)["attributes"][0] == ["Botanical Name", "Brassica oleracea"]
+
+
+def test_scrape_plant_data_batches_johnnys_pages(tmp_path: Path, write_plants, mock_fetcher, monkeypatch) -> None:
+    prompts = []
+
+    def fake_run_prompt(prompt_key: str, input_text: str, timeout: float = 60) -> dict:
+        prompts.append(prompt_key)
+        items = json.loads(input_text)
+        return {item["id"]: {"scientific_name": item["text"].split(":")[-1].strip()} for item in items}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        name = request.url.path.strip("/")
+        return httpx.Response(200, text=f'<div class="c-facts">Latin: {name}</div>')
+
+    mock_fetcher(handler)
+    monkeypatch.setattr(tnh_gen, "run_prompt", fake_run_prompt)
+    csv_path = write_plants([f"https://seeds.test/p{i}" for i in range(4)])
+    df = pd.read_csv(csv_path).assign(supplier="JS")
+    df.to_csv(csv_path, index=False)
+    output = tmp_path / "enriched.csv"
+
+    scrape_module.scrape_plant_data(csv_path, output, batch_size=4, batch_delay=0, js_batch_size=4)
+
+    df = pd.read_csv(output)
+    assert df["web_botanical_name"].tolist() == ["p0", "p1", "p2", "p3"]
+    assert prompts == ["extract_johnnys_seeds_data_batch"]
+
+
+def test_scrape_plant_files_fetches_each_page_once(tmp_path: Path, write_plants, mock_fetcher) -> None:
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        return httpx.Response(200, text=SDSC_PAGE)
+
+    mock_fetcher(handler)
+    veg = write_plants(
+        ["https://seeds.test/p0/", "https://SEEDS.test/p0/?attribute_pa_size=1-oz", "https://seeds.test/p1/"],
+        tmp_path / "veg",
+    )
+    herb = write_plants(["https://seeds.test/p1/#reviews", "string - product URL"], tmp_path / "herb")
+    outputs = [tmp_path / "veg-enriched.csv", tmp_path / "herb-enriched.csv"]
+
+    scrape_module.scrape_plant_files(list(zip([veg, herb], outputs)), batch_delay=0)
+
+    assert sorted(requests) == ["https://seeds.test/p0/", "https://seeds.test/p1/"]
+    veg_df = pd.read_csv(outputs[0])
+    herb_df = pd.read_csv(outputs[1])
+    assert veg_df["web_botanical_name"].tolist() == ["Brassica oleracea"] * 3
+    assert herb_df["scrape_status"].tolist() == ["success", "failed"]
+    assert herb_df["web_botanical_name"].iloc[0] == "Brassica oleracea"
@@ -0,0 +1,46 @@
+from scripts.extract_in_row_spacing import extract_spacings_with_rules
+from scripts.io.spacing_rules import HIGH, MEDIUM, SpacingMatch, parse_in_row_spacing
+
+
+def test_parse_in_row_spacing_reads_common_forms() -> None:
+    cases = {
+        '≥24" apart': 24,
+        '12–18"': 12,
+        "2–3' apart": 24,
+        '2\\" apart': 2,
+        '10–18" apart (rows 18–36" apart)': 10,
+        '4–6" apart; rows 12–18" apart': 4,
+        "Transplant 12\" apart in rows 5–6' apart": 12,
+        '8" in-row, rows 18" apart': 8,
+        '18" between plants; 24–36" between rows': 18,
+    }
+
+    for text, inches in cases.items():
+        match = parse_in_row_spacing(text)
+        assert (match.inches, match.confidence) == (inches, HIGH), text
+
+
+def test_parse_in_row_spacing_takes_smaller_side_with_medium_confidence() -> None:
+    assert parse_in_row_spacing('3" x 12–18"') == SpacingMatch(3, MEDIUM, "by")
+    assert parse_in_row_spacing("24\" x 1'") == SpacingMatch(12, MEDIUM, "by")
+
+
+def test_parse_in_row_spacing_leaves_free_text_for_model() -> None:
+    squash = 'small, 18-24"; medium, 24-36"; large, 36-48"; between-row: 6\' (bush) or 12\' (vining)'
+
+    assert parse_in_row_spacing(squash) is None
+    assert parse_in_row_spacing("SDSC varieties: 4") is None
+    assert parse_in_row_spacing("six inches apart") is None
+    assert parse_in_row_spacing("thin to one plant per foot") is None
+
+
+def test_extract_spacings_with_rules_returns_residual_by_confidence() -> None:
+    texts = ['12–18"', '3" x 12–18"', "Space 6' between rows, 2–4' within them"]
+
+    lookup, residual = extract_spacings_with_rules(texts)
+    assert lookup == {'12–18"': 12, '3" x 12–18"': 3}
+    assert residual == ["Space 6' between rows, 2–4' within them"]
+
+    lookup, residual = extract_spacings_with_rules(texts, min_confidence=HIGH)
+    assert lookup == {'12–18"': 12}
+    assert residual == ['3" x 12–18"', "Space 6' between rows, 2–4' within them"]
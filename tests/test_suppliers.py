@@ -0,0 +1,66 @@
+from functools import partial
+from pathlib import Path
+
+import httpx
+import pandas as pd
+import pytest
+
+import scripts.scrape_plant_data as scrape_module
+import scripts.suppliers as suppliers
+import scripts.suppliers.base as base
+from scripts.io.http_client import AsyncFetcher
+from scripts.suppliers import get_supplier, register, scraped_columns, supplier_for_url
+from scripts.suppliers.base import Supplier, attribute_table_extractor, label_mapper
+
+SPEC_PAGE = """<html><body><table class="specs"><tr><th>Days to Maturity:</th><td>80</td></tr>
+<tr><th>Color</th><td>Red</td></tr></table></body></html>"""
+
+
+def test_registry_finds_suppliers_by_code_and_host() -> None:
+    assert get_supplier(" sdsc ").code == "SDSC"
+    assert supplier_for_url("https://www.johnnyseeds.com/vegetables/x-123.html").code == "JS"
+    assert supplier_for_url("https://seeds.test/x") is None
+    assert scraped_columns()[0] == "web_botanical_name"
+    with pytest.raises(ValueError):
+        register(get_supplier("SDSC"))
+
+
+def test_label_mapper_normalizes_each_label_once(monkeypatch) -> None:
+    calls = []
+    normalize = base.normalize_label
+    monkeypatch.setattr(base, "normalize_label", lambda label: calls.append(label) or normalize(label))
+    parse = label_mapper({"days_to_maturity": "web_days_to_maturity"})
+    fragment = {"attributes": [["Days to Maturity:", "80"], ["Color", "Red"]]}
+
+    assert parse(fragment) == {"web_days_to_maturity": "80"}
+    assert parse(fragment) == {"web_days_to_maturity": "80"}
+    assert calls.count("Days to Maturity:") == 1
+
+
+def test_new_plugin_scrapes_without_core_edits(tmp_path: Path, monkeypatch) -> None:
+    plugin = Supplier(
+        code="TEST",
+        name="Test Seeds",
+        hosts=("seeds.test",),
+        columns=("web_days_to_maturity",),
+        extract=attribute_table_extractor("specs"),
+        parse=label_mapper({"days_to_maturity": "web_days_to_maturity"}),
+    )
+    monkeypatch.setitem(suppliers.SUPPLIERS, "TEST", plugin)
+    monkeypatch.setitem(suppliers._HOSTS, "seeds.test", plugin)
+    monkeypatch.setattr(
+        scrape_module,
+        "AsyncFetcher",
+        partial(AsyncFetcher, transport=httpx.MockTransport(lambda request: httpx.Response(200, text=SPEC_PAGE))),
+    )
+    csv_path = tmp_path / "plants.csv"
+    pd.DataFrame({"variety": ["A"], "supplier": [None], "url": ["https://seeds.test/a/"]}).to_csv(
+        csv_path, index=False
+    )
+    output = tmp_path / "enriched.csv"
+
+    scrape_module.scrape_plant_data(csv_path, output, batch_delay=0)
+
+    df = pd.read_csv(output, keep_default_na=False)
+    assert df["web_days_to_maturity"].tolist() == [80]
+    assert df["web_final_spacing"].tolist() == ["N/A"]
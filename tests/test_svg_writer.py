@@ -0,0 +1,37 @@
+import io
+import xml.etree.ElementTree as ET
+
+from scripts.io.svg import SvgWriter, css_rule, fmt_num
+
+SVG = "{http://www.w3.org/2000/svg}"
+
+
+def test_fmt_num_drops_trailing_zero() -> None:
+    assert fmt_num(40.0) == "40"
+    assert fmt_num(18.8) == "18.8"
+    assert fmt_num(7.2000001) == "7.2"
+
+
+def test_css_rule() -> None:
+    assert css_rule(".s0", {"fill": "#FFF", "fill-opacity": 1}) == ".s0{fill:#FFF;fill-opacity:1}"
+
+
+def test_svg_writer_streams_symbols_and_uses() -> None:
+    handle = io.StringIO()
+    with SvgWriter(handle, 80, 40) as svg:
+        svg.style([css_rule(".s0", {"fill": "#FFF"})])
+        svg.start_defs()
+        svg.symbol_rect("cell", 40, 40, "s0")
+        svg.symbol_text("t0", ["Carrots", "Bolero"], 6, "tl")
+        svg.end_defs()
+        svg.use("cell", 0, 0)
+        svg.rect(40, 0, 40, 40, "s0")
+        svg.use("t0", 20, 20)
+        svg.text(60, 20, ["A & B"], 6, "tl")
+
+    root = ET.fromstring(handle.getvalue())
+    assert root.find(f"{SVG}style").text == ".s0{fill:#FFF}"
+    assert len(root.findall(f"{SVG}use")) == 2
+    symbol = root.find(f"{SVG}defs/{SVG}text")
+    assert [span.text for span in symbol] == ["Carrots", "Bolero"]
+    assert root.find(f"{SVG}text").text == "A & B"
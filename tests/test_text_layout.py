@@ -0,0 +1,103 @@
+from typing import Callable, Iterator
+
+import pytest
+from PIL import ImageFont
+
+from scripts.io import text_layout
+from scripts.io.text_layout import (
+    MEASURE_FONT_PX,
+    auto_crop_code,
+    compact_label,
+    fit_label,
+    font_face,
+    font_metrics,
+    load_font,
+    text_width,
+    wrap_label,
+    wrap_text,
+)
+
+FONT_CACHES = (font_face, load_font, text_width, fit_label, wrap_label)
+
+
+@pytest.fixture
+def installed_fonts(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[..., None]]:
+    """Make only the given font files loadable, whatever this machine has."""
+
+    bundled_truetype = ImageFont.truetype
+
+    def install(*files: str) -> None:
+        def truetype(file, size: int, **kwargs) -> ImageFont.FreeTypeFont:
+            if not isinstance(file, str):
+                # Pillow's own default font, loaded from memory.
+                return bundled_truetype(file, size, **kwargs)
+            if file not in files:
+                raise OSError(f"cannot open resource {file}")
+            return ImageFont.load_default(size=size)
+
+        monkeypatch.setattr(text_layout.ImageFont, "truetype", truetype)
+        for cached in FONT_CACHES:
+            cached.cache_clear()
+
+    yield install
+    for cached in FONT_CACHES:
+        cached.cache_clear()
+
+
+def test_font_face_prefers_metric_compatible_aliases(installed_fonts) -> None:
+    installed_fonts("LiberationSans-Regular.ttf", "DejaVuSans.ttf")
+    assert font_face("Helvetica") == ("LiberationSans-Regular.ttf", True)
+
+    installed_fonts("NimbusSans-Regular.otf", "DejaVuSans.ttf")
+    assert font_face("Helvetica") == ("NimbusSans-Regular.otf", True)
+
+    installed_fonts("DejaVuSans.ttf")
+    assert font_face("Helvetica") == ("DejaVuSans.ttf", False)
+
+
+def test_text_width_measures_faces_outside_the_table(installed_fonts) -> None:
+    installed_fonts("DejaVuSans.ttf")
+    drawn = load_font("Helvetica", MEASURE_FONT_PX).getlength("WWW")
+    assert text_width("WWW", "Helvetica", 10) == drawn * 10 / MEASURE_FONT_PX
+
+
+def test_text_width_uses_glyph_advances(installed_fonts) -> None:
+    installed_fonts("LiberationSans-Regular.ttf")
+    # Helvetica: "i" is 222 units, "W" is 944 units.
+    assert text_width("iii", "Helvetica", 10) == 6.66
+    assert text_width("WWW", "Helvetica", 10) == 28.32
+
+
+def test_font_metrics_resolves_css_family_lists() -> None:
+    assert font_metrics("'Unknown Sans', Arial, sans-serif") is font_metrics("Helvetica")
+    assert font_metrics("Courier New").text_width("abc", 10) == 18.0
+
+
+def test_fit_label_stays_within_width() -> None:
+    line = fit_label("Cauliflower Earlisnow", "Helvetica", 10, 50)
+    assert line.endswith("...")
+    assert text_width(line, "Helvetica", 10) <= 50
+    assert fit_label("Beets", "Helvetica", 10, 50) == "Beets"
+
+
+def test_wrap_label_marks_dropped_words() -> None:
+    lines = wrap_label("Sow thin carrots weekly after rain", "Helvetica", 10, 60, 2)
+    assert lines == ("Sow thin", "carrots...")
+    assert all(text_width(line, "Helvetica", 10) <= 60 for line in lines)
+
+
+def test_wrap_text_counts_characters_by_default() -> None:
+    assert wrap_text("Wild Arugula", 5, 2) == ["Wild", "Ar..."]
+
+
+def test_fit_label_is_memoized() -> None:
+    fit_label.cache_clear()
+    fit_label("Radishes", "Helvetica", 6, 36)
+    fit_label("Radishes", "Helvetica", 6, 36)
+    assert fit_label.cache_info().hits == 1
+
+
+def test_compact_label_prefers_curated_codes() -> None:
+    assert compact_label("Carrots", "Bolero F1", {"Carrots": "CARR"}) == "CARR.-BOL."
+    assert compact_label("Lettuce (Mixed)", "Allstar", {}) == "LETMI.-ALL."
+    assert auto_crop_code("Spinach") == "SPIN"
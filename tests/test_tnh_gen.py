@@ -0,0 +1,77 @@
+import asyncio
+import sys
+from pathlib import Path
+
+from scripts.extract_in_row_spacing import extract_spacings_with_ai
+from scripts.io.tnh_gen import PromptBatcher, chunk_items, run_batch
+
+# Answers batches by id but drops any item whose text contains "skip", and
+# logs every call so tests can count them.
+FAKE_TNH_GEN = f"""#!{sys.executable}
+import json, os, sys
+args = sys.argv[1:]
+prompt = args[args.index("--prompt") + 1]
+text = open(args[args.index("--input-file") + 1]).read()
+with open(os.environ["FAKE_TNH_LOG"], "a") as log:
+    log.write(prompt + "\\n")
+def answer(text):
+    digits = "".join(ch for ch in text if ch.isdigit())
+    return {{"in_row_spacing_inches": int(digits) if digits else None}}
+if prompt.endswith("_batch"):
+    result = {{item["id"]: answer(item["text"]) for item in json.loads(text) if "skip" not in item["text"]}}
+else:
+    result = answer(text)
+print(json.dumps({{"status": "succeeded", "result": {{"text": "```json\\n" + json.dumps(result) + "\\n```"}}}}))
+"""
+
+
+def _fake_tnh_gen(tmp_path: Path, monkeypatch) -> Path:
+    exe = tmp_path / "tnh-gen"
+    exe.write_text(FAKE_TNH_GEN)
+    exe.chmod(0o755)
+    log = tmp_path / "calls.log"
+    monkeypatch.setenv("TNH_GEN", str(exe))
+    monkeypatch.setenv("FAKE_TNH_LOG", str(log))
+    return log
+
+
+def test_chunk_items_limits_count_and_size() -> None:
+    items = {str(i): "x" * 10 for i in range(5)}
+    assert [list(chunk) for chunk in chunk_items(items, 2, 100)] == [["0", "1"], ["2", "3"], ["4"]]
+    assert [len(chunk) for chunk in chunk_items(items, 10, 25)] == [2, 2, 1]
+
+
+def test_run_batch_maps_by_id_and_falls_back_for_dropped_items(tmp_path: Path, monkeypatch) -> None:
+    log = _fake_tnh_gen(tmp_path, monkeypatch)
+
+    results = run_batch("extract_in_row_spacing", {"a": '12" apart', "b": 'skip 6"', "c": "none"})
+
+    assert results == {
+        "a": {"in_row_spacing_inches": 12},
+        "b": {"in_row_spacing_inches": 6},
+        "c": {"in_row_spacing_inches": None},
+    }
+    assert log.read_text().split() == ["extract_in_row_spacing_batch", "extract_in_row_spacing"]
+
+
+def test_extract_spacings_with_ai_batches_unique_texts(tmp_path: Path, monkeypatch) -> None:
+    log = _fake_tnh_gen(tmp_path, monkeypatch)
+
+    lookup = extract_spacings_with_ai([f'{n}" apart' for n in range(1, 6)], batch_size=2)
+
+    assert lookup['3" apart'] == 3
+    assert len(lookup) == 5
+    assert log.read_text().split() == ["extract_in_row_spacing_batch"] * 2 + ["extract_in_row_spacing"]
+
+
+def test_prompt_batcher_groups_concurrent_submissions(tmp_path: Path, monkeypatch) -> None:
+    log = _fake_tnh_gen(tmp_path, monkeypatch)
+
+    async def run() -> list:
+        batcher = PromptBatcher("extract_in_row_spacing", batch_size=3, linger=0.05)
+        return await asyncio.gather(*(batcher.submit(str(i), f'{i}"') for i in range(1, 5)))
+
+    results = asyncio.run(run())
+
+    assert [result["in_row_spacing_inches"] for result in results] == [1, 2, 3, 4]
+    assert log.read_text().split() == ["extract_in_row_spacing_batch", "extract_in_row_spacing"]
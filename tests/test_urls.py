@@ -0,0 +1,18 @@
+from scripts.io.urls import canonical_url, is_http_url, product_url
+
+
+def test_canonical_url_drops_noise_and_sorts_query() -> None:
+    url = "HTTPS://Seeds.Test:443//vegetables//kale/?sz=24&utm_source=mail&start=0#top"
+
+    assert canonical_url(url) == "https://seeds.test/vegetables/kale/?start=0&sz=24"
+    assert canonical_url("http://seeds.test:8080/a") == "http://seeds.test:8080/a"
+
+
+def test_product_url_drops_variant_query() -> None:
+    assert product_url("https://seeds.test/p/kale-2815G.html?dwvar_size=A") == "https://seeds.test/p/kale-2815G.html"
+
+
+def test_is_http_url_rejects_descriptions() -> None:
+    assert is_http_url("https://seeds.test/p/")
+    assert not is_http_url("string - product URL")
+    assert not is_http_url(float("nan"))